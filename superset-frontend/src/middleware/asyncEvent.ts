@@ -28,6 +28,7 @@ import {
   SupersetError,
 } from '@superset-ui/core';
 import getBootstrapData from 'src/utils/getBootstrapData';
+import { ensureAppRoot } from 'src/utils/pathUtils';
 
 type AsyncEvent = {
   id?: string | null;
@@ -48,6 +49,7 @@ type ListenerFn = (asyncEvent: AsyncEvent) => Promise<any>;
 
 const TRANSPORT_POLLING = 'polling';
 const TRANSPORT_WS = 'ws';
+const TRANSPORT_SSE = 'sse';
 const JOB_STATUS = {
   PENDING: 'pending',
   RUNNING: 'running',
@@ -56,6 +58,7 @@ const JOB_STATUS = {
 };
 const LOCALSTORAGE_KEY = 'last_async_event_id';
 const POLLING_URL = '/api/v1/async_event/';
+const SSE_URL = '/api/v1/async_event/stream';
 const MAX_RETRIES = 6;
 const RETRY_DELAY = 100;
 
@@ -227,9 +230,35 @@ const wsConnect = (): void => {
   });
 };
 
+let eventSource: EventSource;
+
+const sseConnect = (): void => {
+  let url = ensureAppRoot(SSE_URL);
+  if (lastReceivedEventId) url += `?last_id=${lastReceivedEventId}`;
+  // the browser reconnects when the stream ends, with the Last-Event-ID header
+  eventSource = new EventSource(url);
+
+  eventSource.addEventListener('error', () => {
+    if (eventSource.readyState === EventSource.CLOSED) {
+      logging.warn('Event stream not available, falling back to async polling');
+      transport = TRANSPORT_POLLING;
+      loadEventsFromApi();
+    }
+  });
+
+  eventSource.addEventListener('message', async event => {
+    try {
+      await processEvents([JSON.parse(event.data)]);
+    } catch (err) {
+      logging.warn(err);
+    }
+  });
+};
+
 export const init = (appConfig?: AppConfig) => {
   if (!isFeatureEnabled(FeatureFlag.GlobalAsyncQueries)) return;
   if (pollingTimeoutId) clearTimeout(pollingTimeoutId);
+  if (eventSource) eventSource.close();
 
   listenersByJobId = {};
   retriesByJobId = {};
@@ -251,6 +280,9 @@ export const init = (appConfig?: AppConfig) => {
   if (transport === TRANSPORT_WS) {
     wsConnect();
   }
+  if (transport === TRANSPORT_SSE) {
+    sseConnect();
+  }
 };
 
 init();
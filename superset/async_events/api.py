@@ -22,7 +22,7 @@ from flask_appbuilder.api import safe
 from flask_appbuilder.security.decorators import permission_name, protect
 
 from superset.async_events.async_query_manager import AsyncQueryTokenException
-from superset.extensions import async_query_manager, event_logger
+from superset.extensions import async_query_manager, db, event_logger
 from superset.views.base_api import BaseSupersetApi, statsd_metrics
 
 logger = logging.getLogger(__name__)
@@ -99,3 +99,58 @@ class AsyncEventsRestApi(BaseSupersetApi):
             return self.response_401()
 
         return self.response(200, result=events)
+
+    @expose("/stream", methods=("GET",))
+    @event_logger.log_this
+    @protect()
+    @safe
+    @statsd_metrics
+    @permission_name("list")
+    def stream(self) -> Response:
+        """
+        Stream the Redis async events of the user's channel as Server-Sent Events.
+        ---
+        get:
+          summary: Stream the Redis events stream
+          description: >-
+            Streams the events added to the Redis events stream as Server-Sent
+            Events, using the user's JWT token and the ID of the last event
+            received, from the `Last-Event-ID` header or the `last_id` query param.
+            The stream is closed after `GLOBAL_ASYNC_QUERIES_SSE_CONNECTION_TIMEOUT`
+            seconds, and the client is expected to reconnect.
+          parameters:
+          - in: query
+            name: last_id
+            description: Last ID received by the client
+            schema:
+                type: string
+          responses:
+            200:
+              description: Async events, each with the `id` and the `data` of an
+                event returned by `GET /api/v1/async_event/`
+              content:
+                text/event-stream:
+                  schema:
+                    type: string
+            401:
+              $ref: '#/components/responses/401'
+            500:
+              $ref: '#/components/responses/500'
+        """
+        try:
+            async_channel_id = async_query_manager.parse_channel_id_from_request(
+                request
+            )
+        except AsyncQueryTokenException:
+            return self.response_401()
+
+        last_event_id = request.headers.get("Last-Event-ID") or request.args.get(
+            "last_id"
+        )
+        # don't hold a database connection while the stream is open
+        db.session.close()
+        return Response(
+            async_query_manager.stream_events(async_channel_id, last_event_id),
+            mimetype="text/event-stream",
+            headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+        )
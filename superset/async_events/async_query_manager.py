@@ -17,8 +17,10 @@
 from __future__ import annotations
 
 import logging
+import time
 import uuid
-from typing import Any, Literal, Optional
+from collections.abc import Iterator
+from typing import Any, cast, Literal, Optional
 
 import jwt
 from flask import Flask, Request, request, Response, session
@@ -112,6 +114,10 @@ class AsyncQueryManager:
         self._jwt_cookie_domain: Optional[str]
         self._jwt_cookie_samesite: Optional[Literal["None", "Lax", "Strict"]] = None
         self._jwt_secret: str
+        self._firehose_enabled = True
+        self._sse_heartbeat_interval = 15
+        self._sse_connection_timeout = 300
+        self._job_coalescing_timeout = 0
         self._load_chart_data_into_cache_job: Any = None
         # pylint: disable=invalid-name
         self._load_explore_json_into_cache_job: Any = None
@@ -147,6 +153,17 @@ class AsyncQueryManager:
         ]
         self._jwt_cookie_domain = app.config["GLOBAL_ASYNC_QUERIES_JWT_COOKIE_DOMAIN"]
         self._jwt_secret = app.config["GLOBAL_ASYNC_QUERIES_JWT_SECRET"]
+        # the firehose stream is only read by the websocket server
+        self._firehose_enabled = app.config["GLOBAL_ASYNC_QUERIES_TRANSPORT"] == "ws"
+        self._sse_heartbeat_interval = app.config[
+            "GLOBAL_ASYNC_QUERIES_SSE_HEARTBEAT_INTERVAL"
+        ]
+        self._sse_connection_timeout = app.config[
+            "GLOBAL_ASYNC_QUERIES_SSE_CONNECTION_TIMEOUT"
+        ]
+        self._job_coalescing_timeout = app.config[
+            "GLOBAL_ASYNC_QUERIES_JOB_COALESCING_TIMEOUT"
+        ]
 
         if app.config["GLOBAL_ASYNC_QUERIES_REGISTER_REQUEST_HANDLERS"]:
             self.register_request_handlers(app)
@@ -240,7 +257,19 @@ class AsyncQueryManager:
         channel_id: str,
         form_data: dict[str, Any],
         user_id: Optional[int] = None,
+        cache_key: Optional[str] = None,
     ) -> dict[str, Any]:
+        """
+        Submit a job to load chart data into the cache.
+
+        :param channel_id: The channel notified when the job completes
+        :param form_data: The chart data request
+        :param user_id: The user running the job
+        :param cache_key: A key identifying the data loaded by the job for the user,
+            when set the job is shared with the identical requests submitted while
+            it's running
+        :returns: The metadata of the job
+        """
         # pylint: disable=import-outside-toplevel
         from superset import security_manager
 
@@ -249,26 +278,65 @@ class AsyncQueryManager:
         # this way we can keep the cache key consistent between sync and async command
         # so that it can be looked up consistently
         job_metadata = self.init_job(channel_id, user_id)
-        self._load_chart_data_into_cache_job.delay(
+        task_metadata = (
             {**job_metadata, "guest_token": guest_user.guest_token}
             if (guest_user := security_manager.get_current_guest_user_if_guest())
-            else job_metadata,
-            form_data,
+            else job_metadata
         )
+        if cache_key and self._job_coalescing_timeout:
+            if self.join_running_job(cache_key, job_metadata):
+                return job_metadata
+            self._load_chart_data_into_cache_job.delay(
+                task_metadata, form_data, coalesce_key=cache_key
+            )
+        else:
+            self._load_chart_data_into_cache_job.delay(task_metadata, form_data)
         return job_metadata
 
-    def read_events(
-        self, channel: str, last_id: Optional[str]
-    ) -> list[Optional[dict[str, Any]]]:
-        if not self._cache:
-            raise CacheBackendNotInitialized("Cache backend not initialized")
-
-        stream_name = f"{self._stream_prefix}{channel}"
-        start_id = increment_id(last_id) if last_id else "-"
-        results = self._cache.xrange(stream_name, start_id, "+", self.MAX_EVENT_COUNT)
+    def join_running_job(self, cache_key: str, job_metadata: dict[str, Any]) -> bool:
+        """
+        Subscribe a job to the completion of an identical job that is running.
+
+        :param cache_key: The key identifying the data loaded by the jobs
+        :param job_metadata: The metadata of the job
+        :returns: `True` if the job was subscribed to a running job, `False` if it
+            must run, in which case identical jobs subscribe to it until
+            `update_coalesced_jobs` is called
+        """
+        cache = cast(RedisCacheBackend, self._cache)
+        running_key = f"{self._stream_prefix}running-{cache_key}"
+        subscribers_key = f"{self._stream_prefix}subscribers-{cache_key}"
+        if cache.add(running_key, job_metadata["job_id"], self._job_coalescing_timeout):
+            return False
+
+        subscriber = json.dumps(job_metadata)
+        cache.rpush(subscribers_key, subscriber, self._job_coalescing_timeout)
+        # the running job may have completed in the meantime, in which case it
+        # notified the subscriber, unless it's still in the list
+        if not cache.has(running_key) and cache.lrem(subscribers_key, subscriber):
+            return False
+
+        logger.debug("Job %s joined a running job", job_metadata["job_id"])
+        return True
+
+    def update_coalesced_jobs(self, cache_key: str, status: str, **kwargs: Any) -> None:
+        """
+        Notify the jobs that joined a running job of its completion.
+
+        :param cache_key: The key identifying the data loaded by the jobs
+        :param status: The status of the running job
+        """
+        cache = cast(RedisCacheBackend, self._cache)
+        cache.delete(f"{self._stream_prefix}running-{cache_key}")
+        for subscriber in cache.pop_all(
+            f"{self._stream_prefix}subscribers-{cache_key}"
+        ):
+            self.update_job(json.loads(subscriber), status, **kwargs)
+
+    def decode_events(self, results: list[Any]) -> list[dict[str, Any]]:
         # Decode bytes to strings, decode_responses is not supported at RedisCache and RedisSentinelCache  # noqa: E501
         if isinstance(self._cache, (RedisSentinelCacheBackend, RedisCacheBackend)):
-            decoded_results = [
+            results = [
                 (
                     event_id.decode("utf-8"),
                     {
@@ -278,10 +346,53 @@ class AsyncQueryManager:
                 )
                 for event_id, event_data in results
             ]
-            return (
-                [] if not decoded_results else list(map(parse_event, decoded_results))
+        return [parse_event(result) for result in results]
+
+    def read_events(
+        self, channel: str, last_id: Optional[str]
+    ) -> list[Optional[dict[str, Any]]]:
+        if not self._cache:
+            raise CacheBackendNotInitialized("Cache backend not initialized")
+
+        stream_name = f"{self._stream_prefix}{channel}"
+        start_id = increment_id(last_id) if last_id else "-"
+        results = self._cache.xrange(stream_name, start_id, "+", self.MAX_EVENT_COUNT)
+        return list(self.decode_events(results))
+
+    def stream_events(self, channel: str, last_id: Optional[str]) -> Iterator[str]:
+        """
+        Stream the events of a channel as Server-Sent Events.
+
+        Blocks on the Redis stream of the channel until events are added to it, and
+        writes the events read at once in a single chunk. A comment is written when
+        no event is added during the heartbeat interval, so that proxies keep the
+        connection open, and the stream ends after the connection timeout, when the
+        client reconnects with the ID of the last event it received.
+
+        :param channel: The channel of the events
+        :param last_id: The ID of the last event received by the client
+        :returns: A generator of Server-Sent Events chunks
+        """
+        if not self._cache:
+            raise CacheBackendNotInitialized("Cache backend not initialized")
+
+        cache = cast(RedisCacheBackend, self._cache)
+        stream_name = f"{self._stream_prefix}{channel}"
+        last_id = last_id or "0"
+        deadline = time.monotonic() + self._sse_connection_timeout
+
+        while (remaining := deadline - time.monotonic()) > 0:
+            block = max(int(min(remaining, self._sse_heartbeat_interval) * 1000), 1)
+            results = cache.xread({stream_name: last_id}, self.MAX_EVENT_COUNT, block)
+            if not results:
+                yield ": heartbeat\n\n"
+                continue
+
+            events = self.decode_events(results[0][1])
+            last_id = events[-1]["id"]
+            yield "".join(
+                f"id: {event['id']}\ndata: {json.dumps(event)}\n\n" for event in events
             )
-        return [] if not results else list(map(parse_event, results))
 
     def update_job(
         self, job_metadata: dict[str, Any], status: str, **kwargs: Any
@@ -305,4 +416,7 @@ class AsyncQueryManager:
         logger.debug(event_data)
 
         self._cache.xadd(scoped_stream_name, event_data, "*", self._stream_limit)
-        self._cache.xadd(full_stream_name, event_data, "*", self._stream_limit_firehose)
+        if self._firehose_enabled:
+            self._cache.xadd(
+                full_stream_name, event_data, "*", self._stream_limit_firehose
+            )
@@ -80,6 +80,32 @@ class RedisCacheBackend(RedisCache):
         count = count or self.MAX_EVENT_COUNT
         return self._cache.xrange(stream_name, start, end, count)
 
+    def xread(
+        self,
+        streams: Dict[str, str],
+        count: Optional[int] = None,
+        block: Optional[int] = None,
+    ) -> List[Any]:
+        count = count or self.MAX_EVENT_COUNT
+        return self._cache.xread(streams, count, block)
+
+    def rpush(self, name: str, value: str, timeout: int) -> int:
+        with self._cache.pipeline() as pipeline:
+            pipeline.rpush(name, value)
+            pipeline.expire(name, timeout)
+            length, _ = pipeline.execute()
+        return length
+
+    def lrem(self, name: str, value: str) -> int:
+        return self._cache.lrem(name, 0, value)
+
+    def pop_all(self, name: str) -> List[Any]:
+        with self._cache.pipeline() as pipeline:
+            pipeline.lrange(name, 0, -1)
+            pipeline.delete(name)
+            values, _ = pipeline.execute()
+        return values
+
     @classmethod
     def from_config(cls, config: Dict[str, Any]) -> "RedisCacheBackend":
         kwargs = {
@@ -196,6 +222,32 @@ class RedisSentinelCacheBackend(RedisSentinelCache):
         count = count or self.MAX_EVENT_COUNT
         return self._cache.xrange(stream_name, start, end, count)
 
+    def xread(
+        self,
+        streams: Dict[str, str],
+        count: Optional[int] = None,
+        block: Optional[int] = None,
+    ) -> List[Any]:
+        count = count or self.MAX_EVENT_COUNT
+        return self._cache.xread(streams, count, block)
+
+    def rpush(self, name: str, value: str, timeout: int) -> int:
+        with self._cache.pipeline() as pipeline:
+            pipeline.rpush(name, value)
+            pipeline.expire(name, timeout)
+            length, _ = pipeline.execute()
+        return length
+
+    def lrem(self, name: str, value: str) -> int:
+        return self._cache.lrem(name, 0, value)
+
+    def pop_all(self, name: str) -> List[Any]:
+        with self._cache.pipeline() as pipeline:
+            pipeline.lrange(name, 0, -1)
+            pipeline.delete(name)
+            values, _ = pipeline.execute()
+        return values
+
     @classmethod
     def from_config(cls, config: Dict[str, Any]) -> "RedisSentinelCacheBackend":
         kwargs = {
@@ -18,6 +18,7 @@ from __future__ import annotations
 
 import contextlib
 import logging
+from collections.abc import Iterator
 from datetime import datetime
 from typing import Any, Callable, TYPE_CHECKING
 
@@ -57,7 +58,13 @@ from superset.utils.core import (
     get_user_id,
 )
 from superset.utils.decorators import logs_context
-from superset.views.base import CsvResponse, generate_download_headers, XlsxResponse
+from superset.views.base import (
+    ArrowResponse,
+    CsvResponse,
+    generate_download_headers,
+    ParquetResponse,
+    XlsxResponse,
+)
 from superset.views.base_api import statsd_metrics
 
 if TYPE_CHECKING:
@@ -370,7 +377,13 @@ class ChartDataRestApi(ChartRestApi):
         except AsyncQueryTokenException:
             return self.response_401()
 
-        result = async_command.run(form_data, get_user_id())
+        # identical requests of users with the same RLS filters share a job
+        try:
+            cache_key: str | None = command.get_data_cache_key()
+        except QueryObjectValidationError:
+            cache_key = None
+
+        result = async_command.run(form_data, get_user_id(), cache_key=cache_key)
         return self.response(202, **result)
 
     def _send_chart_response(  # noqa: C901
@@ -411,6 +424,14 @@ class ChartDataRestApi(ChartRestApi):
                 data = result["queries"][0]["data"]
                 if is_csv_format:
                     return CsvResponse(data, headers=generate_download_headers("csv"))
+                if result_format == ChartDataResultFormat.PARQUET:
+                    return ParquetResponse(
+                        data, headers=generate_download_headers("parquet")
+                    )
+                if result_format == ChartDataResultFormat.ARROW:
+                    return ArrowResponse(
+                        data, headers=generate_download_headers("arrow")
+                    )
 
                 return XlsxResponse(data, headers=generate_download_headers("xlsx"))
 
@@ -436,6 +457,8 @@ class ChartDataRestApi(ChartRestApi):
             if security_manager.is_guest_user():
                 for query in queries:
                     query.pop("query", None)
+            if self._should_use_streaming(result, form_data):
+                return self._create_streaming_json_response(queries)
             with event_logger.log_context(f"{self.__class__.__name__}.json_dumps"):
                 response_data = json.dumps(
                     {"result": queries},
@@ -554,13 +577,22 @@ class ChartDataRestApi(ChartRestApi):
         query_context = result["query_context"]
         result_format = query_context.result_format
 
-        # Only support CSV streaming currently
-        if result_format.lower() != "csv":
-            return False
-
         # Get streaming threshold from config
         threshold = app.config.get("CSV_STREAMING_ROW_THRESHOLD", 100000)
 
+        # JSON results are already loaded, so count the rows that will be serialized
+        if result_format.lower() == "json":
+            row_count = sum(
+                len(query["data"])
+                for query in result.get("queries", [])
+                if isinstance(query.get("data"), list)
+            )
+            return row_count >= threshold
+
+        # Only support CSV and JSON streaming currently
+        if result_format.lower() != "csv":
+            return False
+
         # Extract actual row count (same logic as frontend)
         actual_row_count: int | None = None
         viz_type = form_data.get("viz_type") if form_data else None
@@ -642,3 +674,79 @@ class ChartDataRestApi(ChartRestApi):
         response.implicit_sequence_conversion = False
 
         return response
+
+    def _create_streaming_json_response(
+        self, queries: list[dict[str, Any]]
+    ) -> Response:
+        """
+        Create a streaming JSON response for large datasets.
+
+        The response has the same content as the regular one, but the rows are
+        serialized in batches, so that the whole payload is never held in memory as
+        a single string.
+        """
+        chunk_size = app.config.get("JSON_STREAMING_CHUNK_SIZE", 5000)
+        logger.info("Creating streaming JSON response")
+
+        response = Response(
+            generate_json_result_chunks(queries, chunk_size),
+            mimetype="application/json",
+            headers={
+                "Cache-Control": "no-cache",
+                "X-Accel-Buffering": "no",  # Disable nginx buffering
+            },
+            direct_passthrough=False,  # Flask must iterate generator
+        )
+        response.headers["Content-Type"] = "application/json; charset=utf-8"
+
+        # Force chunked transfer encoding
+        response.implicit_sequence_conversion = False
+
+        return response
+
+
+def generate_json_result_chunks(
+    queries: list[dict[str, Any]],
+    chunk_size: int,
+) -> Iterator[str]:
+    """
+    Serialize chart data query results as ``{"result": [...]}``, one chunk at a time.
+
+    The keys of each query are written one at a time, and its rows in batches of
+    ``chunk_size``. Concatenating the chunks yields the same document as
+    serializing the whole payload at once.
+
+    :param queries: the query results, as returned by the chart data command
+    :param chunk_size: the number of rows serialized per chunk
+    :returns: a generator of JSON fragments
+    """
+
+    def dumps(obj: Any) -> str:
+        return json.dumps(obj, default=json.json_int_dttm_ser, ignore_nan=True)
+
+    yield '{"result": ['
+    for idx, query in enumerate(queries):
+        if idx:
+            yield ", "
+
+        data = query.get("data")
+        if not isinstance(data, list):
+            yield dumps(query)
+            continue
+
+        # serialize the query key by key, to keep the order of the keys
+        yield "{"
+        for key_idx, (key, value) in enumerate(query.items()):
+            yield f"{', ' if key_idx else ''}{dumps(key)}: "
+            if key != "data":
+                yield dumps(value)
+                continue
+
+            yield "["
+            for start in range(0, len(data), chunk_size):
+                if start:
+                    yield ", "
+                yield dumps(data[start : start + chunk_size])[1:-1]
+            yield "]"
+        yield "}"
+    yield "]}"
@@ -1488,6 +1488,13 @@ class ChartDataResponseResult(Schema):
         required=True,
         allow_none=None,
     )
+    is_stale = fields.Boolean(
+        metadata={
+            "description": "Is the result cached past its cache timeout, while "
+            "it's refreshed in the background"
+        },
+        allow_none=True,
+    )
     query = fields.String(
         metadata={
             "description": "The executed query statement. May be absent when "
@@ -32,7 +32,12 @@ class CreateAsyncChartDataJobCommand:
             request
         )
 
-    def run(self, form_data: dict[str, Any], user_id: Optional[int]) -> dict[str, Any]:
+    def run(
+        self,
+        form_data: dict[str, Any],
+        user_id: Optional[int],
+        cache_key: Optional[str] = None,
+    ) -> dict[str, Any]:
         return async_query_manager.submit_chart_data_job(
-            self._async_channel_id, form_data, user_id
+            self._async_channel_id, form_data, user_id, cache_key=cache_key
         )
@@ -69,5 +69,8 @@ class ChartDataCommand(BaseCommand):
 
         return return_value
 
+    def get_data_cache_key(self) -> str:
+        return self._query_context.data_cache_key()
+
     def validate(self) -> None:
         self._query_context.raise_for_access()
@@ -29,6 +29,8 @@ from superset.commands.database.exceptions import (
 )
 from superset.connectors.sqla.models import SqlaTable
 from superset.daos.database import DatabaseDAO
+from superset.databases import metadata_catalog
+from superset.databases.metadata_catalog import MetadataKind
 from superset.exceptions import SupersetException
 from superset.extensions import db, security_manager
 from superset.models.core import Database
@@ -56,42 +58,38 @@ class TablesDatabaseCommand(BaseCommand):
         self.validate()
         self._catalog_name = self._catalog_name or self._model.get_default_catalog()
         try:
+            catalog_info: dict[str, Any] = {}
+            if metadata_catalog.is_enabled(self._model):
+                entry = metadata_catalog.get_metadata(
+                    self._model,
+                    MetadataKind.TABLES,
+                    catalog=self._catalog_name,
+                    schema=self._schema_name,
+                    force=self._force,
+                )
+                table_names = self._get_datasource_names(entry.value["tables"])
+                view_names = self._get_datasource_names(entry.value["views"])
+                materialized_view_names = self._get_datasource_names(
+                    entry.value["materialized_views"]
+                )
+                catalog_info["last_refreshed"] = entry.refreshed_at.isoformat()
+            else:
+                table_names = self._get_table_names()
+                view_names = self._get_view_names()
+                materialized_view_names = self._get_materialized_view_names()
+
             tables = security_manager.get_datasources_accessible_by_user(
                 database=self._model,
                 catalog=self._catalog_name,
                 schema=self._schema_name,
-                datasource_names=sorted(
-                    # get_all_table_names_in_schema may return raw (unserialized) cached
-                    # results, so we wrap them as DatasourceName objects here instead of
-                    # directly in the method to ensure consistency.
-                    DatasourceName(*datasource_name)
-                    for datasource_name in self._model.get_all_table_names_in_schema(
-                        catalog=self._catalog_name,
-                        schema=self._schema_name,
-                        force=self._force,
-                        cache=self._model.table_cache_enabled,
-                        cache_timeout=self._model.table_cache_timeout,
-                    )
-                ),
+                datasource_names=table_names,
             )
 
             views = security_manager.get_datasources_accessible_by_user(
                 database=self._model,
                 catalog=self._catalog_name,
                 schema=self._schema_name,
-                datasource_names=sorted(
-                    # get_all_view_names_in_schema may return raw (unserialized) cached
-                    # results, so we wrap them as DatasourceName objects here instead of
-                    # directly in the method to ensure consistency.
-                    DatasourceName(*datasource_name)
-                    for datasource_name in self._model.get_all_view_names_in_schema(
-                        catalog=self._catalog_name,
-                        schema=self._schema_name,
-                        force=self._force,
-                        cache=self._model.table_cache_enabled,
-                        cache_timeout=self._model.table_cache_timeout,
-                    )
-                ),
+                datasource_names=view_names,
             )
 
             # Get materialized views if the database supports them
@@ -99,18 +97,7 @@ class TablesDatabaseCommand(BaseCommand):
                 database=self._model,
                 catalog=self._catalog_name,
                 schema=self._schema_name,
-                datasource_names=sorted(
-                    DatasourceName(table.table, table.schema, table.catalog)
-                    for table in (
-                        self._model.get_all_materialized_view_names_in_schema(
-                            catalog=self._catalog_name,
-                            schema=self._schema_name,
-                            force=self._force,
-                            cache=self._model.table_cache_enabled,
-                            cache_timeout=self._model.table_cache_timeout,
-                        )
-                    )
-                ),
+                datasource_names=materialized_view_names,
             )
 
             extra_dict_by_name = {
@@ -164,6 +151,7 @@ class TablesDatabaseCommand(BaseCommand):
             payload = {
                 "count": len(tables) + len(views) + len(materialized_views),
                 "result": options,
+                **catalog_info,
             }
             return payload
         except SupersetException:
@@ -171,6 +159,54 @@ class TablesDatabaseCommand(BaseCommand):
         except Exception as ex:
             raise DatabaseTablesUnexpectedError(str(ex)) from ex
 
+    def _get_datasource_names(self, names: list[str]) -> list[DatasourceName]:
+        return sorted(
+            DatasourceName(name, self._schema_name, self._catalog_name)
+            for name in names
+        )
+
+    def _get_table_names(self) -> list[DatasourceName]:
+        return sorted(
+            # get_all_table_names_in_schema may return raw (unserialized) cached
+            # results, so we wrap them as DatasourceName objects here instead of
+            # directly in the method to ensure consistency.
+            DatasourceName(*datasource_name)
+            for datasource_name in self._model.get_all_table_names_in_schema(
+                catalog=self._catalog_name,
+                schema=self._schema_name,
+                force=self._force,
+                cache=self._model.table_cache_enabled,
+                cache_timeout=self._model.table_cache_timeout,
+            )
+        )
+
+    def _get_view_names(self) -> list[DatasourceName]:
+        return sorted(
+            # get_all_view_names_in_schema may return raw (unserialized) cached
+            # results, so we wrap them as DatasourceName objects here instead of
+            # directly in the method to ensure consistency.
+            DatasourceName(*datasource_name)
+            for datasource_name in self._model.get_all_view_names_in_schema(
+                catalog=self._catalog_name,
+                schema=self._schema_name,
+                force=self._force,
+                cache=self._model.table_cache_enabled,
+                cache_timeout=self._model.table_cache_timeout,
+            )
+        )
+
+    def _get_materialized_view_names(self) -> list[DatasourceName]:
+        return sorted(
+            DatasourceName(table.table, table.schema, table.catalog)
+            for table in self._model.get_all_materialized_view_names_in_schema(
+                catalog=self._catalog_name,
+                schema=self._schema_name,
+                force=self._force,
+                cache=self._model.table_cache_enabled,
+                cache_timeout=self._model.table_cache_timeout,
+            )
+        )
+
     def validate(self) -> None:
         self._model = cast(Database, DatabaseDAO.find_by_id(self._db_id))
         if not self._model:
@@ -15,23 +15,34 @@
 # specific language governing permissions and limitations
 # under the License.
 import logging
+from collections import defaultdict
 from functools import partial
 from typing import Optional
 
 from flask import current_app
 from flask_appbuilder.models.sqla import Model
+from sqlalchemy import or_
+from sqlalchemy.orm import selectinload
 
-from superset import security_manager
+from superset import db, security_manager
 from superset.commands.base import BaseCommand
+from superset.commands.database.exceptions import DatabaseNotFoundError
 from superset.commands.dataset.exceptions import (
     DatasetForbiddenError,
     DatasetNotFoundError,
     DatasetRefreshFailedError,
 )
 from superset.connectors.sqla.models import SqlaTable
+from superset.connectors.sqla.utils import convert_physical_columns
+from superset.daos.database import DatabaseDAO
 from superset.daos.dataset import DatasetDAO
 from superset.datasets.datetime_format_detector import DatetimeFormatDetector
+from superset.db_engine_specs.base import MetricType
 from superset.exceptions import SupersetSecurityException
+from superset.models.core import Database
+from superset.sql.parse import Table
+from superset.superset_typing import ResultSetColumnType
+from superset.utils.concurrency import execute_concurrently
 from superset.utils.decorators import on_error, transaction
 
 logger = logging.getLogger(__name__)
@@ -75,3 +86,167 @@ class RefreshDatasetCommand(BaseCommand):
             security_manager.raise_for_ownership(self._model)
         except SupersetSecurityException as ex:
             raise DatasetForbiddenError() from ex
+
+
+def reflect_schema(
+    database_id: int,
+    catalog: Optional[str],
+    schema: Optional[str],
+    table_names: list[str],
+) -> tuple[dict[str, list[ResultSetColumnType]], dict[str, list[MetricType]]]:
+    """
+    Reflect the columns and default metrics of tables of a schema with a single
+    inspector.
+
+    This may run in a worker thread, so the database is loaded in the session of the
+    thread.
+
+    :returns: the columns and the metrics, by table name; missing tables are left out
+    :raises DatabaseNotFoundError: if the database doesn't exist
+    """
+    database = DatabaseDAO.find_by_id(database_id, skip_base_filter=True)
+    if not database:
+        raise DatabaseNotFoundError()
+
+    db_engine_spec = database.db_engine_spec
+    with database.get_inspector(catalog=catalog, schema=schema) as inspector:
+        columns = db_engine_spec.get_multi_columns(
+            inspector,
+            table_names,
+            schema=schema,
+            catalog=catalog,
+            options=database.schema_options,
+        )
+        metrics = {
+            table_name: db_engine_spec.get_metrics(
+                database,
+                inspector,
+                Table(table_name, schema, catalog),
+            )
+            for table_name in columns
+        }
+    return columns, metrics
+
+
+def _try_reflect_schema(
+    database_id: int,
+    catalog: Optional[str],
+    schema: Optional[str],
+    table_names: list[str],
+) -> Optional[tuple[dict[str, list[ResultSetColumnType]], dict[str, list[MetricType]]]]:
+    """
+    Reflect the tables of a schema, see ``reflect_schema``, returning ``None`` if it
+    fails so the other schemas are still refreshed.
+    """
+    try:
+        return reflect_schema(database_id, catalog, schema, table_names)
+    except Exception:  # pylint: disable=broad-except
+        logger.exception("Failed to reflect schema %s", (catalog, schema))
+        return None
+
+
+class BulkRefreshDatasetsCommand(BaseCommand):
+    """
+    Refresh the columns of all the physical datasets of a database.
+
+    The tables of each schema are reflected with a single inspector, and up to
+    ``DATASET_BULK_REFRESH_MAX_WORKERS`` schemas are reflected in parallel. The
+    datasets are then merged in the current session, and flushed in batches of
+    ``DATASET_BULK_REFRESH_BATCH_SIZE``.
+    """
+
+    def __init__(
+        self,
+        database_id: int,
+        catalog: Optional[str] = None,
+        schemas: Optional[list[str]] = None,
+    ):
+        self._database_id = database_id
+        self._catalog = catalog
+        self._schemas = schemas
+        self._database: Optional[Database] = None
+        self._datasets: list[SqlaTable] = []
+        self._forbidden: list[SqlaTable] = []
+
+    @transaction(on_error=partial(on_error, reraise=DatasetRefreshFailedError))
+    def run(self) -> dict[str, list[int]]:
+        self.validate()
+        assert self._database
+
+        datasets_by_schema: dict[
+            tuple[Optional[str], Optional[str]], list[SqlaTable]
+        ] = defaultdict(list)
+        for dataset in self._datasets:
+            datasets_by_schema[(dataset.catalog, dataset.schema or None)].append(
+                dataset
+            )
+
+        batch_size = current_app.config["DATASET_BULK_REFRESH_BATCH_SIZE"]
+        refreshed: list[int] = []
+        failed = [dataset.id for dataset in self._forbidden]
+        schemas = list(datasets_by_schema.items())
+        results = execute_concurrently(
+            [
+                partial(
+                    _try_reflect_schema,
+                    self._database_id,
+                    catalog,
+                    schema,
+                    sorted({dataset.table_name for dataset in datasets}),
+                )
+                for (catalog, schema), datasets in schemas
+            ],
+            max_workers=current_app.config["DATASET_BULK_REFRESH_MAX_WORKERS"],
+            thread_name_prefix="dataset-refresh",
+        )
+        for (_, datasets), result in zip(schemas, results, strict=True):
+            if result is None:
+                failed.extend(dataset.id for dataset in datasets)
+                continue
+
+            columns, metrics = result
+            for dataset in datasets:
+                # some dialects return no columns instead of failing when the
+                # table doesn't exist
+                if not columns.get(dataset.table_name):
+                    failed.append(dataset.id)
+                    continue
+                dataset.merge_metadata(
+                    convert_physical_columns(
+                        database=self._database,
+                        cols=[col.copy() for col in columns[dataset.table_name]],
+                        normalize_columns=dataset.normalize_columns,
+                    ),
+                    metrics[dataset.table_name],
+                    dataset.columns,
+                )
+                refreshed.append(dataset.id)
+                if len(refreshed) % batch_size == 0:
+                    db.session.flush()
+
+        return {"refreshed": sorted(refreshed), "failed": sorted(failed)}
+
+    def validate(self) -> None:
+        self._database = DatabaseDAO.find_by_id(self._database_id)
+        if not self._database:
+            raise DatabaseNotFoundError()
+
+        query = (
+            db.session.query(SqlaTable)
+            .options(selectinload(SqlaTable.columns), selectinload(SqlaTable.metrics))
+            .filter(
+                SqlaTable.database_id == self._database_id,
+                or_(SqlaTable.sql.is_(None), SqlaTable.sql == ""),
+            )
+        )
+        if self._catalog:
+            query = query.filter(SqlaTable.catalog == self._catalog)
+        if self._schemas:
+            query = query.filter(SqlaTable.schema.in_(self._schemas))
+
+        for dataset in query.all():
+            try:
+                security_manager.raise_for_ownership(dataset)
+                self._datasets.append(dataset)
+            except SupersetSecurityException:
+                self._forbidden.append(dataset)
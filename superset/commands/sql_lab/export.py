@@ -20,18 +20,23 @@ import logging
 from typing import Any, cast, TypedDict
 
 import pandas as pd
+import pyarrow as pa
 from flask import current_app as app
 from flask_babel import gettext as __
 
 from superset import db, results_backend, results_backend_use_msgpack
 from superset.commands.base import BaseCommand
+from superset.common.chart_data import ChartDataResultFormat
 from superset.errors import ErrorLevel, SupersetError, SupersetErrorType
 from superset.exceptions import SupersetErrorException, SupersetSecurityException
 from superset.models.sql_lab import Query
 from superset.sql.parse import SQLScript
 from superset.sqllab.limiting_factor import LimitingFactor
-from superset.utils import core as utils, csv
-from superset.views.utils import _deserialize_results_payload
+from superset.utils import arrow, core as utils, csv
+from superset.views.utils import (
+    _deserialize_results_payload,
+    _deserialize_results_table,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -49,8 +54,10 @@ class SqlResultExportCommand(BaseCommand):
     def __init__(
         self,
         client_id: str,
+        result_format: ChartDataResultFormat = ChartDataResultFormat.CSV,
     ) -> None:
         self._client_id = client_id
+        self._result_format = result_format
 
     def validate(self) -> None:
         self._query = (
@@ -96,6 +103,18 @@ class SqlResultExportCommand(BaseCommand):
             payload = utils.zlib_decompress(
                 blob, decode=not results_backend_use_msgpack
             )
+            if (
+                self._result_format in ChartDataResultFormat.binary()
+                and results_backend_use_msgpack
+            ):
+                # the payload already has an Arrow table, export it as is
+                table = _deserialize_results_table(payload)
+                return {
+                    "query": self._query,
+                    "count": table.num_rows,
+                    "data": self._serialize_table(table),
+                }
+
             obj = _deserialize_results_payload(
                 payload, self._query, cast(bool, results_backend_use_msgpack)
             )
@@ -130,6 +149,13 @@ class SqlResultExportCommand(BaseCommand):
                 self._query.schema,
             )[:limit]
 
+        if self._result_format in ChartDataResultFormat.binary():
+            return {
+                "query": self._query,
+                "count": len(df.index),
+                "data": self._serialize_table(arrow.df_to_arrow_table(df)),
+            }
+
         # Manual encoding using the specified encoding (default to utf-8 if not set)
         csv_string = csv.df_to_escaped_csv(df, index=False, **app.config["CSV_EXPORT"])
         csv_data = csv_string.encode(app.config["CSV_EXPORT"].get("encoding", "utf-8"))
@@ -139,3 +165,8 @@ class SqlResultExportCommand(BaseCommand):
             "count": len(df.index),
             "data": csv_data,
         }
+
+    def _serialize_table(self, table: pa.Table) -> bytes:
+        if self._result_format == ChartDataResultFormat.PARQUET:
+            return arrow.table_to_parquet(table, **app.config["PARQUET_EXPORT"])
+        return arrow.table_to_arrow_ipc(table, **app.config["ARROW_EXPORT"])
@@ -24,6 +24,7 @@ from flask_babel import gettext as __
 
 from superset import db
 from superset.commands.streaming_export.base import BaseStreamingCSVExportCommand
+from superset.common.chart_data import ChartDataResultFormat
 from superset.errors import ErrorLevel, SupersetError, SupersetErrorType
 from superset.exceptions import SupersetErrorException, SupersetSecurityException
 from superset.models.sql_lab import Query
@@ -45,6 +46,7 @@ class StreamingSqlResultExportCommand(BaseStreamingCSVExportCommand):
         self,
         client_id: str,
         chunk_size: int = 1000,
+        result_format: ChartDataResultFormat = ChartDataResultFormat.CSV,
     ):
         """
         Initialize the SQL Lab streaming export command.
@@ -52,8 +54,9 @@ class StreamingSqlResultExportCommand(BaseStreamingCSVExportCommand):
         Args:
             client_id: The SQL Lab query client ID
             chunk_size: Number of rows to fetch per database query (default: 1000)
+            result_format: The export format, CSV, Parquet or Arrow (default: CSV)
         """
-        super().__init__(chunk_size)
+        super().__init__(chunk_size, result_format)
         self._client_id = client_id
         self._query: Query | None = None
 
@@ -31,6 +31,9 @@ from sqlalchemy import text
 
 from superset import db
 from superset.commands.base import BaseCommand
+from superset.common.chart_data import ChartDataResultFormat
+from superset.utils import arrow
+from superset.utils.csv import escape_rows, escape_value
 
 logger = logging.getLogger(__name__)
 
@@ -63,19 +66,28 @@ class BaseStreamingCSVExportCommand(BaseCommand):
     - Buffering data for efficient streaming
     - Error handling with user-friendly messages
 
+    Results can also be streamed as Parquet files or Arrow IPC streams, in which
+    case each fetched chunk of rows is written as a row group or record batch.
+
     Subclasses must implement:
     - _get_sql_and_database(): Return SQL query string and database object
     - _get_row_limit(): Return optional row limit for the export
     """
 
-    def __init__(self, chunk_size: int = 1000):
+    def __init__(
+        self,
+        chunk_size: int = 1000,
+        result_format: ChartDataResultFormat = ChartDataResultFormat.CSV,
+    ):
         """
         Initialize the streaming export command.
 
         Args:
             chunk_size: Number of rows to fetch per database query (default: 1000)
+            result_format: The export format, CSV, Parquet or Arrow (default: CSV)
         """
         self._chunk_size = chunk_size
+        self._result_format = result_format
         self._current_app = app._get_current_object()
 
     @abstractmethod
@@ -100,7 +112,7 @@ class BaseStreamingCSVExportCommand(BaseCommand):
         self, columns: list[str], csv_writer: Any, buffer: io.StringIO
     ) -> tuple[str, int]:
         """Write CSV header and return header data with byte count."""
-        csv_writer.writerow(columns)
+        csv_writer.writerow([escape_value(column) for column in columns])
         header_data = buffer.getvalue()
         total_bytes = len(header_data.encode("utf-8"))
         buffer.seek(0)
@@ -123,7 +135,8 @@ class BaseStreamingCSVExportCommand(BaseCommand):
         flush_threshold = 65536  # 64KB
 
         while rows := result_proxy.fetchmany(self._chunk_size):
-            for row in rows:
+            # Escape formulas, like non-streaming exports do
+            for row in escape_rows(rows):
                 # Apply limit if specified
                 if limit is not None and row_count >= limit:
                     break
@@ -149,6 +162,60 @@ class BaseStreamingCSVExportCommand(BaseCommand):
             data_bytes = len(remaining_data.encode("utf-8"))
             yield remaining_data, row_count, data_bytes
 
+    def _fetch_batches(
+        self, result_proxy: Any, limit: int | None
+    ) -> Generator[list[Any], None, None]:
+        """Fetch rows in chunks, stopping at the limit if specified."""
+        row_count = 0
+        while rows := result_proxy.fetchmany(self._chunk_size):
+            if limit is not None:
+                rows = rows[: limit - row_count]
+            row_count += len(rows)
+            if rows:
+                yield [tuple(row) for row in rows]
+            if limit is not None and row_count >= limit:
+                break
+
+    def _execute_query_and_stream_binary(
+        self, sql: str, database: Any, limit: int | None
+    ) -> Generator[bytes, None, None]:
+        """Execute query with streaming and yield Parquet or Arrow chunks."""
+        start_time = time.time()
+        total_bytes = 0
+        options = (
+            self._current_app.config["PARQUET_EXPORT"]
+            if self._result_format == ChartDataResultFormat.PARQUET
+            else self._current_app.config["ARROW_EXPORT"]
+        )
+
+        with db.session() as session:
+            # Merge database to prevent DetachedInstanceError
+            merged_database = session.merge(database)
+
+            # Execute query with streaming
+            with merged_database.get_sqla_engine() as engine:
+                with engine.connect() as connection:
+                    result_proxy = connection.execution_options(
+                        stream_results=True
+                    ).execute(text(sql))
+
+                    for data_chunk in arrow.stream_rows(
+                        list(result_proxy.keys()),
+                        self._fetch_batches(result_proxy, limit),
+                        self._result_format,
+                        **options,
+                    ):
+                        total_bytes += len(data_chunk)
+                        yield data_chunk
+
+                    # Log completion
+                    logger.info(
+                        "Streaming %s completed: %.1fMB in %.2fs",
+                        self._result_format,
+                        total_bytes / (1024 * 1024),
+                        time.time() - start_time,
+                    )
+
     def _execute_query_and_stream(
         self, sql: str, database: Any, limit: int | None
     ) -> Generator[str, None, None]:
@@ -199,12 +266,13 @@ class BaseStreamingCSVExportCommand(BaseCommand):
                         total_time,
                     )
 
-    def run(self) -> Callable[[], Generator[str, None, None]]:
+    def run(self) -> Callable[[], Generator[str | bytes, None, None]]:
         """
-        Execute the streaming CSV export.
+        Execute the streaming export.
 
         Returns:
-            A callable that returns a generator yielding CSV data chunks as strings.
+            A callable that returns a generator yielding CSV data chunks as strings,
+            or Parquet/Arrow chunks as bytes.
             The callable is needed to maintain Flask app context during streaming.
         """
         # Load all needed data while session is still active
@@ -217,12 +285,19 @@ class BaseStreamingCSVExportCommand(BaseCommand):
             g._get_current_object().__dict__.copy() if has_app_context() else {}
         )
 
-        def csv_generator() -> Generator[str, None, None]:
+        def csv_generator() -> Generator[str | bytes, None, None]:
             """Generator that yields CSV data chunks."""
             with self._current_app.app_context():
                 with preserve_g_context(captured_g):
                     try:
-                        yield from self._execute_query_and_stream(sql, database, limit)
+                        if self._result_format in ChartDataResultFormat.binary():
+                            yield from self._execute_query_and_stream_binary(
+                                sql, database, limit
+                            )
+                        else:
+                            yield from self._execute_query_and_stream(
+                                sql, database, limit
+                            )
                     except Exception as e:
                         logger.error("Error in streaming CSV generator: %s", e)
                         import traceback
@@ -25,10 +25,16 @@ class ChartDataResultFormat(StrEnum):
     CSV = "csv"
     JSON = "json"
     XLSX = "xlsx"
+    PARQUET = "parquet"
+    ARROW = "arrow"
 
     @classmethod
     def table_like(cls) -> set["ChartDataResultFormat"]:
-        return {cls.CSV} | {cls.XLSX}
+        return {cls.CSV} | {cls.XLSX} | cls.binary()
+
+    @classmethod
+    def binary(cls) -> set["ChartDataResultFormat"]:
+        return {cls.PARQUET, cls.ARROW}
 
 
 class ChartDataResultType(StrEnum):
@@ -20,6 +20,7 @@ import logging
 from typing import Any, ClassVar, TYPE_CHECKING
 
 import pandas as pd
+from flask import current_app
 
 from superset.common.chart_data import ChartDataResultFormat, ChartDataResultType
 from superset.common.query_context_processor import QueryContextProcessor
@@ -118,9 +119,46 @@ class QueryContext:
             return self.slice_.cache_timeout
         return self.datasource.cache_timeout
 
+    def get_stale_while_revalidate(self) -> int:
+        """
+        Get the time during which expired results are served while they're refreshed.
+
+        Priority order:
+        1. Chart-level window (if querying from a saved chart)
+        2. Datasource-level window, from the `extra` attributes of the dataset
+        3. System default
+
+        A window that isn't a non-negative number of seconds is logged and the
+        system default is used instead.
+        """
+        value = None
+        if self.slice_:
+            value = self.slice_.params_dict.get("stale_while_revalidate")
+        if value is None:
+            extra = getattr(self.datasource, "extra_dict", None) or {}
+            value = extra.get("stale_while_revalidate")
+        default = current_app.config["DATA_CACHE_STALE_WHILE_REVALIDATE"]
+        if value is None:
+            return default
+        try:
+            window = int(value)
+        except (TypeError, ValueError):
+            window = -1
+        if window < 0:
+            logger.warning(
+                "Invalid stale_while_revalidate value %r, using %s",
+                value,
+                default,
+            )
+            return default
+        return window
+
     def query_cache_key(self, query_obj: QueryObject, **kwargs: Any) -> str | None:
         return self._processor.query_cache_key(query_obj, **kwargs)
 
+    def data_cache_key(self) -> str:
+        return self._processor.data_cache_key()
+
     def get_df_payload(
         self,
         query_obj: QueryObject,
@@ -18,13 +18,16 @@ from __future__ import annotations
 
 import logging
 import re
-from typing import Any, cast, ClassVar, Sequence, TYPE_CHECKING
+import time
+from contextlib import contextmanager, ExitStack
+from datetime import timedelta
+from typing import Any, cast, ClassVar, Iterator, Sequence, TYPE_CHECKING
 
 import pandas as pd
 from flask import current_app
 from flask_babel import gettext as _
 
-from superset.common.chart_data import ChartDataResultFormat
+from superset.common.chart_data import ChartDataResultFormat, ChartDataResultType
 from superset.common.db_query_status import QueryStatus
 from superset.common.query_actions import get_query_results
 from superset.common.utils.query_cache_manager import QueryCacheManager
@@ -32,15 +35,17 @@ from superset.common.utils.time_range_utils import get_since_until_from_time_ran
 from superset.constants import CACHE_DISABLED_TIMEOUT, CacheRegion
 from superset.daos.annotation_layer import AnnotationLayerDAO
 from superset.daos.chart import ChartDAO
+from superset.distributed_lock import KeyValueDistributedLock
 from superset.exceptions import (
+    CreateKeyValueDistributedLockFailedException,
     QueryObjectValidationError,
     SupersetException,
 )
 from superset.explorables.base import Explorable
 from superset.extensions import cache_manager, security_manager
-from superset.models.helpers import QueryResult
-from superset.superset_typing import AdhocColumn, AdhocMetric
-from superset.utils import csv, excel
+from superset.models.helpers import ExploreMixin, QueryResult
+from superset.superset_typing import AdhocColumn, AdhocMetric, QueryObjectDict
+from superset.utils import arrow, csv, excel
 from superset.utils.cache import generate_cache_key, set_and_log_cache
 from superset.utils.core import (
     DatasourceType,
@@ -49,6 +54,7 @@ from superset.utils.core import (
     GenericDataType,
     get_column_names_from_columns,
     get_column_names_from_metrics,
+    get_user_id,
     is_adhoc_column,
     is_adhoc_metric,
 )
@@ -62,6 +68,18 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+# namespace of the locks held while running chart data queries
+SINGLE_FLIGHT_NAMESPACE = "chart_data_query"
+# interval, in seconds, at which requests waiting for an identical query check the
+# data cache for its result
+SINGLE_FLIGHT_POLL_INTERVAL = 0.2
+# result types whose queries can run ahead of time, concurrently
+EXECUTE_AHEAD_RESULT_TYPES = {
+    ChartDataResultType.FULL,
+    ChartDataResultType.RESULTS,
+    ChartDataResultType.POST_PROCESSED,
+}
+
 
 class QueryContextProcessor:
     """
@@ -75,6 +93,8 @@ class QueryContextProcessor:
     def __init__(self, query_context: QueryContext):
         self._query_context = query_context
         self._qc_datasource = query_context.datasource
+        # results of the queries that ran ahead of time, by cache key
+        self._query_results: dict[str, QueryResult] = {}
 
     cache_type: ClassVar[str] = "df"
     enforce_numerical_metrics: ClassVar[bool] = True
@@ -97,36 +117,35 @@ class QueryContextProcessor:
             force_query=force_query,
             force_cached=force_cached,
         )
+        if cache.is_stale:
+            self.refresh_stale_cache()
 
         if query_obj and cache_key and not cache.is_loaded:
             try:
-                if invalid_columns := [
-                    col
-                    for col in get_column_names_from_columns(query_obj.columns)
-                    + get_column_names_from_metrics(query_obj.metrics or [])
-                    if (
-                        col not in self._qc_datasource.column_names
-                        and col != DTTM_ALIAS
-                    )
-                ]:
-                    raise QueryObjectValidationError(
-                        _(
-                            "Columns missing in dataset: %(invalid_columns)s",
-                            invalid_columns=invalid_columns,
+                self.validate_columns(query_obj)
+
+                with self.single_flight(cache_key, force_query) as coalesced:
+                    if coalesced:
+                        cache = coalesced
+                    else:
+                        query_result = self.get_query_result(
+                            query_obj,
+                            force=force_query,
+                            query_result=self._query_results.pop(cache_key, None),
+                        )
+                        annotation_data = self.get_annotation_data(query_obj)
+                        cache.set_query_result(
+                            key=cache_key,
+                            query_result=query_result,
+                            annotation_data=annotation_data,
+                            force_query=force_query,
+                            timeout=self.get_cache_timeout(),
+                            datasource_uid=self._qc_datasource.uid,
+                            region=CacheRegion.DATA,
+                            stale_timeout=(
+                                self._query_context.get_stale_while_revalidate()
+                            ),
                         )
-                    )
-
-                query_result = self.get_query_result(query_obj)
-                annotation_data = self.get_annotation_data(query_obj)
-                cache.set_query_result(
-                    key=cache_key,
-                    query_result=query_result,
-                    annotation_data=annotation_data,
-                    force_query=force_query,
-                    timeout=self.get_cache_timeout(),
-                    datasource_uid=self._qc_datasource.uid,
-                    region=CacheRegion.DATA,
-                )
             except QueryObjectValidationError as ex:
                 cache.error_message = str(ex)
                 cache.status = QueryStatus.FAILED
@@ -190,6 +209,7 @@ class QueryContextProcessor:
             "annotation_data": cache.annotation_data,
             "error": cache.error_message,
             "is_cached": cache.is_cached,
+            "is_stale": cache.is_stale,
             "query": cache.query,
             "status": cache.status,
             "stacktrace": cache.stacktrace,
@@ -200,6 +220,135 @@ class QueryContextProcessor:
             "label_map": label_map,
         }
 
+    @contextmanager
+    def single_flight(
+        self, cache_key: str, force_query: bool
+    ) -> Iterator[QueryCacheManager | None]:
+        """
+        Deduplicate identical queries that run concurrently.
+
+        The first request for a cache key takes a distributed lock and yields `None`,
+        so that it runs the query and caches the result while holding the lock. The
+        other requests yield the cached result once it's available, or `None` if the
+        lock is released without a result or `DATA_QUERY_SINGLE_FLIGHT_TIMEOUT`
+        elapses, in which case they run the query themselves.
+
+        :param cache_key: The cache key of the query
+        :param force_query: Whether the query bypasses the cache
+        :yields: The cached result of the identical query, if any
+        """
+        timeout = current_app.config["DATA_QUERY_SINGLE_FLIGHT_TIMEOUT"]
+        if force_query or not timeout:
+            yield None
+            return
+
+        with ExitStack() as stack:
+            try:
+                stack.enter_context(
+                    KeyValueDistributedLock(
+                        SINGLE_FLIGHT_NAMESPACE,
+                        # don't hold up the other requests after they stop waiting
+                        lock_expiration=timedelta(seconds=timeout),
+                        cache_key=cache_key,
+                    )
+                )
+                cache = None
+            except CreateKeyValueDistributedLockFailedException:
+                cache = self.wait_for_query_result(cache_key, timeout)
+            yield cache
+
+    @staticmethod
+    def wait_for_query_result(
+        cache_key: str, timeout: float
+    ) -> QueryCacheManager | None:
+        """
+        Wait for the result of a query that another request is running.
+
+        :param cache_key: The cache key of the query
+        :param timeout: Maximum time to wait, in seconds
+        :returns: The cached result, or `None` if the other request released its lock
+            without caching a result or the wait timed out
+        """
+        # pylint: disable=import-outside-toplevel
+        from superset.commands.distributed_lock.get import GetDistributedLock
+
+        stats_logger = current_app.config["STATS_LOGGER"]
+        deadline = time.monotonic() + timeout
+        while True:
+            # check the lock before the cache, the result is cached before the lock
+            # is released
+            is_running = GetDistributedLock(
+                namespace=SINGLE_FLIGHT_NAMESPACE,
+                params={"cache_key": cache_key},
+            ).run()
+            cache = QueryCacheManager.get(key=cache_key, region=CacheRegion.DATA)
+            if cache.is_loaded:
+                stats_logger.incr("chart_data_query_coalesced")
+                return cache
+            if not is_running or time.monotonic() >= deadline:
+                logger.debug("Running query %s without waiting anymore", cache_key)
+                stats_logger.incr("chart_data_query_not_coalesced")
+                return None
+            time.sleep(SINGLE_FLIGHT_POLL_INTERVAL)
+
+    def refresh_stale_cache(self) -> None:
+        """
+        Refresh the cached results of the query context in the background.
+
+        The refresh runs the queries again on a Celery worker, with the user of the
+        request. Requests that find the same stale results while a refresh is pending
+        don't enqueue another one.
+        """
+        # pylint: disable=import-outside-toplevel
+        from superset.tasks.async_queries import load_chart_data_into_cache
+
+        # the task deletes the marker when it's done, it only expires on its own when
+        # the worker dies, and no later than a chart query would time out
+        refresh_stale_key = self.cache_key(refresh_stale=True)
+        if not cache_manager.data_cache.add(
+            refresh_stale_key,
+            True,
+            timeout=min(
+                current_app.config["SUPERSET_WEBSERVER_TIMEOUT"],
+                current_app.config["SQLLAB_ASYNC_TIME_LIMIT_SEC"],
+            ),
+        ):
+            return
+
+        job_metadata: dict[str, Any] = {
+            "user_id": get_user_id(),
+            "refresh_stale": True,
+            "refresh_stale_key": refresh_stale_key,
+        }
+        if guest_user := security_manager.get_current_guest_user_if_guest():
+            job_metadata["guest_token"] = guest_user.guest_token
+        load_chart_data_into_cache.delay(
+            job_metadata,
+            {
+                **self._query_context.cache_values,
+                "form_data": self._query_context.form_data,
+                "custom_cache_timeout": self._query_context.custom_cache_timeout,
+                "force": True,
+            },
+        )
+        current_app.config["STATS_LOGGER"].incr("chart_data_stale_refresh")
+
+    def data_cache_key(self) -> str:
+        """
+        Returns a key identifying the data of the query context for the current
+        user, made out of the cache key of the query context and the cache keys of
+        its queries, which include the RLS filters
+        """
+        query_cache_keys = []
+        for query_obj in self._query_context.queries:
+            query_obj.validate()
+            query_cache_keys.append(self.query_cache_key(query_obj))
+
+        return generate_cache_key(
+            {"query_context": self.cache_key(), "queries": query_cache_keys},
+            "qcd-",
+        )
+
     def query_cache_key(self, query_obj: QueryObject, **kwargs: Any) -> str | None:
         """
         Returns a QueryObject cache key for objects in self.queries
@@ -220,19 +369,125 @@ class QueryContextProcessor:
         )
         return cache_key
 
-    def get_query_result(self, query_object: QueryObject) -> QueryResult:
+    def validate_columns(self, query_obj: QueryObject) -> None:
+        """
+        Check that the columns of the query object exist in the datasource.
+
+        :raises QueryObjectValidationError: If some columns are missing
+        """
+        if invalid_columns := [
+            col
+            for col in get_column_names_from_columns(query_obj.columns)
+            + get_column_names_from_metrics(query_obj.metrics or [])
+            if col not in self._qc_datasource.column_names and col != DTTM_ALIAS
+        ]:
+            raise QueryObjectValidationError(
+                _(
+                    "Columns missing in dataset: %(invalid_columns)s",
+                    invalid_columns=invalid_columns,
+                )
+            )
+
+    def get_query_result(
+        self,
+        query_object: QueryObject,
+        force: bool = False,
+        query_result: QueryResult | None = None,
+    ) -> QueryResult:
         """
         Returns a pandas dataframe based on the query object.
 
         This method delegates to the datasource's get_query_result method,
         which handles query execution, normalization, time offsets, and
         post-processing.
+
+        :param query_result: The result of the base query, if it already ran
+        """
+        kwargs: dict[str, Any] = {}
+        if query_result is not None:
+            kwargs["query_result"] = query_result
+        return self._qc_datasource.get_query_result(
+            query_object,
+            force=force,
+            cache_key_fn=self.time_offset_cache_key,
+            cache_timeout_fn=self.get_cache_timeout,
+            **kwargs,
+        )
+
+    def execute_queries(self, force_cached: bool = False) -> None:
         """
-        return self._qc_datasource.get_query_result(query_object)
+        Run the queries of the context that aren't cached, concurrently.
+
+        The queries are planned and compiled here, in the thread of the request, since
+        that reads the datasource, the RLS filters and Jinja context from the ORM
+        session of the request. Only their execution runs on worker threads, bounded by
+        the ``query_concurrency`` of the database, see ``ExploreMixin.query_many``.
+        The results are then processed, in order, by ``get_df_payload``.
+
+        Queries that are served from the cache, or whose result type doesn't go
+        through ``get_df_payload`` as is (eg, samples), run when they're processed,
+        and so do all queries when they can't run concurrently, or when
+        ``DATA_QUERY_SINGLE_FLIGHT_TIMEOUT`` is set, so that they hold their locks
+        while running.
+        """
+        datasource = self._qc_datasource
+        if (
+            force_cached
+            or len(self._query_context.queries) <= 1
+            or current_app.config["DATA_QUERY_SINGLE_FLIGHT_TIMEOUT"]
+            or not isinstance(datasource, ExploreMixin)
+            or datasource.database.query_concurrency <= 1
+        ):
+            return
+
+        timeout = self.get_cache_timeout()
+        force_query = self._query_context.force or timeout == CACHE_DISABLED_TIMEOUT
+        query_objs: dict[str, QueryObjectDict] = {}
+        for query_obj in self._query_context.queries:
+            result_type = query_obj.result_type or self._query_context.result_type
+            if (
+                result_type not in EXECUTE_AHEAD_RESULT_TYPES
+                or query_obj.validate(raise_exceptions=False)
+                or not (cache_key := self.query_cache_key(query_obj))
+                or cache_key in query_objs
+                or (not force_query and cache_manager.data_cache.has(cache_key))
+            ):
+                continue
+            try:
+                self.validate_columns(query_obj)
+            except QueryObjectValidationError:
+                continue
+            _, query_objs[cache_key] = datasource.plan_query(query_obj)
+
+        if len(query_objs) <= 1:
+            return
+
+        try:
+            query_results = datasource.query_many(
+                list(query_objs.values()),
+                force=force_query,
+            )
+        except QueryObjectValidationError:
+            # the queries run one by one instead, so that the error is reported on
+            # the query that failed to compile
+            logger.debug("Failed to compile the queries ahead of time", exc_info=True)
+            return
+
+        self._query_results = dict(zip(query_objs, query_results, strict=True))
+
+    def time_offset_cache_key(
+        self, query_obj: QueryObject, time_offset: str, time_grain: Any
+    ) -> str | None:
+        """
+        Returns the cache key of the results of a time offset query
+        """
+        return self.query_cache_key(
+            query_obj, time_offset=time_offset, time_grain=time_grain
+        )
 
     def get_data(
         self, df: pd.DataFrame, coltypes: list[GenericDataType]
-    ) -> str | list[dict[str, Any]]:
+    ) -> str | bytes | list[dict[str, Any]]:
         if self._query_context.result_format in ChartDataResultFormat.table_like():
             include_index = not isinstance(df.index, pd.RangeIndex)
             columns = list(df.columns)
@@ -248,6 +503,14 @@ class QueryContextProcessor:
             elif self._query_context.result_format == ChartDataResultFormat.XLSX:
                 excel.apply_column_types(df, coltypes)
                 result = excel.df_to_excel(df, **current_app.config["EXCEL_EXPORT"])
+            elif self._query_context.result_format == ChartDataResultFormat.PARQUET:
+                result = arrow.df_to_parquet(
+                    df, index=include_index, **current_app.config["PARQUET_EXPORT"]
+                )
+            elif self._query_context.result_format == ChartDataResultFormat.ARROW:
+                result = arrow.df_to_arrow_ipc(
+                    df, index=include_index, **current_app.config["ARROW_EXPORT"]
+                )
             return result or ""
 
         return df.to_dict(orient="records")
@@ -276,8 +539,12 @@ class QueryContextProcessor:
                 totals_idx = i
 
         if queries_needing_totals and totals_idx is not None:
+            # the totals are a single row, so the limit and the sort order don't
+            # matter, and clearing them lets charts that share the same datasource,
+            # filters and metrics share the cached totals
             totals_query = self._query_context.queries[totals_idx]
             totals_query.row_limit = None
+            totals_query.orderby = []
 
         return queries_needing_totals, totals_idx
 
@@ -294,8 +561,13 @@ class QueryContextProcessor:
 
         totals_query = self._query_context.queries[totals_idx]
 
-        result = self._query_context.get_query_result(totals_query)
-        df = result.df
+        # go through the data cache, so that the unbounded totals query only hits the
+        # database on a cache miss, and the payload of the totals query is then
+        # served from the cache entry set here
+        payload = self.get_df_payload(totals_query)
+        if payload["status"] == QueryStatus.FAILED:
+            return
+        df = payload["df"]
 
         totals = {
             col: df[col].sum() for col in df.columns if df[col].dtype.kind in "biufc"
@@ -336,6 +608,7 @@ class QueryContextProcessor:
                 )
             ]
 
+        self.execute_queries(force_cached)
         query_results = [
             get_query_results(
                 query_obj.result_type or self._query_context.result_type,
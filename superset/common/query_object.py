@@ -18,6 +18,7 @@
 from __future__ import annotations
 
 import logging
+import time
 from datetime import datetime
 from pprint import pformat
 from typing import Any, NamedTuple, TYPE_CHECKING
@@ -48,6 +49,7 @@ from superset.utils.core import (
 )
 from superset.utils.hashing import hash_from_dict
 from superset.utils.json import json_int_dttm_ser
+from superset.utils.pandas_postprocessing.utils import INPLACE_OPERATIONS
 
 if TYPE_CHECKING:
     from superset.connectors.sqla.models import BaseDatasource
@@ -522,7 +524,11 @@ class QueryObject:  # pylint: disable=too-many-instance-attributes
                  is incorrect
         """
         logger.debug("post_processing: \n %s", pformat(self.post_processing))
-        with event_logger.log_context(f"{self.__class__.__name__}.post_processing"):
+        input_df = df
+        steps: list[dict[str, Any]] = []
+        with event_logger.log_context(
+            f"{self.__class__.__name__}.post_processing"
+        ) as log:
             for post_process in self.post_processing:
                 operation = post_process.get("operation")
                 if not operation:
@@ -537,5 +543,21 @@ class QueryObject:  # pylint: disable=too-many-instance-attributes
                         )
                     )
                 options = post_process.get("options", {})
+                if operation in INPLACE_OPERATIONS and df is not input_df:
+                    # the DataFrame was built by a previous operation, so there's no
+                    # need to copy it, eg, when renaming the columns of a pivot
+                    options = {**options, "inplace": True}
+
+                start = time.perf_counter()
                 df = getattr(pandas_postprocessing, operation)(df, **options)
+                steps.append(
+                    {
+                        "operation": operation,
+                        "duration_ms": round((time.perf_counter() - start) * 1000, 3),
+                        "rows": len(df.index),
+                        "memory_bytes": int(df.memory_usage(deep=False).sum()),
+                    }
+                )
+
+            log(post_processing_steps=steps)
             return df
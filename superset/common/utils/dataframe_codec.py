@@ -0,0 +1,93 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+"""
+Codecs used to store dataframes in the data cache.
+
+By default the data cache stores ``pd.DataFrame`` objects, which the cache backend
+pickles. A codec can be configured through ``DATA_CACHE_DATAFRAME_CODEC`` to store
+a more compact binary representation instead.
+"""
+
+from __future__ import annotations
+
+from abc import ABC, abstractmethod
+from typing import Literal
+
+import pandas as pd
+import pyarrow as pa
+
+from superset.exceptions import SupersetException
+
+
+class DataFrameCodecEncodeError(SupersetException):
+    """The dataframe can't be represented by the codec without losing information"""
+
+
+class DataFrameCodec(ABC):
+    name: str
+
+    @abstractmethod
+    def encode(self, df: pd.DataFrame) -> bytes: ...
+
+    @abstractmethod
+    def decode(self, value: bytes) -> pd.DataFrame: ...
+
+
+class ArrowDataFrameCodec(DataFrameCodec):
+    """
+    Store dataframes as Arrow IPC streams, optionally compressed with LZ4 or ZSTD.
+
+    Decoding reads the stream without copying the buffer. Dataframes that don't round
+    trip through Arrow unchanged (eg, non-string column names or nested values, which
+    would come back as arrays) are rejected with ``DataFrameCodecEncodeError``.
+    """
+
+    name = "arrow"
+
+    def __init__(self, compression: Literal["lz4", "zstd"] | None = None) -> None:
+        self.compression = compression
+
+    def encode(self, df: pd.DataFrame) -> bytes:
+        if isinstance(df.columns, pd.MultiIndex) or not all(
+            isinstance(column, str) for column in df.columns
+        ):
+            raise DataFrameCodecEncodeError("Column names must be strings")
+        if df.columns.has_duplicates:
+            raise DataFrameCodecEncodeError("Column names must be unique")
+
+        try:
+            table = pa.Table.from_pandas(df)
+        except (pa.ArrowException, TypeError, ValueError) as ex:
+            raise DataFrameCodecEncodeError(str(ex)) from ex
+
+        if any(pa.types.is_nested(field.type) for field in table.schema):
+            raise DataFrameCodecEncodeError("Nested values are not supported")
+
+        options = pa.ipc.IpcWriteOptions(compression=self.compression)
+        sink = pa.BufferOutputStream()
+        with pa.ipc.new_stream(sink, table.schema, options=options) as writer:
+            writer.write_table(table)
+
+        return sink.getvalue().to_pybytes()
+
+    def decode(self, value: bytes) -> pd.DataFrame:
+        with pa.ipc.open_stream(pa.py_buffer(value)) as reader:
+            table = reader.read_all()
+
+        # integers with nulls are restored as objects, like pandas builds them, instead
+        # of floats that can't represent large values exactly
+        return table.to_pandas(integer_object_nulls=True)
@@ -17,6 +17,7 @@
 from __future__ import annotations
 
 import logging
+import time
 from datetime import datetime, timezone
 from typing import Any
 
@@ -25,6 +26,11 @@ from flask_caching import Cache
 from pandas import DataFrame
 
 from superset.common.db_query_status import QueryStatus
+from superset.common.utils.dataframe_codec import (
+    ArrowDataFrameCodec,
+    DataFrameCodec,
+    DataFrameCodecEncodeError,
+)
 from superset.constants import CacheRegion
 from superset.exceptions import CacheLoadError
 from superset.extensions import cache_manager
@@ -41,6 +47,11 @@ _cache: dict[CacheRegion, Cache] = {
     CacheRegion.DATA: cache_manager.data_cache,
 }
 
+# codecs used to decode cached dataframes, by name
+DATAFRAME_CODECS: dict[str, DataFrameCodec] = {
+    ArrowDataFrameCodec.name: ArrowDataFrameCodec(),
+}
+
 
 class QueryCacheManager:
     """
@@ -69,6 +80,7 @@ class QueryCacheManager:
         cache_value: dict[str, Any] | None = None,
         sql_rowcount: int | None = None,
         queried_dttm: str | None = None,
+        is_stale: bool = False,
     ) -> None:
         self.df = df
         self.query = query
@@ -86,6 +98,7 @@ class QueryCacheManager:
         self.cache_value = cache_value
         self.sql_rowcount = sql_rowcount
         self.queried_dttm = queried_dttm
+        self.is_stale = is_stale
 
     # pylint: disable=too-many-arguments
     def set_query_result(
@@ -97,9 +110,13 @@ class QueryCacheManager:
         timeout: int | None = None,
         datasource_uid: str | None = None,
         region: CacheRegion = CacheRegion.DEFAULT,
+        stale_timeout: int = 0,
     ) -> None:
         """
         Set dataframe of query-result to specific cache region
+
+        :param stale_timeout: if set, keep the result for this many seconds after the
+            timeout, during which `get` marks it as stale
         """
         try:
             self.status = query_result.status
@@ -134,6 +151,9 @@ class QueryCacheManager:
                 "queried_dttm": self.queried_dttm,
                 "dttm": self.queried_dttm,  # Backwards compatibility
             }
+            if stale_timeout and timeout and timeout > 0:
+                value["fresh_until"] = time.time() + timeout
+                timeout += stale_timeout
             if self.is_loaded and key and self.status != QueryStatus.FAILED:
                 self.set(
                     key=key,
@@ -170,7 +190,7 @@ class QueryCacheManager:
             logger.debug("CACHE GET - Key: %s, Region: %s", key, region)
             current_app.config["STATS_LOGGER"].incr("loading_from_cache")
             try:
-                query_cache.df = cache_value["df"]
+                query_cache.df = cls.decode_df(cache_value)
                 query_cache.query = cache_value["query"]
                 query_cache.annotation_data = cache_value.get("annotation_data", {})
                 query_cache.applied_template_filters = cache_value.get(
@@ -193,6 +213,8 @@ class QueryCacheManager:
                     "queried_dttm", cache_value.get("dttm")
                 )
                 query_cache.cache_value = cache_value
+                if (fresh_until := cache_value.get("fresh_until")) is not None:
+                    query_cache.is_stale = fresh_until < time.time()
                 current_app.config["STATS_LOGGER"].incr("loaded_from_cache")
             except KeyError as ex:
                 logger.exception(ex)
@@ -222,8 +244,47 @@ class QueryCacheManager:
         set value to specify cache region, proxy for `set_and_log_cache`
         """
         if key:
+            value = QueryCacheManager.encode_df(value)
             set_and_log_cache(_cache[region], key, value, timeout, datasource_uid)
 
+    @staticmethod
+    def encode_df(value: dict[str, Any]) -> dict[str, Any]:
+        """
+        Encode the dataframe of a cache value with the configured codec.
+
+        The encoded dataframe is stored under `df_encoded`, with the name of the codec
+        under `df_codec`; dataframes the codec can't represent are stored as-is.
+        """
+        codec: DataFrameCodec | None = current_app.config["DATA_CACHE_DATAFRAME_CODEC"]
+        df = value.get("df")
+        if codec is None or not isinstance(df, DataFrame):
+            return value
+
+        try:
+            encoded = codec.encode(df)
+        except DataFrameCodecEncodeError as ex:
+            logger.debug("Storing dataframe without codec: %s", ex.message)
+            return value
+
+        value = {key: val for key, val in value.items() if key != "df"}
+        value["df_encoded"] = encoded
+        value["df_codec"] = codec.name
+        return value
+
+    @staticmethod
+    def decode_df(cache_value: dict[str, Any]) -> DataFrame:
+        """
+        Return the dataframe of a cache value, decoding it if needed.
+
+        :param cache_value: the value read from the cache
+        :returns: the cached dataframe
+        """
+        if "df_encoded" not in cache_value:
+            return cache_value["df"]
+
+        codec = DATAFRAME_CODECS[cache_value["df_codec"]]
+        return codec.decode(cache_value["df_encoded"])
+
     @staticmethod
     def delete(
         key: str | None,
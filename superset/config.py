@@ -70,6 +70,7 @@ if TYPE_CHECKING:
     from flask_appbuilder.security.sqla import models
     from sqlglot import Dialect, Dialects  # pylint: disable=disallowed-sql-import
 
+    from superset.common.utils.dataframe_codec import DataFrameCodec
     from superset.connectors.sqla.models import SqlaTable
     from superset.models.core import Database
     from superset.models.dashboard import Dashboard
@@ -957,6 +958,49 @@ CACHE_CONFIG: CacheConfig = {"CACHE_TYPE": "NullCache"}
 # Cache for datasource metadata and query results
 DATA_CACHE_CONFIG: CacheConfig = {"CACHE_TYPE": "NullCache"}
 
+# Codec used to store the dataframes of query results in the data cache. By default
+# the `pd.DataFrame` is stored as-is and pickled by the cache backend. The Arrow codec
+# stores it as an Arrow IPC stream instead, optionally compressed with "lz4" or "zstd",
+# which is smaller and faster to load.
+# Dataframes that can't be represented in Arrow without changes are stored as-is.
+# Example:
+#   from superset.common.utils.dataframe_codec import ArrowDataFrameCodec
+#   DATA_CACHE_DATAFRAME_CODEC = ArrowDataFrameCodec(compression="zstd")
+DATA_CACHE_DATAFRAME_CODEC: DataFrameCodec | None = None
+
+# Timeout, in seconds, of the raw results of chart queries in the data cache. When set,
+# the result of the SQL is cached before post-processing, keyed on the compiled SQL,
+# the database and the RLS scope, and the post-processing is applied on top of it.
+# Charts that run the same SQL but pivot, roll or rename the results differently then
+# share a single cached result, and changing the post-processing of a chart in
+# Explore doesn't query the database again. The post-processed results are still
+# cached with the cache timeout of the chart. Set to 0 to disable the raw results tier.
+DATA_CACHE_RAW_RESULTS_TIMEOUT = 0
+
+# Maximum time, in seconds, a chart data request waits for an identical query that
+# another request is already running, eg, when many users open a dashboard right after
+# its cache expired. The first request runs the query while holding a distributed lock
+# in the metadata database, and the other requests read its result from the data cache
+# instead of running the same SQL. They run the query themselves when the wait times
+# out or the first request fails. The lock expires after the same time. Requires a
+# data cache; set to 0 to disable.
+DATA_QUERY_SINGLE_FLIGHT_TIMEOUT = 0
+
+# Time, in seconds, during which the expired results of chart data queries are still
+# served while they're refreshed in the background, so that the first user after the
+# cache timeout doesn't wait for the queries. Stale results are marked with `is_stale`
+# in the chart data response, and they're refreshed on the Celery workers with the
+# `load_chart_data_into_cache` task, once at a time per chart data request. Can be
+# overridden with the `stale_while_revalidate` key of the `extra` attributes of a
+# dataset, and of the params of a chart. Set to 0 to disable.
+DATA_CACHE_STALE_WHILE_REVALIDATE = 0
+
+# Minimum cache timeout, in seconds, of the results of time comparison queries whose
+# time range lies fully in the past (eg, "1 year ago"). The data of closed windows
+# doesn't change, so these are kept longer than the chart's own cache timeout. Set to
+# 0 to use the cache timeout of the chart.
+TIME_OFFSET_PAST_CACHE_TIMEOUT = int(timedelta(days=1).total_seconds())
+
 # Cache for dashboard filter state. `CACHE_TYPE` defaults to `SupersetMetastoreCache`
 # that stores the values in the key-value table in the Superset metastore, as it's
 # required for Superset to operate correctly, but can be replaced by any
@@ -985,6 +1029,25 @@ EXPLORE_FORM_DATA_CACHE_CONFIG: CacheConfig = {
     "CODEC": JsonKeyValueCodec(),
 }
 
+# Cache for the catalogs, schemas, tables and table metadata of databases, shown in
+# the SQL Lab schema browser and the dataset editor. When enabled, they're served from
+# this cache instead of being reflected from the database on each request, and the
+# response includes when they were last refreshed. Use "SupersetMetastoreCache" to
+# store them in the metadata database, or a shared backend like "RedisCache", and
+# schedule the "metadata_catalog.refresh" task (see CeleryConfig.beat_schedule) to
+# keep them up to date. Databases that impersonate users or use OAuth2 are not cached.
+# Example:
+#   METADATA_CATALOG_CACHE_CONFIG = {
+#       "CACHE_TYPE": "SupersetMetastoreCache",
+#       "CACHE_DEFAULT_TIMEOUT": int(timedelta(days=7).total_seconds()),
+#       "CODEC": JsonKeyValueCodec(),
+#   }
+METADATA_CATALOG_CACHE_CONFIG: CacheConfig = {"CACHE_TYPE": "NullCache"}
+
+# Entries of the metadata catalog older than this are refreshed by the
+# "metadata_catalog.refresh" task
+METADATA_CATALOG_REFRESH_INTERVAL = int(timedelta(hours=1).total_seconds())
+
 # store cache keys by datasource UID (via CacheKey) for custom processing/invalidation
 STORE_CACHE_KEYS_IN_METADATA_DB = False
 
@@ -1040,17 +1103,31 @@ ALLOWED_EXTENSIONS = {*EXCEL_EXTENSIONS, *CSV_EXTENSIONS, *COLUMNAR_EXTENSIONS}
 # note: index option should not be overridden
 CSV_EXPORT = {"encoding": "utf-8-sig"}
 
-# CSV Streaming: row threshold for using streaming CSV exports
+# CSV Streaming: row threshold for using streaming CSV and JSON responses
 # When row count >= this threshold, use streaming response instead of loading
 # all data into memory. Streaming provides real-time progress and handles
 # large datasets efficiently.
 CSV_STREAMING_ROW_THRESHOLD = 100000
 
+# JSON Streaming: chart data JSON responses with at least
+# CSV_STREAMING_ROW_THRESHOLD rows are written in batches of this many rows,
+# instead of being serialized into a single string.
+JSON_STREAMING_CHUNK_SIZE = 5000
+
 # Excel Options: key/value pairs that will be passed as argument to DataFrame.to_excel
 # method.
 # note: index option should not be overridden
 EXCEL_EXPORT: dict[str, Any] = {}
 
+# Parquet Options: key/value pairs that will be passed as argument to
+# pyarrow.parquet.ParquetWriter, eg, {"compression": "zstd"}
+PARQUET_EXPORT: dict[str, Any] = {"compression": "zstd"}
+
+# Arrow Options: key/value pairs that will be passed as argument to
+# pyarrow.ipc.IpcWriteOptions when exporting Arrow IPC streams, eg,
+# {"compression": "lz4"}
+ARROW_EXPORT: dict[str, Any] = {}
+
 # ---------------------------------------------------
 # Time grain configurations
 # ---------------------------------------------------
@@ -1169,6 +1246,12 @@ DATASET_AUTO_DETECT_DATETIME_FORMATS = True
 # Sample size for datetime format detection
 DATETIME_FORMAT_DETECTION_SAMPLE_SIZE = 1000
 
+# Bulk refresh of the datasets of a database (PUT /api/v1/dataset/refresh)
+# Maximum number of schemas reflected in parallel
+DATASET_BULK_REFRESH_MAX_WORKERS = 4
+# Number of refreshed datasets flushed to the metadata database at once
+DATASET_BULK_REFRESH_BATCH_SIZE = 100
+
 # The limit for the Superset Meta DB when the feature flag ENABLE_SUPERSET_META_DB is on
 SUPERSET_META_DB_LIMIT: int | None = 1000
 
@@ -1217,6 +1300,7 @@ class CeleryConfig:  # pylint: disable=too-few-public-methods
         "superset.tasks.thumbnails",
         "superset.tasks.cache",
         "superset.tasks.slack",
+        "superset.tasks.metadata_catalog",
     )
     result_backend = "db+sqlite:///celery_results.sqlite"
     worker_prefetch_multiplier = 1
@@ -1253,6 +1337,12 @@ class CeleryConfig:  # pylint: disable=too-few-public-methods
         #     "task": "slack.cache_channels",
         #     "schedule": crontab(minute="0", hour="*"),
         # },
+        # Uncomment to keep the metadata catalog up to date
+        # (see METADATA_CATALOG_CACHE_CONFIG)
+        # "metadata_catalog.refresh": {
+        #     "task": "metadata_catalog.refresh",
+        #     "schedule": crontab(minute="*/10", hour="*"),
+        # },
     }
 
 
@@ -1434,6 +1524,17 @@ JINJA_CONTEXT_ADDONS: dict[str, Callable[..., Any]] = {}
 # basis. Example value = `{"presto": CustomPrestoTemplateProcessor}`
 CUSTOM_TEMPLATE_PROCESSORS: dict[str, type[BaseTemplateProcessor]] = {}
 
+# Row level security filters are cached for the duration of a request. When set, they
+# are also cached in the CACHE_CONFIG cache for this many seconds, keyed on the roles
+# of the user and the table. Changes to RLS filters made through the ORM invalidate
+# the cached filters.
+RLS_FILTERS_CACHE_TIMEOUT = 0
+
+# Maximum number of compiled Jinja templates kept in memory by each worker, keyed on
+# the template processor and the template source. Templates are compiled once and
+# bound to the environment of each processor when rendered. Set to 0 to disable.
+JINJA_TEMPLATE_CACHE_SIZE = 1000
+
 # Roles that are controlled by the API / Superset and should not be changed
 # by humans.
 ROBOT_PERMISSION_ROLES = ["Public", "Gamma", "Alpha", "Admin", "sql_lab"]
@@ -1506,6 +1607,13 @@ TRACKING_URL_TRANSFORMER = lambda url: url  # noqa: E731
 # customize the polling time of each engine
 DB_POLL_INTERVAL_SECONDS: dict[str, int] = {}
 
+# Running queries are first polled every DB_POLL_INITIAL_INTERVAL_SECONDS, then
+# the interval is multiplied by DB_POLL_BACKOFF_FACTOR after each poll until it
+# reaches the polling time of the engine (see DB_POLL_INTERVAL_SECONDS and
+# PRESTO_POLL_INTERVAL). Set the factor to 1 to always poll at the initial interval.
+DB_POLL_INITIAL_INTERVAL_SECONDS = 0.1
+DB_POLL_BACKOFF_FACTOR = 2
+
 # Interval between consecutive polls when using Presto Engine
 # See here: https://github.com/dropbox/PyHive/blob/8eb0aeab8ca300f3024655419b93dad926c1a351/pyhive/presto.py#L93  # noqa: E501
 PRESTO_POLL_INTERVAL = int(timedelta(seconds=1).total_seconds())
@@ -1558,6 +1666,40 @@ ENGINE_CONTEXT_MANAGER = engine_context_manager
 # as such `create_engine(url, **params)`
 DB_CONNECTION_MUTATOR = None
 
+# By default a new SQLAlchemy engine using `NullPool` is created every time an
+# analytics database is used, which means a new connection for every query. When the
+# engine registry is enabled, engines are kept in a per-process LRU registry, keyed on
+# the effective connection URL and parameters (after impersonation, OAuth2 and
+# `DB_CONNECTION_MUTATOR`), and connections are pooled. Databases that define a
+# `poolclass` in their `engine_params` keep it, and databases connected through an
+# SSH tunnel are never pooled. Engines are disposed when the database is updated.
+DB_ENGINE_REGISTRY_ENABLED = False
+# Maximum number of engines kept per process; the least recently used is disposed
+DB_ENGINE_REGISTRY_MAX_ENGINES = 50
+# Parameters passed to `create_engine` for the `QueuePool` of each registered engine
+DB_ENGINE_REGISTRY_POOL_PARAMS: dict[str, Any] = {
+    "pool_size": 5,
+    "max_overflow": 10,
+    "pool_recycle": 3600,
+    "pool_pre_ping": True,
+}
+
+# Maximum number of queries a single chart data request runs concurrently against a
+# database, eg, the queries of a mixed chart or of a table with totals, or the time
+# comparison queries of a chart with several time offsets.
+# Queries are compiled in the thread of the request, and executed on a thread pool that
+# carries the app context and the logged in user.
+# Set to 1 to run them sequentially; the limit can be overridden per database with
+# the `query_concurrency` key in the database `extra` attributes.
+DATA_QUERY_CONCURRENCY = 1
+
+# Compute the cumulative sums that follow a pivot in the post-processing of chart
+# queries, eg, the cumulative option of the advanced analytics of timeseries charts,
+# with window functions in the database instead of in pandas. Only applies to
+# databases whose engine spec allows subqueries and window functions, when the result
+# is the same as in pandas; the rest of the post-processing still runs in pandas.
+POST_PROCESSING_PUSHDOWN = False
+
 
 # A callable that is invoked for every invocation of DB Engine Specs
 # which allows for custom validation of the engine URI.
@@ -2085,11 +2227,30 @@ GLOBAL_ASYNC_QUERIES_JWT_COOKIE_SAMESITE: None | (Literal["None", "Lax", "Strict
 )
 GLOBAL_ASYNC_QUERIES_JWT_COOKIE_DOMAIN = None
 GLOBAL_ASYNC_QUERIES_JWT_SECRET = "test-secret-change-me"  # noqa: S105
-GLOBAL_ASYNC_QUERIES_TRANSPORT: Literal["polling", "ws"] = "polling"
+# How clients receive async events:
+# - "polling": clients poll /api/v1/async_event/
+# - "ws": clients connect to the websocket server at GLOBAL_ASYNC_QUERIES_WEBSOCKET_URL,
+#   which reads the firehose stream (only written to with this transport)
+# - "sse": clients keep a Server-Sent Events connection to
+#   /api/v1/async_event/stream open, which blocks on the Redis stream of their
+#   channel. Each open connection holds a web server worker and a Redis connection,
+#   so the web server should use async workers (eg, gunicorn with gevent).
+GLOBAL_ASYNC_QUERIES_TRANSPORT: Literal["polling", "ws", "sse"] = "polling"
 GLOBAL_ASYNC_QUERIES_POLLING_DELAY = int(
     timedelta(milliseconds=500).total_seconds() * 1000
 )
 GLOBAL_ASYNC_QUERIES_WEBSOCKET_URL = "ws://127.0.0.1:8080/"
+# Time, in seconds, after which a heartbeat is sent on an idle Server-Sent Events
+# connection, and after which the connection is closed for the client to reconnect
+GLOBAL_ASYNC_QUERIES_SSE_HEARTBEAT_INTERVAL = 15
+GLOBAL_ASYNC_QUERIES_SSE_CONNECTION_TIMEOUT = 300
+# Time, in seconds, during which a chart data job is shared with the identical chart
+# data requests submitted while it's queued or running, ie, the requests whose queries
+# have the same cache keys, which include the RLS filters of the user. They don't
+# enqueue another job, and their clients are notified on their own channel when the
+# job completes. Should cover the time jobs spend queued and running. Set to 0 to
+# disable.
+GLOBAL_ASYNC_QUERIES_JOB_COALESCING_TIMEOUT = 0
 
 # Global async queries cache backend configuration options:
 # - Set 'CACHE_TYPE' to 'RedisCache' for RedisCacheBackend.
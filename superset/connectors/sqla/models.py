@@ -58,6 +58,7 @@ from sqlalchemy.orm import (
     reconstructor,
     relationship,
     RelationshipProperty,
+    Session,
 )
 from sqlalchemy.orm.mapper import Mapper
 from sqlalchemy.schema import UniqueConstraint
@@ -69,14 +70,17 @@ from sqlalchemy.types import JSON
 from superset_core.api.models import Dataset as CoreDataset
 
 from superset import db, is_feature_enabled, security_manager
-from superset.commands.dataset.exceptions import DatasetNotFoundError
 from superset.common.db_query_status import QueryStatus
 from superset.connectors.sqla.utils import (
     get_columns_description,
     get_physical_table_metadata,
     get_virtual_table_metadata,
 )
-from superset.db_engine_specs.base import BaseEngineSpec, TimestampExpression
+from superset.db_engine_specs.base import (
+    BaseEngineSpec,
+    MetricType,
+    TimestampExpression,
+)
 from superset.exceptions import (
     ColumnNotFoundException,
     DatasetInvalidPermissionEvaluationException,
@@ -119,6 +123,9 @@ metadata = Model.metadata  # pylint: disable=no-member
 logger = logging.getLogger(__name__)
 VIRTUAL_TABLE_ALIAS = "virtual_table"
 
+# set on a session whose transaction changes RLS filters
+RLS_FILTERS_CHANGED_SESSION_KEY = "rls_filters_changed"
+
 # a non-exhaustive set of additive metrics
 ADDITIVE_METRIC_TYPES = {
     "count",
@@ -510,22 +517,10 @@ class BaseDatasource(
                 if "column" in filter_config
             )
 
-            # for legacy dashboard imports which have the wrong query_context in them
-            try:
-                query_context = slc.get_query_context()
-            except DatasetNotFoundError:
-                query_context = None
-
             # legacy charts don't have query_context charts
-            if query_context:
-                column_names.update(
-                    [
-                        utils.get_column_name(column_)
-                        for query in query_context.queries
-                        for column_ in query.columns
-                    ]
-                    or []
-                )
+            query_context_column_names = slc.get_query_context_column_names()
+            if query_context_column_names is not None:
+                column_names.update(query_context_column_names)
             else:
                 _columns = [
                     (
@@ -1706,18 +1701,21 @@ class SqlaTable(
 
         return or_(*groups)
 
-    def query(self, query_obj: QueryObjectDict) -> QueryResult:
+    def query(self, query_obj: QueryObjectDict, force: bool = False) -> QueryResult:
         """
-        Executes the query for SqlaTable with additional column ordering logic.
-
-        This overrides ExploreMixin.query() to add SqlaTable-specific behavior
-        for handling column_order from extras.
+        Executes the query, see ExploreMixin.query().
         """
-        # Get the base result from ExploreMixin
-        # (explicitly, not super() which would hit BaseDatasource first)
-        result = ExploreMixin.query(self, query_obj)
+        # explicitly, not super() which would hit BaseDatasource first
+        return ExploreMixin.query(self, query_obj, force=force)
 
-        # Apply SqlaTable-specific column ordering
+    def postprocess_query_result(
+        self,
+        query_obj: QueryObjectDict,
+        result: QueryResult,
+    ) -> QueryResult:
+        """
+        Reorder the columns of the result following `column_order` from extras.
+        """
         extras = query_obj.get("extras", {})
         column_order = extras.get("column_order")
         if column_order and isinstance(column_order, list) and not result.df.empty:
@@ -1746,18 +1744,13 @@ class SqlaTable(
         :return: Tuple with lists of added, removed and modified column names.
         """
         new_columns = self.external_metadata()
-        metrics = [
-            SqlMetric(**metric)
-            for metric in self.database.get_metrics(
-                Table(
-                    self.table_name,
-                    self.schema or None,
-                    self.catalog,
-                )
+        metrics = self.database.get_metrics(
+            Table(
+                self.table_name,
+                self.schema or None,
+                self.catalog,
             )
-        ]
-        any_date_col = None
-        db_engine_spec = self.db_engine_spec
+        )
 
         # If no `self.id`, then this is a new table, no need to fetch columns
         # from db.  Passing in `self.id` to query will actually automatically
@@ -1772,15 +1765,31 @@ class SqlaTable(
             else self.columns
         )
 
+        return self.merge_metadata(new_columns, metrics, old_columns)
+
+    def merge_metadata(
+        self,
+        new_columns: list[ResultSetColumnType],
+        metrics: list[MetricType],
+        old_columns: list[TableColumn],
+    ) -> MetadataResult:
+        """
+        Merges metadata fetched from the database into the table
+
+        :param new_columns: the columns from the database
+        :param metrics: the default metrics from the database
+        :param old_columns: the current columns of the table
+        :return: Tuple with lists of added, removed and modified column names.
+        """
+        any_date_col = None
+        db_engine_spec = self.db_engine_spec
+
         old_columns_by_name: dict[str, TableColumn] = {
             col.column_name: col for col in old_columns
         }
+        new_column_names = {col["column_name"] for col in new_columns}
         results = MetadataResult(
-            removed=[
-                col
-                for col in old_columns_by_name
-                if col not in {col["column_name"] for col in new_columns}
-            ]
+            removed=[col for col in old_columns_by_name if col not in new_column_names]
         )
 
         # clear old columns before adding modified columns back
@@ -1820,7 +1829,7 @@ class SqlaTable(
 
         if not self.main_dttm_col:
             self.main_dttm_col = any_date_col
-        self.add_missing_metrics(metrics)
+        self.add_missing_metrics([SqlMetric(**metric) for metric in metrics])
 
         # Apply config supplied mutations.
         current_app.config["SQLA_TABLE_MUTATOR"](self)
@@ -2095,3 +2104,47 @@ class RowLevelSecurityFilter(Model, AuditMixinNullable):
         backref="row_level_security_filters",
     )
     clause = Column(utils.MediumText(), nullable=False)
+
+    @staticmethod
+    def after_change(
+        mapper: Mapper,
+        connection: Connection,
+        target: RowLevelSecurityFilter,
+    ) -> None:
+        """
+        Mark the session, so that the cached RLS filters are invalidated once the
+        change is committed.
+
+        Invalidating them at flush time would let other requests cache the filters
+        again before the change is visible to them.
+        """
+        if session := sa.inspect(target).session:
+            session.info[RLS_FILTERS_CHANGED_SESSION_KEY] = True
+
+    @staticmethod
+    def after_commit(session: Session) -> None:
+        """
+        Invalidate the cached RLS filters if the committed transaction changed them
+        """
+        if session.info.pop(RLS_FILTERS_CHANGED_SESSION_KEY, False):
+            security_manager.invalidate_rls_filters_cache()
+
+    @staticmethod
+    def after_rollback(session: Session) -> None:
+        """
+        Forget the changes of a transaction that was rolled back
+        """
+        session.info.pop(RLS_FILTERS_CHANGED_SESSION_KEY, None)
+
+
+sa.event.listen(
+    RowLevelSecurityFilter, "after_insert", RowLevelSecurityFilter.after_change
+)
+sa.event.listen(
+    RowLevelSecurityFilter, "after_update", RowLevelSecurityFilter.after_change
+)
+sa.event.listen(
+    RowLevelSecurityFilter, "after_delete", RowLevelSecurityFilter.after_change
+)
+sa.event.listen(Session, "after_commit", RowLevelSecurityFilter.after_commit)
+sa.event.listen(Session, "after_rollback", RowLevelSecurityFilter.after_rollback)
@@ -53,14 +53,26 @@ def get_physical_table_metadata(
     normalize_columns: bool,
 ) -> list[ResultSetColumnType]:
     """Use SQLAlchemy inspector to get table metadata"""
-    db_engine_spec = database.db_engine_spec
-    db_dialect = database.get_dialect()
-
     # Table does not exist or is not visible to a connection.
     if not (database.has_table(table) or database.has_view(table)):
         raise NoSuchTableError(table)
 
-    cols = database.get_columns(table)
+    return convert_physical_columns(
+        database=database,
+        cols=database.get_columns(table),
+        normalize_columns=normalize_columns,
+    )
+
+
+def convert_physical_columns(
+    database: Database,
+    cols: list[ResultSetColumnType],
+    normalize_columns: bool,
+) -> list[ResultSetColumnType]:
+    """Convert the columns returned by the inspector to Superset column types"""
+    db_engine_spec = database.db_engine_spec
+    db_dialect = database.get_dialect()
+
     for col in cols:
         try:
             if isinstance(col["type"], TypeEngine):
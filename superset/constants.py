@@ -121,6 +121,7 @@ MODEL_VIEW_RW_METHOD_PERMISSION_MAP = {
 
 MODEL_API_RW_METHOD_PERMISSION_MAP = {
     "bulk_delete": "write",
+    "bulk_refresh": "write",
     "delete": "write",
     "distinct": "read",
     "get": "read",
@@ -152,6 +153,7 @@ MODEL_API_RW_METHOD_PERMISSION_MAP = {
     "data_from_cache": "read",
     "get_charts": "read",
     "get_datasets": "read",
+    "get_bootstrap": "read",
     "get_tabs": "read",
     "function_names": "read",
     "available": "read",
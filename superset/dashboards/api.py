@@ -38,7 +38,7 @@ from marshmallow import ValidationError
 from werkzeug.wrappers import Response as WerkzeugResponse
 from werkzeug.wsgi import FileWrapper
 
-from superset import db
+from superset import db, security_manager
 from superset.charts.schemas import ChartEntityResponseSchema
 from superset.commands.dashboard.copy import CopyDashboardCommand
 from superset.commands.dashboard.create import CreateDashboardCommand
@@ -109,7 +109,7 @@ from superset.dashboards.schemas import (
     thumbnail_query_schema,
 )
 from superset.exceptions import ScreenshotImageNotAvailableException
-from superset.extensions import event_logger
+from superset.extensions import cache_manager, event_logger
 from superset.models.dashboard import Dashboard
 from superset.models.embedded_dashboard import EmbeddedDashboard
 from superset.security.guest_token import GuestUser
@@ -119,6 +119,7 @@ from superset.tasks.thumbnails import (
 )
 from superset.tasks.utils import get_current_user
 from superset.utils import json
+from superset.utils.cache import generate_cache_key
 from superset.utils.core import parse_boolean_string
 from superset.utils.file import get_filename
 from superset.utils.pdf import build_pdf_from_screenshots
@@ -228,6 +229,7 @@ class DashboardRestApi(CustomTagsOptimizationMixin, BaseSupersetModelRestApi):
         "remove_favorite",
         "get_charts",
         "get_datasets",
+        "get_bootstrap",
         "get_tabs",
         "get_embedded",
         "set_embedded",
@@ -534,6 +536,114 @@ class DashboardRestApi(CustomTagsOptimizationMixin, BaseSupersetModelRestApi):
         except (TypeError, ValueError) as err:
             raise DatasetValidationError(err) from err
 
+    @expose("/<id_or_slug>/bootstrap", methods=("GET",))
+    @protect()
+    @handle_api_exception
+    @statsd_metrics
+    @with_dashboard
+    @event_logger.log_this_with_extra_payload
+    def get_bootstrap(
+        self,
+        dash: Dashboard,
+        add_extra_log_payload: Callable[..., None] = lambda **kwargs: None,
+    ) -> Response:
+        """Get a dashboard with its charts and datasets.
+        ---
+        get:
+          summary: Get a dashboard with its charts and datasets
+          description: >-
+            Returns everything needed to render a dashboard in a single request:
+            the dashboard, its chart definitions, and its datasets with only the
+            information necessary to render the charts. The charts and datasets
+            are cached until the dashboard, one of its charts or one of its
+            datasets changes. The response has an ETag, and conditional requests
+            are supported.
+          parameters:
+          - in: path
+            schema:
+              type: string
+            name: id_or_slug
+            description: Either the id of the dashboard, or its slug
+          responses:
+            200:
+              description: Dashboard, chart and dataset definitions
+              content:
+                application/json:
+                  schema:
+                    type: object
+                    properties:
+                      result:
+                        type: object
+                        properties:
+                          dashboard:
+                            $ref: '#/components/schemas/DashboardGetResponseSchema'
+                          charts:
+                            type: array
+                            items:
+                              $ref: '#/components/schemas/ChartEntityResponseSchema'
+                          datasets:
+                            type: array
+                            items:
+                              $ref: '#/components/schemas/DashboardDatasetSchema'
+            304:
+              description: Dashboard, chart and dataset definitions not modified
+            400:
+              $ref: '#/components/responses/400'
+            401:
+              $ref: '#/components/responses/401'
+            403:
+              $ref: '#/components/responses/403'
+            404:
+              $ref: '#/components/responses/404'
+        """
+        changed_on = max(
+            DashboardDAO.get_dashboard_and_slices_changed_on(dash),
+            DashboardDAO.get_dashboard_and_datasets_changed_on(dash),
+        )
+        cache_key = generate_cache_key(
+            {
+                "dashboard_id": dash.id,
+                "changed_on": changed_on.isoformat(),
+                "roles": sorted(
+                    role.name for role in security_manager.get_user_roles()
+                ),
+                "version": repr(self),
+            },
+            key_prefix="dashboard_bootstrap_",
+        )
+        # the dashboard itself is cheap to serialize, and depends on the user
+        payload = cache_manager.cache.get(cache_key)
+        if payload is None:
+            try:
+                payload = {
+                    "charts": [
+                        self.chart_entity_response_schema.dump(chart)
+                        for chart in dash.slices
+                    ],
+                    "datasets": [
+                        self.dashboard_dataset_schema.dump(dataset)
+                        for dataset in dash.datasets_trimmed_for_slices()
+                    ],
+                }
+            except (TypeError, ValueError) as err:
+                raise DatasetValidationError(err) from err
+            cache_manager.cache.set(cache_key, payload)
+
+        add_extra_log_payload(
+            dashboard_id=dash.id, action=f"{self.__class__.__name__}.get_bootstrap"
+        )
+        response = self.response(
+            200,
+            result={
+                "dashboard": self.dashboard_get_response_schema.dump(dash),
+                **payload,
+            },
+        )
+        response.last_modified = changed_on
+        response.cache_control.no_cache = True
+        response.add_etag()
+        return response.make_conditional(request)
+
     @expose("/<id_or_slug>/tabs", methods=("GET",))
     @protect()
     @safe
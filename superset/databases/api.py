@@ -79,8 +79,10 @@ from superset.commands.importers.exceptions import (
 from superset.commands.importers.v1.utils import get_contents_from_bundle
 from superset.constants import MODEL_API_RW_METHOD_PERMISSION_MAP, RouteMethod
 from superset.daos.database import DatabaseDAO
+from superset.databases import metadata_catalog
 from superset.databases.decorators import check_table_access
 from superset.databases.filters import DatabaseFilter, DatabaseUploadEnabledFilter
+from superset.databases.metadata_catalog import MetadataKind
 from superset.databases.schemas import (
     CatalogsResponseSchema,
     database_catalogs_query_schema,
@@ -717,16 +719,26 @@ class DatabaseRestApi(BaseSupersetModelRestApi):
         if not database:
             return self.response_404()
         try:
-            catalogs = database.get_all_catalog_names(
-                cache=database.catalog_cache_enabled,
-                cache_timeout=database.catalog_cache_timeout or None,
-                force=kwargs["rison"].get("force", False),
-            )
+            catalog_info: dict[str, Any] = {}
+            if metadata_catalog.is_enabled(database):
+                entry = metadata_catalog.get_metadata(
+                    database,
+                    MetadataKind.CATALOGS,
+                    force=kwargs["rison"].get("force", False),
+                )
+                catalogs = set(entry.value)
+                catalog_info["last_refreshed"] = entry.refreshed_at.isoformat()
+            else:
+                catalogs = database.get_all_catalog_names(
+                    cache=database.catalog_cache_enabled,
+                    cache_timeout=database.catalog_cache_timeout or None,
+                    force=kwargs["rison"].get("force", False),
+                )
             catalogs = security_manager.get_catalogs_accessible_by_user(
                 database,
                 catalogs,
             )
-            return self.response(200, result=list(catalogs))
+            return self.response(200, result=list(catalogs), **catalog_info)
         except OperationalError:
             return self.response(
                 500,
@@ -784,12 +796,23 @@ class DatabaseRestApi(BaseSupersetModelRestApi):
         try:
             params = kwargs["rison"]
             catalog = params.get("catalog")
-            schemas = database.get_all_schema_names(
-                catalog=catalog,
-                cache=database.schema_cache_enabled,
-                cache_timeout=database.schema_cache_timeout or None,
-                force=params.get("force", False),
-            )
+            catalog_info: dict[str, Any] = {}
+            if metadata_catalog.is_enabled(database):
+                entry = metadata_catalog.get_metadata(
+                    database,
+                    MetadataKind.SCHEMAS,
+                    catalog=catalog or database.get_default_catalog(),
+                    force=params.get("force", False),
+                )
+                schemas = set(entry.value)
+                catalog_info["last_refreshed"] = entry.refreshed_at.isoformat()
+            else:
+                schemas = database.get_all_schema_names(
+                    catalog=catalog,
+                    cache=database.schema_cache_enabled,
+                    cache_timeout=database.schema_cache_timeout or None,
+                    force=params.get("force", False),
+                )
             schemas = security_manager.get_schemas_accessible_by_user(
                 database,
                 catalog,
@@ -810,8 +833,9 @@ class DatabaseRestApi(BaseSupersetModelRestApi):
                             for schema in schemas
                             if schema.lower() in allowed_schemas
                         ],
+                        **catalog_info,
                     )
-            return self.response(200, result=list(schemas))
+            return self.response(200, result=list(schemas), **catalog_info)
         except OperationalError:
             return self.response(
                 500, message="There was an error connecting to the database"
@@ -857,6 +881,13 @@ class DatabaseRestApi(BaseSupersetModelRestApi):
                     properties:
                       count:
                         type: integer
+                      last_refreshed:
+                        description: >-
+                          When the tables were last read from the database, if
+                          they're served from the metadata catalog
+                        type: string
+                        format: date-time
+                        nullable: true
                       result:
                         description: >-
                           A List of tables for given database
@@ -935,7 +966,22 @@ class DatabaseRestApi(BaseSupersetModelRestApi):
         """
         self.incr_stats("init", self.table_metadata_deprecated.__name__)
         try:
-            table_info = get_table_metadata(database, Table(table_name, schema_name))
+            if metadata_catalog.is_enabled(database):
+                entry = metadata_catalog.get_metadata(
+                    database,
+                    MetadataKind.TABLE_METADATA,
+                    catalog=database.get_default_catalog(),
+                    schema=schema_name,
+                    table=table_name,
+                )
+                table_info = {
+                    **entry.value,
+                    "last_refreshed": entry.refreshed_at.isoformat(),
+                }
+            else:
+                table_info = get_table_metadata(
+                    database, Table(table_name, schema_name)
+                )
         except SQLAlchemyError as ex:
             self.incr_stats("error", self.table_metadata_deprecated.__name__)
             return self.response_422(error_msg_from_exception(ex))
@@ -1086,7 +1132,20 @@ class DatabaseRestApi(BaseSupersetModelRestApi):
             # instead of raising 403, raise 404 to hide table existence
             raise TableNotFoundException("No such table") from ex
 
-        payload = database.db_engine_spec.get_table_metadata(database, table)
+        if metadata_catalog.is_enabled(database):
+            entry = metadata_catalog.get_metadata(
+                database,
+                MetadataKind.TABLE_METADATA,
+                catalog=table.catalog or database.get_default_catalog(),
+                schema=table.schema,
+                table=table.table,
+            )
+            payload = {
+                **entry.value,
+                "last_refreshed": entry.refreshed_at.isoformat(),
+            }
+        else:
+            payload = database.db_engine_spec.get_table_metadata(database, table)
 
         return self.response(200, **payload)
 
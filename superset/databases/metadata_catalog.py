@@ -0,0 +1,323 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+"""
+A persistent catalog of the catalogs, schemas, tables and columns of databases.
+
+Entries are stored in the cache configured with ``METADATA_CATALOG_CACHE_CONFIG``,
+together with the time they were reflected. They are served from there without
+reaching the database, and kept up to date in the background by the
+``metadata_catalog.refresh`` Celery task. The database is only reflected during a
+request when an entry is missing, or when a refresh is forced.
+"""
+
+from __future__ import annotations
+
+import logging
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from itertools import chain
+from typing import Any, Callable, Optional, TYPE_CHECKING
+
+from flask import current_app
+from flask_caching.backends import NullCache
+
+from superset.extensions import cache_manager
+from superset.sql.parse import Table
+from superset.utils.backports import StrEnum
+
+if TYPE_CHECKING:
+    from superset.models.core import Database
+
+logger = logging.getLogger(__name__)
+
+
+class MetadataKind(StrEnum):
+    CATALOGS = "catalogs"
+    SCHEMAS = "schemas"
+    TABLES = "tables"
+    TABLE_METADATA = "table_metadata"
+
+
+@dataclass
+class MetadataEntry:
+    value: Any
+    refreshed_at: datetime
+
+
+def _reflect_catalogs(  # pylint: disable=unused-argument
+    database: Database,
+    entry_key: tuple[str | None, ...],
+) -> Any:
+    return sorted(database.get_all_catalog_names(cache=False))
+
+
+def _reflect_schemas(database: Database, entry_key: tuple[str | None, ...]) -> Any:
+    catalog, *_ = entry_key
+    return sorted(database.get_all_schema_names(catalog=catalog, cache=False))
+
+
+def _reflect_tables(database: Database, entry_key: tuple[str | None, ...]) -> Any:
+    catalog, schema, _ = entry_key
+    assert schema is not None
+    return {
+        "tables": sorted(
+            table
+            for table, *_ in database.get_all_table_names_in_schema(
+                catalog=catalog,
+                schema=schema,
+                cache=False,
+            )
+        ),
+        "views": sorted(
+            view
+            for view, *_ in database.get_all_view_names_in_schema(
+                catalog=catalog,
+                schema=schema,
+                cache=False,
+            )
+        ),
+        "materialized_views": sorted(
+            view.table
+            for view in database.get_all_materialized_view_names_in_schema(
+                catalog=catalog,
+                schema=schema,
+                cache=False,
+            )
+        ),
+    }
+
+
+def _reflect_table_metadata(
+    database: Database,
+    entry_key: tuple[str | None, ...],
+) -> Any:
+    catalog, schema, table = entry_key
+    assert table is not None
+    return database.db_engine_spec.get_table_metadata(
+        database,
+        Table(table, schema, catalog),
+    )
+
+
+REFLECTORS: dict[MetadataKind, Callable[[Database, tuple[str | None, ...]], Any]] = {
+    MetadataKind.CATALOGS: _reflect_catalogs,
+    MetadataKind.SCHEMAS: _reflect_schemas,
+    MetadataKind.TABLES: _reflect_tables,
+    MetadataKind.TABLE_METADATA: _reflect_table_metadata,
+}
+
+
+def _get_cache_key(
+    database_id: int,
+    kind: MetadataKind,
+    entry_key: tuple[str | None, ...],
+) -> str:
+    catalog, schema, table = entry_key
+    return f"metadata_catalog:db:{database_id}:{kind}:{catalog}:{schema}:{table}"
+
+
+def is_enabled(database: Database) -> bool:
+    """
+    Return whether the metadata of a database is served from the catalog.
+
+    Databases that impersonate users or use OAuth2 can return different metadata for
+    each user, so they're never stored in the shared catalog.
+    """
+    return not (
+        isinstance(cache_manager.metadata_catalog_cache.cache, NullCache)
+        or database.impersonate_user
+        or database.is_oauth2_enabled()
+    )
+
+
+def get_metadata(  # pylint: disable=too-many-arguments
+    database: Database,
+    kind: MetadataKind,
+    catalog: Optional[str] = None,
+    schema: Optional[str] = None,
+    table: Optional[str] = None,
+    force: bool = False,
+) -> MetadataEntry:
+    """
+    Return the metadata of a database from the catalog.
+
+    The database is only reflected when the entry is missing or ``force`` is set.
+
+    :param database: the database
+    :param kind: the kind of metadata
+    :param catalog: the catalog, for schemas, tables and table metadata
+    :param schema: the schema, for tables and table metadata
+    :param table: the table, for table metadata
+    :param force: whether to reflect the database even if the entry exists
+    :returns: the metadata and when it was reflected
+    """
+    entry_key = (catalog, schema, table)
+    if not force:
+        cached = cache_manager.metadata_catalog_cache.get(
+            _get_cache_key(database.id, kind, entry_key)
+        )
+        if cached is not None:
+            return MetadataEntry(
+                value=cached["value"],
+                refreshed_at=datetime.fromisoformat(cached["refreshed_at"]),
+            )
+
+    return refresh_metadata(database, kind, entry_key)
+
+
+def refresh_metadata(
+    database: Database,
+    kind: MetadataKind,
+    entry_key: tuple[str | None, ...],
+) -> MetadataEntry:
+    """
+    Reflect the metadata of a database and store it in the catalog.
+
+    :param database: the database
+    :param kind: the kind of metadata
+    :param entry_key: the catalog, schema and table of the entry
+    :returns: the metadata and when it was reflected
+    """
+    entry = MetadataEntry(
+        value=REFLECTORS[kind](database, entry_key),
+        refreshed_at=datetime.now(timezone.utc),
+    )
+    try:
+        cache_manager.metadata_catalog_cache.set(
+            _get_cache_key(database.id, kind, entry_key),
+            {"value": entry.value, "refreshed_at": entry.refreshed_at.isoformat()},
+        )
+    except Exception:  # pylint: disable=broad-except
+        logger.warning(
+            "Failed to store the %s of database %s in the metadata catalog",
+            kind,
+            database.id,
+            exc_info=True,
+        )
+
+    return entry
+
+
+def refresh_database(database: Database) -> int:
+    """
+    Refresh the stale entries of a database in the catalog.
+
+    The catalog is walked from the top, from the catalogs to the schemas of each
+    catalog, the tables of each schema and the metadata of each table, so that no
+    shared list of entries has to be kept up to date by concurrent requests. Entries
+    reflected more than ``METADATA_CATALOG_REFRESH_INTERVAL`` seconds ago are reflected
+    again, and entries missing from the cache are skipped, so that only metadata that
+    was requested is kept. The catalogs and the schemas of the default catalog are
+    always stored, so that the schema browser never has to wait for them.
+
+    :param database: the database
+    :returns: the number of refreshed entries
+    """
+    cache = cache_manager.metadata_catalog_cache
+    stale_before = datetime.now(timezone.utc) - timedelta(
+        seconds=current_app.config["METADATA_CATALOG_REFRESH_INTERVAL"]
+    )
+    refreshed = 0
+
+    def refresh(
+        kind: MetadataKind,
+        entry_keys: list[tuple[str | None, ...]],
+        required: bool = False,
+    ) -> list[tuple[tuple[str | None, ...], Any]]:
+        """
+        Refresh the stale entries among the given ones, and return the values of the
+        entries in the catalog.
+        """
+        nonlocal refreshed
+        if not entry_keys:
+            return []
+
+        values = []
+        cached_entries = cache.get_many(
+            *[_get_cache_key(database.id, kind, entry_key) for entry_key in entry_keys]
+        )
+        for entry_key, cached in zip(entry_keys, cached_entries, strict=True):
+            if cached is None and not required:
+                continue
+            if (
+                cached is not None
+                and datetime.fromisoformat(cached["refreshed_at"]) > stale_before
+            ):
+                values.append((entry_key, cached["value"]))
+                continue
+
+            try:
+                entry = refresh_metadata(database, kind, entry_key)
+            except Exception:  # pylint: disable=broad-except
+                logger.warning(
+                    "Failed to refresh the %s of database %s (%s)",
+                    kind,
+                    database.id,
+                    entry_key,
+                    exc_info=True,
+                )
+                if cached is not None:
+                    values.append((entry_key, cached["value"]))
+                continue
+
+            refreshed += 1
+            values.append((entry_key, entry.value))
+
+        return values
+
+    default_catalog = database.get_default_catalog()
+    other_catalogs: list[str] = []
+    if database.db_engine_spec.supports_catalog:
+        for _, catalogs in refresh(
+            MetadataKind.CATALOGS,
+            [(None, None, None)],
+            required=True,
+        ):
+            other_catalogs = [
+                catalog for catalog in catalogs if catalog != default_catalog
+            ]
+
+    schemas = refresh(
+        MetadataKind.SCHEMAS,
+        [(default_catalog, None, None)],
+        required=True,
+    ) + refresh(
+        MetadataKind.SCHEMAS,
+        [(catalog, None, None) for catalog in other_catalogs],
+    )
+    tables = refresh(
+        MetadataKind.TABLES,
+        [
+            (catalog, schema, None)
+            for (catalog, *_), schema_names in schemas
+            for schema in schema_names
+        ],
+    )
+    refresh(
+        MetadataKind.TABLE_METADATA,
+        [
+            (catalog, schema, table)
+            for (catalog, schema, _), names in tables
+            for table in chain(
+                names["tables"],
+                names["views"],
+                names["materialized_views"],
+            )
+        ],
+    )
+
+    return refreshed
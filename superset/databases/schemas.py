@@ -726,12 +726,26 @@ class TableMetadataResponseSchema(Schema):
         metadata={"description": "Primary keys metadata"},
     )
     selectStar = fields.String(metadata={"description": "SQL select star"})  # noqa: N815
+    last_refreshed = fields.DateTime(
+        allow_none=True,
+        metadata={
+            "description": "When the columns were last read from the database, if "
+            "they're served from the metadata catalog"
+        },
+    )
 
 
 class TableExtraMetadataResponseSchema(Schema):
     metadata = fields.Dict()
     partitions = fields.Dict()
     clustering = fields.Dict()
+    last_refreshed = fields.DateTime(
+        allow_none=True,
+        metadata={
+            "description": "When the table metadata was last read from the database, "
+            "if it's served from the metadata catalog"
+        },
+    )
 
 
 class SelectStarResponseSchema(Schema):
@@ -742,12 +756,26 @@ class SchemasResponseSchema(Schema):
     result = fields.List(
         fields.String(metadata={"description": "A database schema name"})
     )
+    last_refreshed = fields.DateTime(
+        allow_none=True,
+        metadata={
+            "description": "When the schemas were last read from the database, if "
+            "they're served from the metadata catalog"
+        },
+    )
 
 
 class CatalogsResponseSchema(Schema):
     result = fields.List(
         fields.String(metadata={"description": "A database catalog name"})
     )
+    last_refreshed = fields.DateTime(
+        allow_none=True,
+        metadata={
+            "description": "When the catalogs were last read from the database, if "
+            "they're served from the metadata catalog"
+        },
+    )
 
 
 class DatabaseTablesResponse(Schema):
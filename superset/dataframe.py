@@ -19,7 +19,14 @@
 import logging
 from typing import Any
 
+import numpy as np
 import pandas as pd
+from pandas.api.types import (
+    infer_dtype,
+    is_bool_dtype,
+    is_integer_dtype,
+    is_object_dtype,
+)
 
 from superset.utils.core import JS_MAX_INTEGER
 
@@ -34,13 +41,56 @@ def _convert_big_integers(val: Any) -> Any:
     :returns: the same value but recast as a string if it was an integer over
         ``JS_MAX_INTEGER``
     """
-    return str(val) if isinstance(val, int) and abs(val) > JS_MAX_INTEGER else val
+    return str(val) if _is_big_integer(val) else val
+
+
+def _is_big_integer(val: Any) -> bool:
+    return isinstance(val, (int, np.integer)) and abs(int(val)) > JS_MAX_INTEGER
+
+
+def _get_big_integer_mask(series: pd.Series) -> np.ndarray | None:
+    """
+    Find the integers larger than ``JS_MAX_INTEGER`` in a column.
+
+    Integer columns are checked with vectorized comparisons. Object columns are
+    only inspected when they can hold integers: if they hold nothing else the
+    magnitude is checked as floats (which is exact around ``JS_MAX_INTEGER``),
+    otherwise value by value.
+
+    :param series: the column to check
+    :returns: a boolean mask of the values to convert, or ``None`` if there are none
+    """
+    if is_bool_dtype(series.dtype):
+        return None
+
+    if is_integer_dtype(series.dtype):
+        mask = (series > JS_MAX_INTEGER) | (series < -JS_MAX_INTEGER)
+    elif is_object_dtype(series.dtype):
+        inferred_type = infer_dtype(series, skipna=True)
+        if inferred_type == "integer":
+            try:
+                values = series.to_numpy(dtype="float64", na_value=np.nan)
+                mask = pd.Series(np.abs(values) > JS_MAX_INTEGER)
+            except OverflowError:
+                mask = series.map(_is_big_integer)
+        elif inferred_type in {"mixed-integer", "mixed-integer-float", "mixed"}:
+            mask = series.map(_is_big_integer)
+        else:
+            return None
+    else:
+        return None
+
+    mask_array = mask.fillna(False).to_numpy(dtype=bool)
+    return mask_array if mask_array.any() else None
 
 
 def df_to_records(dframe: pd.DataFrame) -> list[dict[str, Any]]:
     """
     Convert a DataFrame to a set of records.
 
+    Integers over ``JS_MAX_INTEGER`` are cast to strings, so they're not rounded by
+    JavaScript clients; only the columns that hold such values are copied.
+
     :param dframe: the DataFrame to convert
     :returns: a list of dictionaries reflecting each single row of the DataFrame
     """
@@ -48,10 +98,17 @@ def df_to_records(dframe: pd.DataFrame) -> list[dict[str, Any]]:
         logger.warning(
             "DataFrame columns are not unique, some columns will be omitted."
         )
-    records = dframe.to_dict(orient="records")
 
-    for record in records:
-        for key in record:
-            record[key] = _convert_big_integers(record[key])
+    converted = None
+    for i in range(len(dframe.columns)):
+        series = dframe.iloc[:, i]
+        if (mask := _get_big_integer_mask(series)) is None:
+            continue
+
+        series = series.astype(object)
+        series[mask] = series[mask].map(str)
+        if converted is None:
+            converted = dframe.copy(deep=False)
+        converted.isetitem(i, series)
 
-    return records
+    return (dframe if converted is None else converted).to_dict(orient="records")
@@ -50,7 +50,10 @@ from superset.commands.dataset.exceptions import (
 )
 from superset.commands.dataset.export import ExportDatasetsCommand
 from superset.commands.dataset.importers.dispatcher import ImportDatasetsCommand
-from superset.commands.dataset.refresh import RefreshDatasetCommand
+from superset.commands.dataset.refresh import (
+    BulkRefreshDatasetsCommand,
+    RefreshDatasetCommand,
+)
 from superset.commands.dataset.update import UpdateDatasetCommand
 from superset.commands.dataset.warm_up_cache import DatasetWarmUpCacheCommand
 from superset.commands.exceptions import CommandException
@@ -63,6 +66,8 @@ from superset.daos.dataset import DatasetDAO
 from superset.databases.filters import DatabaseFilter
 from superset.datasets.filters import DatasetCertifiedFilter, DatasetIsNullOrEmptyFilter
 from superset.datasets.schemas import (
+    DatasetBulkRefreshRequestSchema,
+    DatasetBulkRefreshResponseSchema,
     DatasetCacheWarmUpRequestSchema,
     DatasetCacheWarmUpResponseSchema,
     DatasetDrillInfoSchema,
@@ -112,6 +117,7 @@ class DatasetRestApi(BaseSupersetModelRestApi):
         RouteMethod.DISTINCT,
         "bulk_delete",
         "refresh",
+        "bulk_refresh",
         "related_objects",
         "duplicate",
         "get_or_create_dataset",
@@ -298,6 +304,8 @@ class DatasetRestApi(BaseSupersetModelRestApi):
         "get_export_ids_schema": get_export_ids_schema,
     }
     openapi_spec_component_schemas = (
+        DatasetBulkRefreshRequestSchema,
+        DatasetBulkRefreshResponseSchema,
         DatasetCacheWarmUpRequestSchema,
         DatasetCacheWarmUpResponseSchema,
         DatasetRelatedObjectsResponse,
@@ -705,6 +713,69 @@ class DatasetRestApi(BaseSupersetModelRestApi):
             )
             return self.response_422(message=str(ex))
 
+    @expose("/refresh", methods=("PUT",))
+    @protect()
+    @safe
+    @statsd_metrics
+    @event_logger.log_this_with_context(
+        action=lambda self, *args, **kwargs: f"{self.__class__.__name__}.bulk_refresh",
+        log_to_statsd=False,
+    )
+    def bulk_refresh(self) -> Response:
+        """Refresh and update columns of all the physical datasets of a database.
+        ---
+        put:
+          summary: Refresh and update columns of the datasets of a database
+          description: >-
+            Refreshes the columns of all the physical datasets of a database, or of
+            some of its schemas. The tables of each schema are reflected together.
+          requestBody:
+            description: The database, and optionally the catalog and schemas
+            required: true
+            content:
+              application/json:
+                schema:
+                  $ref: "#/components/schemas/DatasetBulkRefreshRequestSchema"
+          responses:
+            200:
+              description: The refreshed datasets and the ones that failed
+              content:
+                application/json:
+                  schema:
+                    $ref: "#/components/schemas/DatasetBulkRefreshResponseSchema"
+            400:
+              $ref: '#/components/responses/400'
+            401:
+              $ref: '#/components/responses/401'
+            404:
+              $ref: '#/components/responses/404'
+            422:
+              $ref: '#/components/responses/422'
+            500:
+              $ref: '#/components/responses/500'
+        """
+        try:
+            body = DatasetBulkRefreshRequestSchema().load(request.json)
+        except ValidationError as error:
+            return self.response_400(message=error.messages)
+        try:
+            result = BulkRefreshDatasetsCommand(
+                body["database_id"],
+                body.get("catalog"),
+                body.get("schemas"),
+            ).run()
+            return self.response(200, result=result)
+        except DatasetRefreshFailedError as ex:
+            logger.error(
+                "Error refreshing datasets %s: %s",
+                self.__class__.__name__,
+                str(ex),
+                exc_info=True,
+            )
+            return self.response_422(message=str(ex))
+        except CommandException as ex:
+            return self.response(ex.status, message=ex.message)
+
     @expose("/<pk>/detect_datetime_formats", methods=("POST",))
     @protect()
     @safe
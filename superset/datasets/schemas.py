@@ -360,6 +360,39 @@ class GetOrCreateDatasetSchema(Schema):
     always_filter_main_dttm = fields.Boolean(load_default=False)
 
 
+class DatasetBulkRefreshRequestSchema(Schema):
+    database_id = fields.Integer(
+        required=True,
+        metadata={"description": "The ID of the database of the datasets to refresh"},
+    )
+    catalog = fields.String(
+        allow_none=True,
+        metadata={"description": "Only refresh the datasets in this catalog"},
+    )
+    schemas = fields.List(
+        fields.String(),
+        metadata={"description": "Only refresh the datasets in these schemas"},
+    )
+
+
+class DatasetBulkRefreshResultSchema(Schema):
+    refreshed = fields.List(
+        fields.Integer(),
+        metadata={"description": "The IDs of the refreshed datasets"},
+    )
+    failed = fields.List(
+        fields.Integer(),
+        metadata={
+            "description": "The IDs of the datasets that couldn't be refreshed, "
+            "because the table is missing or the user doesn't own them"
+        },
+    )
+
+
+class DatasetBulkRefreshResponseSchema(Schema):
+    result = fields.Nested(DatasetBulkRefreshResultSchema)
+
+
 class DatasetCacheWarmUpRequestSchema(Schema):
     db_name = fields.String(
         required=True,
@@ -21,6 +21,7 @@ from __future__ import annotations
 import logging
 import re
 import warnings
+from collections.abc import Iterator
 from datetime import datetime
 from inspect import signature
 from re import Match, Pattern
@@ -53,6 +54,7 @@ from sqlalchemy.engine.base import Engine
 from sqlalchemy.engine.interfaces import Compiled, Dialect
 from sqlalchemy.engine.reflection import Inspector
 from sqlalchemy.engine.url import URL
+from sqlalchemy.exc import NoSuchTableError
 from sqlalchemy.ext.compiler import compiles
 from sqlalchemy.sql import literal_column, quoted_name, text
 from sqlalchemy.sql.expression import BinaryExpression, ColumnClause, Select, TextClause
@@ -354,6 +356,10 @@ class BaseEngineSpec:  # pylint: disable=too-many-public-methods
     allows_sql_comments = True
     allows_escaped_colons = True
 
+    # Whether aggregate functions can be used as window functions, eg,
+    # `SUM(x) OVER (PARTITION BY y ORDER BY z)`
+    allows_window_functions = True
+
     # Whether ORDER BY clause can use aliases created in SELECT
     # that are the same as a source column
     allows_alias_to_source_column = True
@@ -1280,6 +1286,24 @@ class BaseEngineSpec:  # pylint: disable=too-many-public-methods
         else:
             raise ValueError(f"Invalid comparison filter operator: {op}")
 
+    @classmethod
+    def get_poll_intervals(cls, max_interval: float) -> Iterator[float]:
+        """
+        Return the intervals to wait between consecutive polls of a running query.
+
+        Polling starts fast, so short queries are picked up as soon as they finish,
+        and backs off exponentially up to ``max_interval`` so long running queries
+        don't keep hitting the database and the metadata database.
+
+        :param max_interval: the longest interval between two polls, in seconds
+        :returns: an infinite generator of intervals, in seconds
+        """
+        interval = min(app.config["DB_POLL_INITIAL_INTERVAL_SECONDS"], max_interval)
+        factor = max(app.config["DB_POLL_BACKOFF_FACTOR"], 1)
+        while True:
+            yield interval
+            interval = min(interval * factor, max_interval)
+
     @classmethod
     def handle_cursor(cls, cursor: Any, query: Query) -> None:
         """Handle a live cursor between the execute and fetchall calls
@@ -1595,6 +1619,63 @@ class BaseEngineSpec:  # pylint: disable=too-many-public-methods
             )
         )
 
+    @classmethod
+    def get_multi_columns(
+        cls,
+        inspector: Inspector,
+        table_names: list[str],
+        schema: str | None = None,
+        catalog: str | None = None,
+        options: dict[str, Any] | None = None,
+    ) -> dict[str, list[ResultSetColumnType]]:
+        """
+        Get the columns of several tables from the same schema.
+
+        When the inspector can reflect a whole schema in one pass (SQLAlchemy 2.0
+        ``get_multi_columns``) and the engine spec doesn't customize ``get_columns``
+        it's used, otherwise the tables are reflected one by one with the same
+        inspector. Tables that don't exist are left out of the result.
+
+        :param inspector: SqlAlchemy Inspector instance
+        :param table_names: the names of the tables
+        :param schema: the schema of the tables
+        :param catalog: the catalog of the tables
+        :param options: Extra options to customise the display of columns in
+                        some databases
+        :return: All columns, by table name
+        """
+        if (
+            hasattr(inspector, "get_multi_columns")
+            and cls.get_columns.__func__  # type: ignore
+            is BaseEngineSpec.get_columns.__func__  # type: ignore
+        ):
+            # pylint: disable=import-outside-toplevel
+            from sqlalchemy.engine import ObjectKind  # only in SQLAlchemy 2.0
+
+            multi_columns = inspector.get_multi_columns(
+                schema=schema,
+                filter_names=table_names,
+                kind=ObjectKind.ANY,
+            )
+            return {
+                table_name: convert_inspector_columns(
+                    cast(list[SQLAColumnType], columns)
+                )
+                for (_, table_name), columns in multi_columns.items()
+            }
+
+        columns = {}
+        for table_name in table_names:
+            try:
+                columns[table_name] = cls.get_columns(
+                    inspector,
+                    Table(table_name, schema, catalog),
+                    options,
+                )
+            except NoSuchTableError:
+                logger.warning("Table %s.%s not found", schema, table_name)
+        return columns
+
     @classmethod
     def get_metrics(  # pylint: disable=unused-argument
         cls,
@@ -45,6 +45,7 @@ class DruidEngineSpec(BaseEngineSpec):
     engine_name = "Apache Druid"
     allows_joins = is_feature_enabled("DRUID_JOINS")
     allows_subqueries = True
+    allows_window_functions = False
 
     _time_grain_expressions = {
         None: "{col}",
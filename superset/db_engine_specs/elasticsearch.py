@@ -38,6 +38,7 @@ class ElasticSearchEngineSpec(BaseEngineSpec):  # pylint: disable=abstract-metho
     time_groupby_inline = True
     allows_joins = False
     allows_subqueries = True
+    allows_window_functions = False
     allows_sql_comments = False
 
     _date_trunc_functions = {
@@ -104,6 +105,7 @@ class OpenDistroEngineSpec(BaseEngineSpec):  # pylint: disable=abstract-method
     time_groupby_inline = True
     allows_joins = False
     allows_subqueries = True
+    allows_window_functions = False
     allows_sql_comments = False
 
     _time_grain_expressions = {
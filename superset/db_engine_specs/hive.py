@@ -348,6 +348,15 @@ class HiveEngineSpec(PrestoEngineSpec):
             hive.ttypes.TOperationState.INITIALIZED_STATE,
             hive.ttypes.TOperationState.RUNNING_STATE,
         )
+        if sleep_interval := app.config.get("HIVE_POLL_INTERVAL"):
+            logger.warning(
+                "HIVE_POLL_INTERVAL is deprecated and will be removed in 3.0. "
+                "Please use DB_POLL_INTERVAL_SECONDS instead"
+            )
+        else:
+            sleep_interval = app.config["DB_POLL_INTERVAL_SECONDS"].get(cls.engine, 5)
+        poll_intervals = cls.get_poll_intervals(sleep_interval)
+
         polled = cursor.poll()
         last_log_line = 0
         tracking_url = None
@@ -401,16 +410,7 @@ class HiveEngineSpec(PrestoEngineSpec):
                     last_log_line = len(log_lines)
                 if needs_commit:
                     db.session.commit()  # pylint: disable=consider-using-transaction
-            if sleep_interval := app.config.get("HIVE_POLL_INTERVAL"):
-                logger.warning(
-                    "HIVE_POLL_INTERVAL is deprecated and will be removed in 3.0. "
-                    "Please use DB_POLL_INTERVAL_SECONDS instead"
-                )
-            else:
-                sleep_interval = app.config["DB_POLL_INTERVAL_SECONDS"].get(
-                    cls.engine, 5
-                )
-            time.sleep(sleep_interval)
+            time.sleep(next(poll_intervals))
             polled = cursor.poll()
 
     @classmethod
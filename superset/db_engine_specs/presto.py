@@ -19,6 +19,7 @@ from __future__ import annotations
 
 import contextlib
 import logging
+import math
 import re
 import time
 from abc import ABCMeta
@@ -1329,6 +1330,7 @@ class PrestoEngineSpec(PrestoBaseEngineSpec):
         poll_interval = query.database.connect_args.get(
             "poll_interval", app.config["PRESTO_POLL_INTERVAL"]
         )
+        poll_intervals = cls.get_poll_intervals(poll_interval)
         logger.info("Query %i: Polling the cursor for progress", query_id)
         polled = cursor.poll()
         # poll returns dict -- JSON status information or ``None``
@@ -1354,16 +1356,18 @@ class PrestoEngineSpec(PrestoBaseEngineSpec):
                 completed_splits = float(stats.get("completedSplits"))
                 total_splits = float(stats.get("totalSplits"))
                 if total_splits and completed_splits:
-                    progress = 100 * (completed_splits / total_splits)
+                    progress = math.floor(100 * (completed_splits / total_splits))
                     logger.info(
                         "Query %s progress: %s / %s splits",
                         query_id,
                         completed_splits,
                         total_splits,
                     )
-                    query.progress = max(query.progress, progress)
-                    db.session.commit()
-            time.sleep(poll_interval)
+                    # only write to the metadata database when the percentage moves
+                    if progress > (query.progress or 0):
+                        query.progress = progress
+                        db.session.commit()
+            time.sleep(next(poll_intervals))
             logger.info("Query %i: Polling the cursor for progress", query_id)
             polled = cursor.poll()
 
@@ -198,6 +198,7 @@ class TrinoEngineSpec(PrestoBaseEngineSpec):
         state = "QUEUED"
         progress = 0.0
         poll_interval = app.config["DB_POLL_INTERVAL_SECONDS"].get(cls.engine, 1)
+        poll_intervals = cls.get_poll_intervals(poll_interval)
         max_wait_time = app.config.get("SQLLAB_ASYNC_TIME_LIMIT_SEC", 21600)
         start_time = time.time()
         while state not in terminal_states:
@@ -235,7 +236,12 @@ class TrinoEngineSpec(PrestoBaseEngineSpec):
                 query.progress = progress
                 db.session.commit()  # pylint: disable=consider-using-transaction
 
-            time.sleep(poll_interval)
+            # wake up as soon as the execute thread is done instead of sleeping
+            # through the whole interval
+            if execute_event is not None:
+                execute_event.wait(next(poll_intervals))
+            else:
+                time.sleep(next(poll_intervals))
 
     @classmethod
     def execute_with_cursor(
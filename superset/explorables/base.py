@@ -23,7 +23,7 @@ including SQL datasets, saved queries, and semantic layer views.
 
 from __future__ import annotations
 
-from collections.abc import Hashable
+from collections.abc import Callable, Hashable
 from datetime import datetime
 from typing import Any, Protocol, runtime_checkable, TYPE_CHECKING, TypedDict
 
@@ -72,7 +72,13 @@ class Explorable(Protocol):
     # Core Query Interface
     # =========================================================================
 
-    def get_query_result(self, query_object: QueryObject) -> QueryResult:
+    def get_query_result(
+        self,
+        query_object: QueryObject,
+        force: bool = False,
+        cache_key_fn: Callable[[QueryObject, str, Any], str | None] | None = None,
+        cache_timeout_fn: Callable[[], int] | None = None,
+    ) -> QueryResult:
         """
         Execute a query and return results.
 
@@ -81,6 +87,12 @@ class Explorable(Protocol):
         etc.) and returns a QueryResult containing a pandas DataFrame with the results.
 
         :param query_obj: QueryObject describing the query
+        :param force: Whether to bypass any result cached by the explorable
+        :param cache_key_fn: Optional function returning the cache key of an
+            intermediate query (eg, a time comparison), given its query object, a
+            label and the time grain, so its results can be cached
+        :param cache_timeout_fn: Optional function returning the cache timeout of the
+            intermediate queries
 
         :return: QueryResult containing:
             - df: pandas DataFrame with query results
@@ -0,0 +1,214 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+"""
+A process-wide registry of long-lived SQLAlchemy engines for analytics databases.
+
+By default Superset creates a new ``NullPool`` engine every time a database is used,
+so every query pays for a full connection handshake. When the registry is enabled,
+engines are cached per database and per *effective* connection parameters (after the
+catalog/schema adjustments, user impersonation, OAuth2 and ``DB_CONNECTION_MUTATOR``
+have been applied), so that connections are pooled and reused safely across users.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+import os
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Any, Callable, Optional
+
+from flask import Flask
+from sqlalchemy.engine import Engine
+from sqlalchemy.engine.url import URL
+from sqlalchemy.pool import QueuePool
+
+from superset.utils import json
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class EngineRegistryEntry:
+    database_id: int
+    masked_url: str
+    engine: Engine
+    hits: int = field(default=0)
+
+
+class EngineRegistry:
+    """
+    LRU registry of pooled SQLAlchemy engines.
+
+    Engines are keyed on the database ID, the fully rendered connection URL and the
+    engine keyword arguments, so two users that end up with different connection
+    parameters (eg, when impersonation is enabled) never share a pool. Evicted and
+    invalidated engines are disposed, closing their idle connections.
+    """
+
+    def __init__(self) -> None:
+        self._enabled = False
+        self._max_engines = 0
+        self._pool_params: dict[str, Any] = {}
+        self._engines: OrderedDict[str, EngineRegistryEntry] = OrderedDict()
+        self._lock = threading.RLock()
+        self._pid = os.getpid()
+
+    def init_app(self, app: Flask) -> None:
+        self.clear()
+        self._enabled = app.config["DB_ENGINE_REGISTRY_ENABLED"]
+        self._max_engines = app.config["DB_ENGINE_REGISTRY_MAX_ENGINES"]
+        self._pool_params = app.config["DB_ENGINE_REGISTRY_POOL_PARAMS"]
+
+    @property
+    def is_enabled(self) -> bool:
+        return self._enabled
+
+    def apply_pool_params(self, engine_kwargs: dict[str, Any]) -> None:
+        """
+        Set the default pool parameters, unless the database defines its own pool.
+        """
+        if "poolclass" in engine_kwargs:
+            return
+
+        engine_kwargs["poolclass"] = QueuePool
+        for key, value in self._pool_params.items():
+            engine_kwargs.setdefault(key, value)
+
+    @staticmethod
+    def get_key(database_id: int, url: URL, engine_kwargs: dict[str, Any]) -> str:
+        payload = json.dumps(
+            {
+                "database_id": database_id,
+                "url": url.render_as_string(hide_password=False),
+                "engine_kwargs": engine_kwargs,
+            },
+            sort_keys=True,
+            default=repr,
+        )
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def get_engine(
+        self,
+        database_id: int,
+        url: URL,
+        engine_kwargs: dict[str, Any],
+        create_engine: Callable[..., Engine],
+    ) -> Engine:
+        """
+        Return a cached engine for the parameters, creating it if needed.
+
+        :param database_id: the ID of the ``Database`` model
+        :param url: the effective SQLAlchemy URL
+        :param engine_kwargs: the effective keyword arguments for ``create_engine``
+        :param create_engine: the factory used to build new engines
+        :return: a pooled SQLAlchemy engine
+        """
+        key = self.get_key(database_id, url, engine_kwargs)
+
+        with self._lock:
+            self._check_pid()
+
+            if entry := self._engines.get(key):
+                self._engines.move_to_end(key)
+                entry.hits += 1
+                return entry.engine
+
+            engine = create_engine(url, **engine_kwargs)
+            self._engines[key] = EngineRegistryEntry(
+                database_id=database_id,
+                masked_url=url.render_as_string(hide_password=True),
+                engine=engine,
+            )
+            while len(self._engines) > self._max_engines:
+                _, evicted = self._engines.popitem(last=False)
+                logger.debug(
+                    "Evicting engine for database %s from the registry",
+                    evicted.database_id,
+                )
+                evicted.engine.dispose()
+
+            return engine
+
+    def invalidate(self, database_id: int) -> None:
+        """
+        Dispose all engines of a given database, eg, when its connection changes.
+        """
+        with self._lock:
+            for key in [
+                key
+                for key, entry in self._engines.items()
+                if entry.database_id == database_id
+            ]:
+                self._engines.pop(key).engine.dispose()
+
+    def clear(self) -> None:
+        with self._lock:
+            while self._engines:
+                _, entry = self._engines.popitem()
+                entry.engine.dispose()
+
+    def get_stats(self, database_id: Optional[int] = None) -> list[dict[str, Any]]:
+        """
+        Return the pool statistics of the cached engines.
+
+        :param database_id: if set, only return the engines of this database
+        :return: one dictionary per engine, with the masked URL and pool counters
+        """
+        stats = []
+        with self._lock:
+            for entry in self._engines.values():
+                if database_id is not None and entry.database_id != database_id:
+                    continue
+
+                pool = entry.engine.pool
+                stats.append(
+                    {
+                        "database_id": entry.database_id,
+                        "url": entry.masked_url,
+                        "hits": entry.hits,
+                        "pool": pool.status(),
+                        "size": pool.size() if isinstance(pool, QueuePool) else None,
+                        "checked_out": (
+                            pool.checkedout() if isinstance(pool, QueuePool) else None
+                        ),
+                        "overflow": (
+                            pool.overflow() if isinstance(pool, QueuePool) else None
+                        ),
+                    }
+                )
+
+        return stats
+
+    def _check_pid(self) -> None:
+        """
+        Drop engines inherited from a parent process.
+
+        Pooled connections must never be shared across a fork (eg, gunicorn or Celery
+        workers forked after the app was loaded), so the child starts with an empty
+        registry without closing the parent's connections.
+        """
+        if (pid := os.getpid()) != self._pid:
+            for entry in self._engines.values():
+                entry.engine.dispose(close=False)
+            self._engines.clear()
+            self._pid = pid
+
+    def __len__(self) -> int:
+        return len(self._engines)
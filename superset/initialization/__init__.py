@@ -49,6 +49,7 @@ from superset.extensions import (
     csrf,
     db,
     encrypted_field_factory,
+    engine_registry,
     feature_flag_manager,
     machine_auth_provider_factory,
     manifest_processor,
@@ -584,6 +585,7 @@ class SupersetAppInitializer:  # pylint: disable=too-many-public-methods
         self.configure_auth_provider()
         self.configure_async_queries()
         self.configure_ssh_manager()
+        self.configure_engine_registry()
         self.configure_stats_manager()
 
         # Hook that provides administrators a handle on the Flask APP
@@ -753,6 +755,9 @@ class SupersetAppInitializer:  # pylint: disable=too-many-public-methods
     def configure_ssh_manager(self) -> None:
         ssh_manager_factory.init_app(self.superset_app)
 
+    def configure_engine_registry(self) -> None:
+        engine_registry.init_app(self.superset_app)
+
     def configure_stats_manager(self) -> None:
         stats_logger_manager.init_app(self.superset_app)
 
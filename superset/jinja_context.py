@@ -20,16 +20,26 @@ from __future__ import annotations
 
 import logging
 import re
+import threading
+from collections import OrderedDict
 from dataclasses import dataclass
 from datetime import datetime
 from functools import lru_cache, partial
-from typing import Any, Callable, cast, TYPE_CHECKING, TypedDict, Union
+from types import CodeType
+from typing import Any, Callable, cast, ClassVar, TYPE_CHECKING, TypedDict, Union
 
 import dateutil
 from flask import current_app, g, has_request_context, request
 from flask_babel import gettext as _
-from jinja2 import DebugUndefined, Environment, TemplateSyntaxError, UndefinedError
+from jinja2 import (
+    DebugUndefined,
+    Environment,
+    Template,
+    TemplateSyntaxError,
+    UndefinedError,
+)
 from jinja2.exceptions import SecurityError
+from jinja2.lexer import newline_re
 from jinja2.sandbox import SandboxedEnvironment
 from sqlalchemy.engine.interfaces import Dialect
 from sqlalchemy.sql.expression import bindparam
@@ -657,6 +667,13 @@ class BaseTemplateProcessor:
 
     engine: str | None = None
 
+    # compiled templates, shared by all the processors and keyed on the processor
+    # class, since the generated code depends on the filters of the environment
+    _compiled_templates: ClassVar[OrderedDict[tuple[Any, ...], CodeType]] = (
+        OrderedDict()
+    )
+    _compiled_templates_lock: ClassVar[threading.Lock] = threading.Lock()
+
     # pylint: disable=too-many-arguments
     def __init__(
         self,
@@ -684,7 +701,9 @@ class BaseTemplateProcessor:
         self.set_context(**kwargs)
 
         # custom filters
-        self.env.filters["where_in"] = WhereInMacro(database.get_dialect())
+        dialect = database.get_dialect()
+        self._dialect_name = getattr(dialect, "name", None)
+        self.env.filters["where_in"] = WhereInMacro(dialect)
         self.env.filters["to_datetime"] = to_datetime
 
     def set_context(self, **kwargs: Any) -> None:
@@ -697,6 +716,63 @@ class BaseTemplateProcessor:
         """
         return self._context.copy()
 
+    def has_template_syntax(self, sql: str) -> bool:
+        """
+        Returns whether the SQL has any Jinja delimiter, ie, needs to be rendered.
+        """
+        return any(
+            delimiter in sql
+            for delimiter in (
+                self.env.block_start_string,
+                self.env.variable_start_string,
+                self.env.comment_start_string,
+            )
+        ) or bool(self.env.line_statement_prefix or self.env.line_comment_prefix)
+
+    def render_plain(self, sql: str) -> str:
+        """
+        Returns what rendering SQL without any Jinja syntax would return, ie, with
+        normalized newlines and without a single trailing newline.
+        """
+        lines = newline_re.split(sql)[::2]
+        if not self.env.keep_trailing_newline and lines[-1] == "":
+            del lines[-1]
+        return self.env.newline_sequence.join(lines)
+
+    def get_template(self, sql: str) -> Template:
+        """
+        Returns a template bound to the environment of the processor.
+
+        The code of the template is compiled once and kept in a bounded LRU cache,
+        keyed on the processor class, the environment class, the engine, the
+        dialect and the template source. The dialect is part of the key because
+        Jinja evaluates filters with constant arguments at compile time, and the
+        ``where_in`` filter depends on it.
+        """
+        max_size = current_app.config["JINJA_TEMPLATE_CACHE_SIZE"]
+        if max_size <= 0:
+            return self.env.from_string(sql)
+
+        key = (type(self), type(self.env), self.engine, self._dialect_name, sql)
+        with self._compiled_templates_lock:
+            code = self._compiled_templates.get(key)
+            if code is not None:
+                self._compiled_templates.move_to_end(key)
+
+        if code is None:
+            code = self.env.compile(sql)
+            with self._compiled_templates_lock:
+                self._compiled_templates[key] = code
+                while len(self._compiled_templates) > max_size:
+                    self._compiled_templates.popitem(last=False)
+
+        return self.env.template_class.from_code(
+            self.env,
+            code,
+            self.env.make_globals(None),
+            None,
+        )
+
     def process_template(self, sql: str, **kwargs: Any) -> str:
         """Processes a sql template
 
@@ -704,8 +780,11 @@ class BaseTemplateProcessor:
         >>> process_template(sql)
         "SELECT '2017-01-01T00:00:00'"
         """
+        if not self.has_template_syntax(sql):
+            return self.render_plain(sql)
+
         try:
-            template = self.env.from_string(sql)
+            template = self.get_template(sql)
         except (
             TemplateSyntaxError,
             SecurityError,
@@ -941,7 +1020,10 @@ class SparkTemplateProcessor(HiveTemplateProcessor):
     engine = "spark"
 
     def process_template(self, sql: str, **kwargs: Any) -> str:
-        template = self.env.from_string(sql)
+        if not self.has_template_syntax(sql):
+            return self.render_plain(sql)
+
+        template = self.get_template(sql)
         kwargs.update(self._context)
 
         # Backwards compatibility if migrating from Hive.
@@ -954,7 +1036,10 @@ class TrinoTemplateProcessor(PrestoTemplateProcessor):
     engine = "trino"
 
     def process_template(self, sql: str, **kwargs: Any) -> str:
-        template = self.env.from_string(sql)
+        if not self.has_template_syntax(sql):
+            return self.render_plain(sql)
+
+        template = self.get_template(sql)
         kwargs.update(self._context)
 
         # Backwards compatibility if migrating from Presto.
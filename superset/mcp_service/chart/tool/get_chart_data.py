@@ -36,6 +36,7 @@ from superset.mcp_service.chart.schemas import (
     GetChartDataRequest,
     PerformanceMetadata,
 )
+from superset.mcp_service.executor import run_blocking
 from superset.mcp_service.utils.cache_utils import get_cache_status_from_result
 from superset.mcp_service.utils.schema_utils import parse_request
 
@@ -125,9 +126,6 @@ async def get_chart_data(  # noqa: C901
 
         try:
             await ctx.report_progress(2, 4, "Preparing data query")
-            from superset.charts.schemas import ChartDataQueryContextSchema
-            from superset.commands.chart.data.get_data_command import ChartDataCommand
-
             # Use the chart's saved query_context - this is the key!
             # The query_context contains all the information needed to reproduce
             # the chart's data exactly as shown in the visualization
@@ -151,45 +149,6 @@ async def get_chart_data(  # noqa: C901
                     "Data may not match the chart visualization exactly. "
                     "Consider re-saving the chart to enable full data retrieval."
                 )
-                # Try to construct from form_data as a fallback
-                form_data = utils_json.loads(chart.params) if chart.params else {}
-                from superset.common.query_context_factory import QueryContextFactory
-
-                factory = QueryContextFactory()
-                row_limit = (
-                    request.limit
-                    or form_data.get("row_limit")
-                    or current_app.config["ROW_LIMIT"]
-                )
-                query_context = factory.create(
-                    datasource={
-                        "id": chart.datasource_id,
-                        "type": chart.datasource_type,
-                    },
-                    queries=[
-                        {
-                            "filters": form_data.get("filters", []),
-                            "columns": form_data.get("groupby", []),
-                            "metrics": form_data.get("metrics", []),
-                            "row_limit": row_limit,
-                            "order_desc": True,
-                        }
-                    ],
-                    form_data=form_data,
-                    force=request.force_refresh,
-                )
-            else:
-                # Apply request overrides to the saved query_context
-                query_context_json["force"] = request.force_refresh
-
-                # Apply row limit if specified (respects chart's configured limits)
-                if request.limit:
-                    for query in query_context_json.get("queries", []):
-                        query["row_limit"] = request.limit
-
-                # Create QueryContext from the saved context using the schema
-                # This is exactly how the API does it
-                query_context = ChartDataQueryContextSchema().load(query_context_json)
 
             await ctx.report_progress(3, 4, "Executing data query")
             await ctx.debug(
@@ -204,8 +163,15 @@ async def get_chart_data(  # noqa: C901
             )
 
             # Execute the query
-            command = ChartDataCommand(query_context)
-            result = command.run()
+            result = await run_blocking(
+                "get_chart_data",
+                _run_chart_data_query,
+                request,
+                query_context_json,
+                chart.datasource_id,
+                chart.datasource_type,
+                utils_json.loads(chart.params) if chart.params else {},
+            )
 
             # Handle empty query results for certain chart types
             if not result or ("queries" not in result) or len(result["queries"]) == 0:
@@ -443,6 +409,61 @@ async def get_chart_data(  # noqa: C901
         )
 
 
+def _run_chart_data_query(
+    request: GetChartDataRequest,
+    query_context_json: Dict[str, Any] | None,
+    datasource_id: int,
+    datasource_type: str,
+    form_data: Dict[str, Any],
+) -> Dict[str, Any]:
+    """Create the query context of a chart and run it, on the MCP executor."""
+    from superset.charts.schemas import ChartDataQueryContextSchema
+    from superset.commands.chart.data.get_data_command import ChartDataCommand
+
+    if query_context_json is None:
+        # Try to construct from form_data as a fallback
+        from superset.common.query_context_factory import QueryContextFactory
+
+        factory = QueryContextFactory()
+        row_limit = (
+            request.limit
+            or form_data.get("row_limit")
+            or current_app.config["ROW_LIMIT"]
+        )
+        query_context = factory.create(
+            datasource={
+                "id": datasource_id,
+                "type": datasource_type,
+            },
+            queries=[
+                {
+                    "filters": form_data.get("filters", []),
+                    "columns": form_data.get("groupby", []),
+                    "metrics": form_data.get("metrics", []),
+                    "row_limit": row_limit,
+                    "order_desc": True,
+                }
+            ],
+            form_data=form_data,
+            force=request.force_refresh,
+        )
+    else:
+        # Apply request overrides to the saved query_context
+        query_context_json["force"] = request.force_refresh
+
+        # Apply row limit if specified (respects chart's configured limits)
+        if request.limit:
+            for query in query_context_json.get("queries", []):
+                query["row_limit"] = request.limit
+
+        # Create QueryContext from the saved context using the schema
+        # This is exactly how the API does it
+        query_context = ChartDataQueryContextSchema().load(query_context_json)
+
+    command = ChartDataCommand(query_context)
+    return command.run()
+
+
 def _export_data_as_csv(
     chart: "Slice",
     data: List[Dict[str, Any]],
@@ -37,6 +37,7 @@ from superset.mcp_service.chart.schemas import (
     URLPreview,
     VegaLitePreview,
 )
+from superset.mcp_service.executor import run_blocking
 from superset.mcp_service.utils.schema_utils import parse_request
 from superset.mcp_service.utils.url_utils import get_superset_base_url
 
@@ -1802,6 +1803,30 @@ def _create_numeric_summaries(data: List[Any], headers: List[str]) -> List[str]:
     return summaries
 
 
+def _generate_preview(
+    request: GetChartPreviewRequest,
+    chart_id: int | None,
+    transient_chart: ChartLike | None = None,
+) -> (
+    URLPreview
+    | InteractivePreview
+    | ASCIIPreview
+    | VegaLitePreview
+    | TablePreview
+    | ChartError
+):
+    """Generate the preview of a saved or transient chart, on the MCP executor."""
+    from superset.daos.chart import ChartDAO
+
+    chart = ChartDAO.find_by_id(chart_id) if chart_id is not None else transient_chart
+    if not chart:
+        return ChartError(
+            error=f"No chart found with identifier: {request.identifier}",
+            error_type="NotFound",
+        )
+    return PreviewFormatGenerator(chart, request).generate()
+
+
 async def _get_chart_preview_internal(  # noqa: C901
     request: GetChartPreviewRequest,
     ctx: Context,
@@ -1929,8 +1954,13 @@ async def _get_chart_preview_internal(  # noqa: C901
         )
 
         # Handle different preview formats using strategy pattern
-        preview_generator = PreviewFormatGenerator(chart, request)
-        content = preview_generator.generate()
+        content = await run_blocking(
+            "get_chart_preview",
+            _generate_preview,
+            request,
+            chart.id,
+            chart if chart.id is None else None,
+        )
 
         if isinstance(content, ChartError):
             await ctx.error(
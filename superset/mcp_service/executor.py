@@ -0,0 +1,173 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+
+"""
+Execution of blocking work from async MCP tools.
+
+Tools are coroutines that run on the event loop of the server, so the blocking
+calls they make (database queries, SQLAlchemy sessions, commands, screenshots)
+stall every other client of the process. ``run_blocking`` runs these calls on a
+sized thread pool instead, with a concurrency limit per tool.
+"""
+
+import asyncio
+import logging
+import threading
+import weakref
+from collections import defaultdict
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import partial
+from typing import Any, Callable, Dict, TypeVar
+
+from flask import current_app, Flask, has_app_context
+
+from superset.mcp_service.mcp_config import MCP_EXECUTOR_CONFIG
+from superset.utils.concurrency import with_app_context
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+_executor: ThreadPoolExecutor | None = None
+_executor_lock = threading.Lock()
+# Semaphores are bound to the event loop they're used in
+_semaphores: weakref.WeakKeyDictionary[
+    asyncio.AbstractEventLoop, Dict[str, asyncio.Semaphore]
+] = weakref.WeakKeyDictionary()
+_queued: Dict[str, int] = defaultdict(int)
+_running: Dict[str, int] = defaultdict(int)
+
+
+def _get_flask_app() -> Flask:
+    """Get the Flask app of the current context, or the MCP service app."""
+    if has_app_context():
+        return current_app._get_current_object()  # pylint: disable=protected-access
+
+    from superset.mcp_service.flask_singleton import get_flask_app
+
+    return get_flask_app()
+
+
+def get_executor_config(app: Flask) -> Dict[str, Any]:
+    """
+    Get the executor configuration, with defaults for the missing keys.
+
+    Args:
+        app: The Flask app
+
+    Returns:
+        The MCP_EXECUTOR_CONFIG dict
+    """
+    return {**MCP_EXECUTOR_CONFIG, **app.config.get("MCP_EXECUTOR_CONFIG", {})}
+
+
+def _get_executor(max_workers: int) -> ThreadPoolExecutor:
+    global _executor
+
+    with _executor_lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(
+                max_workers=max_workers, thread_name_prefix="mcp-executor"
+            )
+        return _executor
+
+
+def _get_semaphore(tool_name: str, limit: int) -> asyncio.Semaphore:
+    loop = asyncio.get_running_loop()
+    semaphores = _semaphores.setdefault(loop, {})
+    if tool_name not in semaphores:
+        semaphores[tool_name] = asyncio.Semaphore(limit)
+    return semaphores[tool_name]
+
+
+def get_executor_stats() -> Dict[str, Dict[str, int]]:
+    """
+    Get the number of queued and running calls of each tool.
+
+    Returns:
+        A dict of tool names to their queued and running call counts
+    """
+    return {
+        tool_name: {"queued": _queued[tool_name], "running": _running[tool_name]}
+        for tool_name in sorted({*_queued, *_running})
+    }
+
+
+async def run_blocking(
+    tool_name: str, func: Callable[..., T], *args: Any, **kwargs: Any
+) -> T:
+    """
+    Run a blocking function of a tool on the MCP thread pool.
+
+    The function runs in a new Flask app context with the user of the tool, so it
+    has its own database session, which is removed when it returns. ORM objects
+    loaded by the tool are bound to the session of the event loop, so pass their
+    identifiers to the function and load them there.
+
+    At most ``tool_concurrency_limits[tool_name]`` calls of the tool run at once,
+    the others are queued, and the number of queued and running calls is sent to
+    the stats logger. When the tool is cancelled, eg, because the client
+    disconnected, a queued call doesn't run, and a running call keeps its slot
+    until it returns but its result is discarded.
+
+    Args:
+        tool_name: The name of the tool, used for its concurrency limit and metrics
+        func: The blocking function
+        *args: Positional arguments of the function
+        **kwargs: Keyword arguments of the function
+
+    Returns:
+        The result of the function
+    """
+    app = _get_flask_app()
+    config = get_executor_config(app)
+    stats_logger = app.config["STATS_LOGGER"]
+    run = with_app_context(partial(func, *args, **kwargs), app)
+
+    def update_stats(queued: int = 0, running: int = 0) -> None:
+        _queued[tool_name] += queued
+        _running[tool_name] += running
+        stats_logger.gauge(f"mcp_executor.{tool_name}.queued", _queued[tool_name])
+        stats_logger.gauge(f"mcp_executor.{tool_name}.running", _running[tool_name])
+
+    limit = config["tool_concurrency_limits"].get(tool_name, config["max_workers"])
+    semaphore = _get_semaphore(tool_name, limit)
+    loop = asyncio.get_running_loop()
+
+    update_stats(queued=1)
+    try:
+        await semaphore.acquire()
+    finally:
+        update_stats(queued=-1)
+
+    def release(_: Future[T]) -> None:
+        # called from the worker thread, or from the event loop if the call was
+        # cancelled before it started
+        try:
+            loop.call_soon_threadsafe(semaphore.release)
+            loop.call_soon_threadsafe(update_stats, 0, -1)
+        except RuntimeError:
+            logger.debug("Event loop closed before the %s call returned", tool_name)
+
+    update_stats(running=1)
+    future = _get_executor(config["max_workers"]).submit(run)
+    future.add_done_callback(release)
+    try:
+        return await asyncio.wrap_future(future)
+    except asyncio.CancelledError:
+        logger.info("MCP tool %s was cancelled", tool_name)
+        raise
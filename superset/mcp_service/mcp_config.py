@@ -155,6 +155,24 @@ MCP_CACHE_CONFIG: Dict[str, Any] = {
     ],
 }
 
+# =============================================================================
+# MCP Executor Configuration
+# =============================================================================
+#
+# Tools run on the event loop of the server, so they run their blocking work
+# (database queries, commands, screenshots) on a thread pool, so that a slow query
+# doesn't stall the other clients. See superset/mcp_service/executor.py.
+MCP_EXECUTOR_CONFIG: Dict[str, Any] = {
+    "max_workers": 8,  # Size of the thread pool shared by all the tools
+    # Maximum number of concurrent calls of a tool, defaults to max_workers.
+    # Calls over the limit are queued.
+    "tool_concurrency_limits": {
+        "execute_sql": 4,
+        "get_chart_data": 4,
+        "get_chart_preview": 2,  # Screenshots use the webdriver pool
+    },
+}
+
 
 def create_default_mcp_auth_factory(app: Flask) -> Optional[Any]:
     """Default MCP auth factory using app.config values."""
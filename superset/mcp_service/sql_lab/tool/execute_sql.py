@@ -33,6 +33,7 @@ from superset_core.mcp import tool
 
 from superset.errors import ErrorLevel, SupersetError, SupersetErrorType
 from superset.exceptions import SupersetErrorException, SupersetSecurityException
+from superset.mcp_service.executor import run_blocking
 from superset.mcp_service.sql_lab.schemas import (
     ColumnInfo,
     ExecuteSqlRequest,
@@ -67,48 +68,9 @@ async def execute_sql(request: ExecuteSqlRequest, ctx: Context) -> ExecuteSqlRes
     logger.info("Executing SQL query on database ID: %s", request.database_id)
 
     try:
-        # Import inside function to avoid initialization issues
-        from superset import db, security_manager
-        from superset.models.core import Database
-
-        # 1. Get database and check access
-        database = db.session.query(Database).filter_by(id=request.database_id).first()
-        if not database:
-            raise SupersetErrorException(
-                SupersetError(
-                    message=f"Database with ID {request.database_id} not found",
-                    error_type=SupersetErrorType.DATABASE_NOT_FOUND_ERROR,
-                    level=ErrorLevel.ERROR,
-                )
-            )
-
-        if not security_manager.can_access_database(database):
-            raise SupersetSecurityException(
-                SupersetError(
-                    message=f"Access denied to database {database.database_name}",
-                    error_type=SupersetErrorType.DATABASE_SECURITY_ACCESS_ERROR,
-                    level=ErrorLevel.ERROR,
-                )
-            )
+        result = await run_blocking("execute_sql", _execute_sql, request)
 
-        # 2. Build QueryOptions
-        # Caching is enabled by default to reduce database load.
-        # force_refresh bypasses cache when user explicitly requests fresh data.
-        cache_opts = CacheOptions(force_refresh=True) if request.force_refresh else None
-        options = QueryOptions(
-            catalog=request.catalog,
-            schema=request.schema_name,
-            limit=request.limit,
-            timeout_seconds=request.timeout,
-            template_params=request.template_params,
-            dry_run=request.dry_run,
-            cache=cache_opts,
-        )
-
-        # 3. Execute query
-        result = database.execute(request.sql, options)
-
-        # 4. Convert to MCP response format
+        # Convert to MCP response format
         response = _convert_to_response(result)
 
         # Log successful execution
@@ -140,6 +102,50 @@ async def execute_sql(request: ExecuteSqlRequest, ctx: Context) -> ExecuteSqlRes
         raise
 
 
+def _execute_sql(request: ExecuteSqlRequest) -> QueryResult:
+    """Check access to the database and execute the query, on the MCP executor."""
+    # Import inside function to avoid initialization issues
+    from superset import db, security_manager
+    from superset.models.core import Database
+
+    # 1. Get database and check access
+    database = db.session.query(Database).filter_by(id=request.database_id).first()
+    if not database:
+        raise SupersetErrorException(
+            SupersetError(
+                message=f"Database with ID {request.database_id} not found",
+                error_type=SupersetErrorType.DATABASE_NOT_FOUND_ERROR,
+                level=ErrorLevel.ERROR,
+            )
+        )
+
+    if not security_manager.can_access_database(database):
+        raise SupersetSecurityException(
+            SupersetError(
+                message=f"Access denied to database {database.database_name}",
+                error_type=SupersetErrorType.DATABASE_SECURITY_ACCESS_ERROR,
+                level=ErrorLevel.ERROR,
+            )
+        )
+
+    # 2. Build QueryOptions
+    # Caching is enabled by default to reduce database load.
+    # force_refresh bypasses cache when user explicitly requests fresh data.
+    cache_opts = CacheOptions(force_refresh=True) if request.force_refresh else None
+    options = QueryOptions(
+        catalog=request.catalog,
+        schema=request.schema_name,
+        limit=request.limit,
+        timeout_seconds=request.timeout,
+        template_params=request.template_params,
+        dry_run=request.dry_run,
+        cache=cache_opts,
+    )
+
+    # 3. Execute query
+    return database.execute(request.sql, options)
+
+
 def _convert_to_response(result: QueryResult) -> ExecuteSqlResponse:
     """Convert QueryResult to ExecuteSqlResponse."""
     if result.status != QueryStatus.SUCCESS:
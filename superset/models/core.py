@@ -56,7 +56,7 @@ from sqlalchemy.engine.reflection import Inspector
 from sqlalchemy.engine.url import URL
 from sqlalchemy.exc import NoSuchModuleError
 from sqlalchemy.ext.hybrid import hybrid_property
-from sqlalchemy.orm import relationship
+from sqlalchemy.orm import Mapper, relationship
 from sqlalchemy.pool import NullPool
 from sqlalchemy.schema import UniqueConstraint
 from sqlalchemy.sql import ColumnElement, expression, Select
@@ -70,6 +70,7 @@ from superset.db_engine_specs.base import MetricType, TimeGrain
 from superset.extensions import (
     cache_manager,
     encrypted_field_factory,
+    engine_registry,
     event_logger,
     security_manager,
     ssh_manager_factory,
@@ -265,6 +266,12 @@ class Database(CoreDatabase, AuditMixinNullable, ImportExportMixin):  # pylint:
     def allow_multi_catalog(self) -> bool:
         return self.get_extra().get("allow_multi_catalog", False)
 
+    @property
+    def query_concurrency(self) -> int:
+        """Maximum number of concurrent queries of a single chart data request"""
+        default = app.config["DATA_QUERY_CONCURRENCY"]
+        return int(self.get_extra().get("query_concurrency", default))
+
     @property
     def schema_options(self) -> dict[str, Any]:
         """Additional schema display config for engines with complex schemas"""
@@ -490,7 +497,14 @@ class Database(CoreDatabase, AuditMixinNullable, ImportExportMixin):  # pylint:
 
         extra = self.get_extra(source)
         engine_kwargs = extra.get("engine_params", {})
-        if nullpool:
+
+        # engines connected through an SSH tunnel can't outlive the tunnel context
+        use_registry = (
+            engine_registry.is_enabled and self.id is not None and not self.ssh_tunnel
+        )
+        if use_registry:
+            engine_registry.apply_pool_params(engine_kwargs)
+        elif nullpool:
             engine_kwargs["poolclass"] = NullPool
         connect_args = engine_kwargs.setdefault("connect_args", {})
 
@@ -544,10 +558,34 @@ class Database(CoreDatabase, AuditMixinNullable, ImportExportMixin):  # pylint:
                 source,
             )
         try:
+            if use_registry:
+                return engine_registry.get_engine(
+                    self.id,
+                    sqlalchemy_url,
+                    engine_kwargs,
+                    create_engine,
+                )
             return create_engine(sqlalchemy_url, **engine_kwargs)
         except Exception as ex:
             raise self.db_engine_spec.get_dbapi_mapped_exception(ex) from ex
 
+    @staticmethod
+    def dispose_engines(
+        mapper: Mapper,
+        connection: Connection,
+        target: Database,
+    ) -> None:
+        """
+        Dispose the pooled engines of a database after it's updated or deleted.
+        """
+        engine_registry.invalidate(target.id)
+
+    def get_engine_pool_stats(self) -> list[dict[str, Any]]:
+        """
+        Return the connection pool statistics of the registered engines.
+        """
+        return engine_registry.get_stats(self.id)
+
     def add_database_to_signature(
         self,
         func: Callable[..., None],
@@ -1314,6 +1352,8 @@ class Database(CoreDatabase, AuditMixinNullable, ImportExportMixin):  # pylint:
 sqla.event.listen(Database, "after_insert", security_manager.database_after_insert)
 sqla.event.listen(Database, "after_update", security_manager.database_after_update)
 sqla.event.listen(Database, "after_delete", security_manager.database_after_delete)
+sqla.event.listen(Database, "after_update", Database.dispose_engines)
+sqla.event.listen(Database, "after_delete", Database.dispose_engines)
 
 
 class DatabaseUserOAuth2Tokens(Model, AuditMixinNullable):
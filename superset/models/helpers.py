@@ -27,6 +27,7 @@ import re
 import uuid
 from collections.abc import Hashable
 from datetime import datetime, timedelta
+from functools import partial
 from typing import (
     Any,
     Callable,
@@ -85,7 +86,7 @@ from superset.exceptions import (
     SupersetSecurityException,
     SupersetSyntaxErrorException,
 )
-from superset.extensions import feature_flag_manager
+from superset.extensions import feature_flag_manager, security_manager
 from superset.jinja_context import BaseTemplateProcessor
 from superset.sql.parse import sanitize_clause, SQLScript, SQLStatement
 from superset.superset_typing import (
@@ -96,8 +97,10 @@ from superset.superset_typing import (
     Metric,
     OrderBy,
     QueryObjectDict,
+    WindowCumulativeSum,
 )
 from superset.utils import core as utils, json
+from superset.utils.concurrency import execute_concurrently
 from superset.utils.core import (
     DateColumn,
     DTTM_ALIAS,
@@ -105,6 +108,7 @@ from superset.utils.core import (
     GenericDataType,
     get_base_axis_labels,
     get_column_name,
+    get_column_names,
     get_metric_names,
     get_non_base_axis_columns,
     get_user_id,
@@ -119,6 +123,7 @@ from superset.utils.core import (
 )
 from superset.utils.date_parser import get_past_or_future, normalize_time_delta
 from superset.utils.dates import datetime_to_epoch
+from superset.utils.hashing import hash_from_dict
 from superset.utils.rls import apply_rls
 
 
@@ -181,6 +186,23 @@ SQLA_QUERY_KEYS = {
     "timeseries_limit",
     "timeseries_limit_metric",
     "time_shift",
+    "window_cumulative_sum",
+}
+
+# Aggregate operators of the pivot post-processing that return the value of a group
+# with a single row
+IDENTITY_AGGREGATE_OPERATORS = {
+    "average",
+    "max",
+    "mean",
+    "median",
+    "min",
+    "nanmax",
+    "nanmean",
+    "nanmedian",
+    "nanmin",
+    "nansum",
+    "sum",
 }
 
 
@@ -792,6 +814,16 @@ class SqlaQuery(NamedTuple):
     sqla_query: Select
 
 
+class _PendingTimeOffset(NamedTuple):
+    index: int
+    offset: str
+    query_object: QueryObject
+    query_object_dct: QueryObjectDict
+    metrics_mapping: dict[str, str]
+    cache_key: Optional[str]
+    cache: Any
+
+
 class ExploreMixin:  # pylint: disable=too-many-public-methods
     """
     Allows any flask_appbuilder.Model (Query, Table, etc.)
@@ -1141,15 +1173,145 @@ class ExploreMixin:  # pylint: disable=too-many-public-methods
             if is_alias_used_in_orderby(col):
                 col.name = f"{col.name}__"
 
-    def query(self, query_obj: QueryObjectDict) -> QueryResult:
+    def query(self, query_obj: QueryObjectDict, force: bool = False) -> QueryResult:
         """
         Executes the query and returns a dataframe.
 
         This method is the unified entry point for query execution across all
         datasource types (Query, SqlaTable, etc.).
+
+        When ``DATA_CACHE_RAW_RESULTS_TIMEOUT`` is set, the raw result of the query is
+        cached in the data cache, keyed on the compiled SQL, so that queries that only
+        differ in their post-processing share the same result.
+
+        :param query_obj: The query object
+        :param force: Whether to bypass the cached raw result
         """
         qry_start_dttm = datetime.now()
         query_str_ext = self.get_query_str_extended(query_obj)
+        cache_key, result = self.get_cached_raw_result(
+            query_str_ext, qry_start_dttm, force
+        )
+        if result is None:
+            result = self.execute_query_str(query_str_ext, qry_start_dttm)
+            self.set_cached_raw_result(cache_key, result)
+        return self.postprocess_query_result(query_obj, result)
+
+    def postprocess_query_result(
+        self,
+        query_obj: QueryObjectDict,
+        result: QueryResult,
+    ) -> QueryResult:
+        """
+        Hook to adjust the result of a query once it ran, whether it ran on its own
+        or together with other queries (see `query_many`).
+
+        :param query_obj: The query object
+        :param result: The result of the query
+        :return: The adjusted result
+        """
+        return result
+
+    def get_cached_raw_result(
+        self,
+        query_str_ext: QueryStringExtended,
+        qry_start_dttm: datetime,
+        force: bool = False,
+    ) -> tuple[str | None, QueryResult | None]:
+        """
+        Look up the cached raw result of a compiled query.
+
+        :param query_str_ext: The compiled query
+        :param qry_start_dttm: When the query started
+        :param force: Whether to bypass the cached raw result
+        :return: The cache key of the raw result, `None` if raw results aren't cached,
+            and the cached result, if any
+        """
+        # pylint: disable=import-outside-toplevel
+        from superset.common.utils.query_cache_manager import QueryCacheManager
+
+        if not app.config["DATA_CACHE_RAW_RESULTS_TIMEOUT"]:
+            return None, None
+
+        cache_key = self.get_raw_result_cache_key(query_str_ext.sql)
+        cache = QueryCacheManager.get(cache_key, CacheRegion.DATA, force_query=force)
+        if not cache.is_loaded:
+            return cache_key, None
+
+        return cache_key, QueryResult(
+            applied_template_filters=query_str_ext.applied_template_filters,
+            applied_filter_columns=query_str_ext.applied_filter_columns,
+            rejected_filter_columns=query_str_ext.rejected_filter_columns,
+            df=cache.df,
+            duration=datetime.now() - qry_start_dttm,
+            query=cache.query,
+        )
+
+    def set_cached_raw_result(self, cache_key: str | None, result: QueryResult) -> None:
+        """
+        Cache the raw result of a query, unless it failed.
+
+        :param cache_key: The cache key returned by `get_cached_raw_result`
+        :param result: The result of the query
+        """
+        # pylint: disable=import-outside-toplevel
+        from superset.common.utils.query_cache_manager import QueryCacheManager
+
+        if cache_key is None or result.status == QueryStatus.FAILED:
+            return
+
+        queried_dttm = datetime.now(tz=pytz.utc).replace(microsecond=0)
+        QueryCacheManager.set(
+            key=cache_key,
+            value={
+                "df": result.df,
+                "query": result.query,
+                "dttm": queried_dttm.isoformat(),
+            },
+            timeout=app.config["DATA_CACHE_RAW_RESULTS_TIMEOUT"],
+            datasource_uid=self.uid,
+            region=CacheRegion.DATA,
+        )
+
+    def get_raw_result_cache_key(self, sql: str) -> str:
+        """
+        Cache key of the raw result of a query, made out of the compiled SQL, the
+        database and the RLS scope of the user, plus the user when the results depend
+        on who runs the query (impersonation or per user caching).
+
+        :param sql: The compiled SQL
+        :return: The cache key
+        """
+        database = self.database
+        cache_dict: dict[str, Any] = {
+            "sql": sql,
+            "database": database.id,
+            "catalog": self.catalog,
+            "schema": self.schema,
+            "rls": security_manager.get_rls_cache_key(self),
+        }
+        if (
+            (is_feature_enabled("CACHE_IMPERSONATION") and database.impersonate_user)
+            or is_feature_enabled("CACHE_QUERY_BY_USER")
+            or database.get_extra().get("per_user_caching", False)
+        ):
+            cache_dict["impersonation_key"] = (
+                database.db_engine_spec.get_impersonation_key(getattr(g, "user", None))
+            )
+
+        return hash_from_dict(cache_dict, default=json.json_int_dttm_ser)
+
+    def execute_query_str(
+        self,
+        query_str_ext: QueryStringExtended,
+        qry_start_dttm: datetime,
+    ) -> QueryResult:
+        """
+        Executes an already compiled query and returns a dataframe.
+
+        Compiling the query needs the ORM session, while executing it only talks to
+        the analytics database, so the latter can safely run in a worker thread.
+        """
         sql = query_str_ext.sql
         status = QueryStatus.SUCCESS
         errors = None
@@ -1298,7 +1460,14 @@ class ExploreMixin:  # pylint: disable=too-many-public-methods
 
         return df
 
-    def get_query_result(self, query_object: QueryObject) -> QueryResult:
+    def get_query_result(
+        self,
+        query_object: QueryObject,
+        force: bool = False,
+        cache_key_fn: Callable[[QueryObject, str, Any], str | None] | None = None,
+        cache_timeout_fn: Callable[[], int] | None = None,
+        query_result: QueryResult | None = None,
+    ) -> QueryResult:
         """
         Execute query and return results with full processing pipeline.
 
@@ -1309,10 +1478,21 @@ class ExploreMixin:  # pylint: disable=too-many-public-methods
         4. Post-processing operations
 
         :param query_object: The query configuration
+        :param force: Whether to bypass the cached results of the queries
+        :param cache_key_fn: Optional function to generate the cache keys of the
+            time offset queries, their results are only cached when it's set
+        :param cache_timeout_fn: Optional function to get the cache timeout of the
+            time offset queries
+        :param query_result: The result of the base query, if it already ran (see
+            `plan_query`), eg, concurrently with the other queries of a chart
         :return: QueryResult with processed dataframe
         """
+        query_object, query_obj = self.plan_query(query_object)
+
         # Execute the base query
-        result = self.query(query_object.to_dict())
+        result = (
+            self.query(query_obj, force=force) if query_result is None else query_result
+        )
         query = result.query + ";\n\n" if result.query else ""
 
         # Process the dataframe if not empty
@@ -1324,9 +1504,12 @@ class ExploreMixin:  # pylint: disable=too-many-public-methods
             # Process time offsets if requested
             if query_object.time_offsets:
                 # Process time offsets using the datasource's own method
-                # Note: caching is disabled here as we don't have query context
                 time_offsets = self.processing_time_offsets(
-                    df, query_object, cache_key_fn=None, cache_timeout_fn=None
+                    df,
+                    query_object,
+                    cache_key_fn=cache_key_fn,
+                    cache_timeout_fn=cache_timeout_fn,
+                    force_cache=force,
                 )
                 df = time_offsets["df"]
                 queries = time_offsets["queries"]
@@ -1347,6 +1530,127 @@ class ExploreMixin:  # pylint: disable=too-many-public-methods
 
         return result
 
+    def plan_query(
+        self, query_object: QueryObject
+    ) -> tuple[QueryObject, QueryObjectDict]:
+        """
+        Plan the base query of a query object.
+
+        The cumulative sums of the post-processing are computed in the database when
+        possible, in which case they're removed from the post-processing.
+
+        :param query_object: The query configuration
+        :returns: The query object whose post-processing runs on the results of the
+            base query, and the base query
+        """
+        query_obj = query_object.to_dict()
+        if pushdown := self.get_window_cumulative_sum(query_object):
+            query_obj["window_cumulative_sum"], post_processing = pushdown
+            query_object = copy.copy(query_object)
+            query_object.post_processing = post_processing
+        return query_object, query_obj
+
+    def get_window_cumulative_sum(
+        self, query_object: QueryObject
+    ) -> tuple[WindowCumulativeSum, list[dict[str, Any]]] | None:
+        """
+        Plan computing the cumulative sum that follows a pivot in the post-processing
+        with a window function in the database, when `POST_PROCESSING_PUSHDOWN` is set.
+
+        The sum is only pushed down when every cell of the pivot comes from a single
+        row of the query, ie, the pivot index and columns are the columns the query
+        groups by, and the index is a temporal column that sorts the same way in the
+        database and in pandas. Anything else is left to pandas.
+
+        :param query_object: The query configuration
+        :returns: The cumulative sums for the query and the post-processing to run on
+            its results, or `None` if the post-processing can't be pushed down
+        """
+        if not app.config["POST_PROCESSING_PUSHDOWN"]:
+            return None
+
+        db_engine_spec = self.db_engine_spec
+        if (
+            not db_engine_spec.allows_subqueries
+            or not db_engine_spec.allows_window_functions
+            or query_object.is_rowcount
+            or query_object.time_offsets
+            or (query_object.is_timeseries and query_object.granularity)
+            or not query_object.metrics
+            or len(query_object.post_processing) < 2
+        ):
+            return None
+
+        pivot_step, cum_step, *_ = query_object.post_processing
+        if pivot_step.get("operation") != "pivot" or cum_step.get("operation") != "cum":
+            return None
+
+        pivot_options = pivot_step.get("options") or {}
+        cum_options = cum_step.get("options") or {}
+        index = pivot_options.get("index") or []
+        partition_by = pivot_options.get("columns") or []
+        aggregates = pivot_options.get("aggregates") or {}
+        cum_columns = cum_options.get("columns") or {}
+        sources = [
+            aggregate.get("column", name) for name, aggregate in aggregates.items()
+        ]
+        labels = get_column_names(query_object.columns)
+        metrics = set(get_metric_names(query_object.metrics))
+        # an empty pivot cell is NaN for these operators, which pandas drops along
+        # with the columns and rows that only have empty cells
+        operators = (
+            {"sum", "nansum"}
+            if pivot_options.get("drop_missing_columns", True)
+            else IDENTITY_AGGREGATE_OPERATORS
+        )
+        if (
+            cum_options.get("operator") != "sum"
+            or len(index) != 1
+            or sorted([*index, *partition_by]) != sorted(labels)
+            or not self._is_sortable_temporal_column(index[0], query_object)
+            or pivot_options.get("metric_fill_value") is not None
+            or pivot_options.get("marginal_distributions")
+            or pivot_options.get("combine_value_with_metric")
+            or not cum_columns
+            or any(source != target for source, target in cum_columns.items())
+            or not set(cum_columns) <= metrics
+            or any(
+                sources.count(column) != 1
+                or aggregates.get(column, {}).get("column", column) != column
+                or aggregates[column].get("operator") not in operators
+                for column in cum_columns
+            )
+        ):
+            return None
+
+        window_cumulative_sum: WindowCumulativeSum = {
+            "index": index[0],
+            "partition_by": list(partition_by),
+            "metrics": list(cum_columns),
+        }
+        post_processing = [
+            pivot_step,
+            {**cum_step, "options": {**cum_options, "accumulated": True}},
+            *query_object.post_processing[2:],
+        ]
+        return window_cumulative_sum, post_processing
+
+    def _is_sortable_temporal_column(
+        self, label: str, query_object: QueryObject
+    ) -> bool:
+        """
+        Whether a column is a temporal base axis that isn't parsed from a string
+        with a custom format, so that the database sorts it like pandas does.
+        """
+        if label not in get_base_axis_labels(query_object.columns) or not hasattr(
+            self, "get_column"
+        ):
+            return False
+        column = self.get_column(label)
+        if isinstance(column, dict):
+            return bool(column.get("is_dttm") and not column.get("python_date_format"))
+        return bool(column and column.is_dttm and not column.python_date_format)
+
     def processing_time_offsets(  # pylint: disable=too-many-locals,too-many-statements # noqa: C901
         self,
         df: pd.DataFrame,
@@ -1377,6 +1681,9 @@ class ExploreMixin:  # pylint: disable=too-many-public-methods
         queries: list[str] = []
         cache_keys: list[str | None] = []
         offset_dfs: dict[str, pd.DataFrame] = {}
+        # (offset, df, query, cache key) of each offset, in order
+        offset_results: list[tuple[str, pd.DataFrame, str, str | None] | None] = []
+        pending: list[_PendingTimeOffset] = []
 
         outer_from_dttm, outer_to_dttm = get_since_until_from_query_object(query_object)
         if not outer_from_dttm or not outer_to_dttm:
@@ -1567,9 +1874,7 @@ class ExploreMixin:  # pylint: disable=too-many-public-methods
             cache = QueryCacheManager.get(cache_key, CacheRegion.DATA, force_cache)
 
             if cache.is_loaded:
-                offset_dfs[offset] = cache.df
-                queries.append(cache.query)
-                cache_keys.append(cache_key)
+                offset_results.append((offset, cache.df, cache.query, cache_key))
                 continue
 
             query_object_clone_dct = query_object_clone.to_dict()
@@ -1587,43 +1892,74 @@ class ExploreMixin:  # pylint: disable=too-many-public-methods
                 query_object_clone_dct["row_limit"] = app.config["ROW_LIMIT"]
                 query_object_clone_dct["row_offset"] = 0
 
-            # Call the unified query method on the datasource
-            result = self.query(query_object_clone_dct)
+            # the clone is reused across offsets, so keep a snapshot for this one
+            pending.append(
+                _PendingTimeOffset(
+                    index=len(offset_results),
+                    offset=offset,
+                    query_object=copy.copy(query_object_clone),
+                    query_object_dct=query_object_clone_dct,
+                    metrics_mapping=metrics_mapping,
+                    cache_key=cache_key,
+                    cache=cache,
+                )
+            )
+            offset_results.append(None)
 
-            queries.append(result.query)
-            cache_keys.append(None)
+        # Run the offset queries that were not cached, possibly concurrently
+        results = self.query_many(
+            [pending_offset.query_object_dct for pending_offset in pending]
+        )
 
+        for pending_offset, result in zip(pending, results, strict=True):
             offset_metrics_df = result.df
             if offset_metrics_df.empty:
                 offset_metrics_df = pd.DataFrame(
                     {
                         col: [np.NaN]
-                        for col in join_keys + list(metrics_mapping.values())
+                        for col in join_keys
+                        + list(pending_offset.metrics_mapping.values())
                     }
                 )
             else:
                 # 1. normalize df, set dttm column
                 offset_metrics_df = self.normalize_df(
-                    offset_metrics_df, query_object_clone
+                    offset_metrics_df, pending_offset.query_object
                 )
 
                 # 2. rename extra query columns
-                offset_metrics_df = offset_metrics_df.rename(columns=metrics_mapping)
+                offset_metrics_df = offset_metrics_df.rename(
+                    columns=pending_offset.metrics_mapping
+                )
 
             # cache df and query if caching is enabled
-            if cache_key and cache_timeout_fn:
+            if pending_offset.cache_key and cache_timeout_fn:
                 value = {
                     "df": offset_metrics_df,
                     "query": result.query,
                 }
-                cache.set(
-                    key=cache_key,
+                pending_offset.cache.set(
+                    key=pending_offset.cache_key,
                     value=value,
-                    timeout=cache_timeout_fn(),
+                    timeout=self.get_time_offset_cache_timeout(
+                        pending_offset.query_object, cache_timeout_fn()
+                    ),
                     datasource_uid=self.uid,
                     region=CacheRegion.DATA,
                 )
-            offset_dfs[offset] = offset_metrics_df
+            offset_results[pending_offset.index] = (
+                pending_offset.offset,
+                offset_metrics_df,
+                result.query,
+                None,
+            )
+
+        for offset, offset_df, offset_query, offset_cache_key in cast(
+            list[tuple[str, pd.DataFrame, str, Optional[str]]], offset_results
+        ):
+            offset_dfs[offset] = offset_df
+            queries.append(offset_query)
+            cache_keys.append(offset_cache_key)
 
         if offset_dfs:
             df = self.join_offset_dfs(
@@ -1635,6 +1971,89 @@ class ExploreMixin:  # pylint: disable=too-many-public-methods
 
         return CachedTimeOffset(df=df, queries=queries, cache_keys=cache_keys)
 
+    @staticmethod
+    def get_time_offset_cache_timeout(query_object: QueryObject, timeout: int) -> int:
+        """
+        Cache timeout of the results of a time offset query.
+
+        Data of closed time windows doesn't change, so the results of offsets that lie
+        fully in the past are kept for at least ``TIME_OFFSET_PAST_CACHE_TIMEOUT``
+        seconds. A timeout of 0, which never expires, and a disabled cache
+        (``CACHE_DISABLED_TIMEOUT``) are kept as is.
+
+        :param query_object: The time offset query object
+        :param timeout: The cache timeout of the query context
+        :return: The cache timeout
+        """
+        past_timeout = app.config["TIME_OFFSET_PAST_CACHE_TIMEOUT"]
+        if (
+            timeout > 0
+            and past_timeout
+            and query_object.to_dttm
+            and query_object.to_dttm <= datetime.now()
+        ):
+            return max(timeout, past_timeout)
+        return timeout
+
+    def query_many(
+        self,
+        query_objs: list[QueryObjectDict],
+        force: bool = False,
+    ) -> list[QueryResult]:
+        """
+        Executes several independent queries, returning the results in order.
+
+        The queries are compiled, and their cached raw results looked up, sequentially,
+        since that needs the ORM session. The remaining queries are then executed on a
+        thread pool bounded by the ``query_concurrency`` of the database. With a
+        concurrency of 1 this is the same as calling ``query`` in a loop.
+
+        :param query_objs: The query objects to execute
+        :param force: Whether to bypass the cached raw results
+        :return: One QueryResult per query object
+        """
+        if (
+            len(query_objs) <= 1
+            or (max_workers := self.database.query_concurrency) <= 1
+        ):
+            return [self.query(query_obj, force=force) for query_obj in query_objs]
+
+        # load relationships needed to connect while still in the session's thread
+        _ = self.database.ssh_tunnel
+
+        results: list[QueryResult | None] = []
+        # (index, raw result cache key, task) of the queries that need to run
+        pending: list[tuple[int, str | None, Callable[[], QueryResult]]] = []
+        for query_obj in query_objs:
+            qry_start_dttm = datetime.now()
+            query_str_ext = self.get_query_str_extended(query_obj)
+            cache_key, result = self.get_cached_raw_result(
+                query_str_ext, qry_start_dttm, force
+            )
+            if result is None:
+                pending.append(
+                    (
+                        len(results),
+                        cache_key,
+                        partial(self.execute_query_str, query_str_ext, qry_start_dttm),
+                    )
+                )
+            results.append(result)
+
+        executed = execute_concurrently(
+            [task for _, _, task in pending],
+            max_workers,
+            thread_name_prefix=f"query-{self.database.id}",
+        )
+        for (index, cache_key, _), result in zip(pending, executed, strict=True):
+            self.set_cached_raw_result(cache_key, result)
+            results[index] = result
+
+        return [
+            self.postprocess_query_result(query_obj, cast(QueryResult, result))
+            for query_obj, result in zip(query_objs, results, strict=True)
+        ]
+
     @staticmethod
     def get_time_grain(query_object: QueryObject) -> Any | None:
         if (
@@ -2642,6 +3061,7 @@ class ExploreMixin:  # pylint: disable=too-many-public-methods
         timeseries_limit: Optional[int] = None,
         timeseries_limit_metric: Optional[Metric] = None,
         time_shift: Optional[str] = None,
+        window_cumulative_sum: Optional[WindowCumulativeSum] = None,
     ) -> SqlaQuery:
         """Querying any sqla table from this common interface"""
         if granularity not in self.dttm_cols and granularity is not None:
@@ -3417,6 +3837,10 @@ class ExploreMixin:  # pylint: disable=too-many-public-methods
             col = self.make_sqla_column_compatible(literal_column("COUNT(*)"), label)
             qry = sa.select([col]).select_from(qry.alias("rowcount_qry"))
             labels_expected = [label]
+        elif window_cumulative_sum:
+            qry = self.get_window_cumulative_sum_query(
+                qry, labels_expected, window_cumulative_sum
+            )
 
         filter_columns = [flt.get("col") for flt in filter] if filter else []
         rejected_filter_columns = [
@@ -3446,3 +3870,65 @@ class ExploreMixin:  # pylint: disable=too-many-public-methods
             sqla_query=qry,
             prequeries=prequeries,
         )
+
+    def get_window_cumulative_sum_query(
+        self,
+        qry: Select,
+        labels_expected: list[str],
+        window_cumulative_sum: WindowCumulativeSum,
+    ) -> Select:
+        """
+        Wrap a query to accumulate its metrics with a window function.
+
+        The window runs over the rows returned by the query, after the limit, so it
+        sees the same rows as the `cum` post-processing operation. Rows without a
+        value for the index are sorted last, like pandas does when pivoting.
+
+        :param qry: The query to wrap
+        :param labels_expected: The labels of the columns returned by the query
+        :param window_cumulative_sum: The metrics to accumulate
+        :returns: The query with the metrics replaced by their cumulative sums
+        :raises QueryObjectValidationError: If the database doesn't support window
+            functions or a label isn't returned by the query
+        """
+        db_engine_spec = self.db_engine_spec
+        if not (
+            db_engine_spec.allows_subqueries and db_engine_spec.allows_window_functions
+        ):
+            raise QueryObjectValidationError(
+                _("Database does not support window functions")
+            )
+
+        inner = qry.alias("window_qry")
+        columns = dict(zip(labels_expected, inner.c, strict=False))
+        metrics = window_cumulative_sum["metrics"]
+        for label in [
+            window_cumulative_sum["index"],
+            *window_cumulative_sum["partition_by"],
+            *metrics,
+        ]:
+            if label not in columns:
+                raise QueryObjectValidationError(
+                    _("Column %(column)s is not part of the query", column=label)
+                )
+
+        index = columns[window_cumulative_sum["index"]]
+        partition_by = [
+            columns[label] for label in window_cumulative_sum["partition_by"]
+        ]
+        order_by = [sa.case([(index.is_(None), 1)], else_=0), index]
+        return sa.select(
+            [
+                sa.func.coalesce(
+                    sa.func.sum(column).over(
+                        partition_by=partition_by or None,
+                        order_by=order_by,
+                        rows=(None, 0),
+                    ),
+                    0,
+                ).label(column.name)
+                if label in metrics
+                else column
+                for label, column in columns.items()
+            ]
+        ).select_from(inner)
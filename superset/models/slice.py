@@ -299,6 +299,50 @@ class Slice(  # pylint: disable=too-many-public-methods
                 logger.exception(ex)
         return None
 
+    def get_query_context_column_names(self) -> set[str] | None:
+        """
+        Get the names of the columns queried by the chart's saved query context.
+
+        The names are read from the query context JSON, instead of building the
+        query context with `get_query_context`, which loads the datasource and
+        processes every query.
+
+        :returns: The column names, or None if the chart doesn't have a valid query
+            context for its datasource
+        """
+        if not self.query_context:
+            return None
+        try:
+            query_context = json.loads(self.query_context)
+        except json.JSONDecodeError:
+            logger.error("Malformed json in slice's query context", exc_info=True)
+            return None
+
+        # legacy dashboard imports may have the query context of another datasource
+        datasource = query_context.get("datasource") or {}
+        if str(datasource.get("id")) != str(self.datasource_id):
+            return None
+
+        form_data = query_context.get("form_data") or {}
+        column_names: set[str] = set()
+        for query in query_context.get("queries") or []:
+            columns = query.get("groupby") or query.get("columns") or []
+            column_names.update(utils.get_column_name(column) for column in columns)
+            # a temporal x-axis is replaced with the granularity
+            granularity = query.get("granularity") or query.get("granularity_sqla")
+            if granularity and form_data.get("x_axis"):
+                column_names.add(granularity)
+
+        # tooltip columns are added to the queries
+        for item in form_data.get("tooltip_contents") or []:
+            if isinstance(item, str):
+                column_names.add(item)
+            elif isinstance(item, dict) and item.get("item_type") == "column":
+                if column_name := item.get("column_name"):
+                    column_names.add(column_name)
+
+        return column_names
+
     def get_explore_url(
         self,
         base_url: str = "/explore",
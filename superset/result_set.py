@@ -18,6 +18,8 @@
 
 import datetime
 import logging
+from collections.abc import Sequence
+from operator import itemgetter
 from typing import Any, Optional
 
 import numpy as np
@@ -99,20 +101,42 @@ def convert_to_string(value: Any) -> str:
     return str(value)
 
 
+def to_object_array(values: Sequence[Any]) -> NDArray[Any]:
+    """
+    Build a 1-D object array, keeping sequence values (eg, lists) as single items.
+    """
+    return np.fromiter(values, dtype=object, count=len(values))
+
+
+def validate_row_lengths(data: DbapiResult, num_columns: int) -> None:
+    """
+    Ensure every row has one value per column of the cursor description.
+    """
+    if lengths := set(map(len, data)) - {num_columns}:
+        raise ValueError(
+            f"Expected {num_columns} values per row, got {sorted(lengths)}"
+        )
+
+
 class SupersetResultSet:
     def __init__(  # pylint: disable=too-many-locals  # noqa: C901
         self,
-        data: DbapiResult,
+        data: DbapiResult | pa.Table,
         cursor_description: DbapiDescription,
         db_engine_spec: type[BaseEngineSpec],
     ):
+        """
+        Build the result set from DB-API rows, or from an Arrow table for drivers
+        that can return results as Arrow.
+
+        Each column is gathered from the rows and converted to Arrow directly, without
+        intermediate copies of the whole result; the (slower) stringification and
+        timezone fallbacks are only applied to the columns that need them.
+        """
         self.db_engine_spec = db_engine_spec
-        data = data or []
         column_names: list[str] = []
         pa_data: list[pa.Array] = []
         deduped_cursor_desc: list[tuple[Any, ...]] = []
-        numpy_dtype: list[tuple[str, ...]] = []
-        stringified_arr: NDArray[Any]
 
         if cursor_description:
             # get deduped list of column names
@@ -128,55 +152,25 @@ class SupersetResultSet:
                 )
             ]
 
-            # generate numpy structured array dtype
-            numpy_dtype = [(column_name, "object") for column_name in column_names]
-
-        # only do expensive recasting if datatype is not standard list of tuples
-        if data and (not isinstance(data, list) or not isinstance(data[0], tuple)):
-            data = [tuple(row) for row in data]
-        array = np.array(data, dtype=numpy_dtype)
-
-        for column in column_names:
-            try:
-                pa_data.append(pa.array(array[column].tolist()))
-            except (
-                pa.lib.ArrowInvalid,
-                pa.lib.ArrowTypeError,
-                pa.lib.ArrowNotImplementedError,
-                ValueError,
-                TypeError,  # this is super hackey,
-                # https://issues.apache.org/jira/browse/ARROW-7855
-            ):
-                # attempt serialization of values as strings
-                stringified_arr = stringify_values(array[column])
-                pa_data.append(pa.array(stringified_arr.tolist()))
-
-        if pa_data:  # pylint: disable=too-many-nested-blocks
-            for i, column in enumerate(column_names):
-                if pa.types.is_nested(pa_data[i].type):
-                    # TODO: revisit nested column serialization once nested types
-                    #  are added as a natively supported column type in Superset
-                    #  (superset.utils.core.GenericDataType).
-                    stringified_arr = stringify_values(array[column])
-                    pa_data[i] = pa.array(stringified_arr.tolist())
-
-                elif pa.types.is_temporal(pa_data[i].type):
-                    # workaround for bug converting
-                    # `psycopg2.tz.FixedOffsetTimezone` tzinfo values.
-                    # related: https://issues.apache.org/jira/browse/ARROW-5248
-                    sample = self.first_nonempty(array[column])
-                    if sample and isinstance(sample, datetime.datetime):
-                        try:
-                            if sample.tzinfo:
-                                tz = sample.tzinfo
-                                series = pd.Series(array[column])
-                                series = pd.to_datetime(series, utc=True)
-                                pa_data[i] = pa.Array.from_pandas(
-                                    series,
-                                    type=pa.timestamp("ns", tz=tz),
-                                )
-                        except Exception as ex:  # pylint: disable=broad-except
-                            logger.exception(ex)
+        if isinstance(data, pa.Table):
+            column_names = column_names or dedup(data.column_names)
+            pa_data = [
+                (
+                    pa.array(stringify_values(to_object_array(column.to_pylist())))
+                    if pa.types.is_nested(column.type)
+                    else column.combine_chunks()
+                )
+                for column in data.columns
+            ]
+        else:
+            data = data or []
+            validate_row_lengths(data, len(column_names))
+            # build one column at a time, so only a single column of Python
+            # objects is alive on top of the rows
+            pa_data = [
+                self.to_pa_array(list(map(itemgetter(i), data)))
+                for i in range(len(column_names))
+            ]
 
         if not pa_data:
             column_names = []
@@ -193,6 +187,50 @@ class SupersetResultSet:
         except Exception as ex:  # pylint: disable=broad-except
             logger.exception(ex)
 
+    def to_pa_array(self, values: list[Any]) -> pa.Array:
+        """
+        Convert the values of a column to Arrow, falling back to strings for values
+        Arrow can't represent natively.
+        """
+        try:
+            array = pa.array(values)
+        except (
+            pa.lib.ArrowInvalid,
+            pa.lib.ArrowTypeError,
+            pa.lib.ArrowNotImplementedError,
+            ValueError,
+            TypeError,  # this is super hackey,
+            # https://issues.apache.org/jira/browse/ARROW-7855
+        ):
+            # attempt serialization of values as strings
+            return pa.array(stringify_values(to_object_array(values)).tolist())
+
+        if pa.types.is_nested(array.type):
+            # TODO: revisit nested column serialization once nested types
+            #  are added as a natively supported column type in Superset
+            #  (superset.utils.core.GenericDataType).
+            return pa.array(stringify_values(to_object_array(values)).tolist())
+
+        if pa.types.is_temporal(array.type):
+            # workaround for bug converting
+            # `psycopg2.tz.FixedOffsetTimezone` tzinfo values.
+            # related: https://issues.apache.org/jira/browse/ARROW-5248
+            sample = self.first_nonempty(values)
+            if sample and isinstance(sample, datetime.datetime):
+                try:
+                    if sample.tzinfo:
+                        tz = sample.tzinfo
+                        series = pd.Series(to_object_array(values))
+                        series = pd.to_datetime(series, utc=True)
+                        return pa.Array.from_pandas(
+                            series,
+                            type=pa.timestamp("ns", tz=tz),
+                        )
+                except Exception as ex:  # pylint: disable=broad-except
+                    logger.exception(ex)
+
+        return array
+
     @staticmethod
     def convert_pa_dtype(pa_dtype: pa.DataType) -> Optional[str]:
         if pa.types.is_boolean(pa_dtype):
@@ -215,7 +253,7 @@ class SupersetResultSet:
             return table.to_pandas(integer_object_nulls=True, timestamp_as_object=True)
 
     @staticmethod
-    def first_nonempty(items: NDArray[Any]) -> Any:
+    def first_nonempty(items: Sequence[Any]) -> Any:
         return next((i for i in items if i), None)
 
     def is_temporal(self, db_type_str: Optional[str]) -> bool:
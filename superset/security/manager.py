@@ -22,8 +22,9 @@ import re
 import time
 from collections import defaultdict
 from typing import Any, Callable, cast, NamedTuple, Optional, TYPE_CHECKING
+from uuid import uuid4
 
-from flask import current_app, Flask, g, Request
+from flask import current_app, Flask, g, has_app_context, Request
 from flask_appbuilder import Model
 from flask_appbuilder.models.filters import BaseFilter
 from flask_appbuilder.security.sqla.apis import RoleApi, UserApi
@@ -85,7 +86,6 @@ if TYPE_CHECKING:
     from superset.common.query_context import QueryContext
     from superset.connectors.sqla.models import (
         BaseDatasource,
-        RowLevelSecurityFilter,
         SqlaTable,
     )
     from superset.explorables.base import Explorable
@@ -105,6 +105,15 @@ def get_conf() -> Any:
 DATABASE_PERM_REGEX = re.compile(r"^\[.+\]\.\(id\:(?P<id>\d+)\)$")
 
 
+class RLSFilter(NamedTuple):
+    id: int
+    group_key: Optional[str]
+    clause: str
+
+
+RLS_FILTERS_VERSION_CACHE_KEY = "rls_filters_version"
+
+
 class DatabaseCatalogSchema(NamedTuple):
     database: str
     catalog: Optional[str]
@@ -2713,11 +2722,15 @@ class SupersetSecurityManager(  # pylint: disable=too-many-public-methods
             ]
         return []
 
-    def get_rls_filters(self, table: "BaseDatasource | Explorable") -> list[SqlaQuery]:
+    def get_rls_filters(self, table: "BaseDatasource | Explorable") -> list[RLSFilter]:
         """
         Retrieves the appropriate row level security filters for the current user and
         the passed table.
 
+        The filters are cached for the duration of the request, keyed on the roles of
+        the user and the table, and if ``RLS_FILTERS_CACHE_TIMEOUT`` is set in the
+        cache as well. Cached filters are invalidated when RLS filters change.
+
         :param table: The table to check against
         :returns: A list of filters
         """
@@ -2725,6 +2738,74 @@ class SupersetSecurityManager(  # pylint: disable=too-many-public-methods
         if not (hasattr(g, "user") and g.user is not None):
             return []
 
+        user_roles = sorted(role.id for role in self.get_user_roles(g.user))
+        table_id = table.data["id"]
+
+        request_cache: dict[tuple[Any, ...], list[RLSFilter]] = g.setdefault(
+            "rls_filters_cache", {}
+        )
+        key = (tuple(user_roles), table_id)
+        if key not in request_cache:
+            request_cache[key] = self._get_cached_rls_filters(user_roles, table_id)
+
+        return list(request_cache[key])
+
+    def invalidate_rls_filters_cache(self) -> None:
+        """
+        Invalidates the cached RLS filters, by changing the version of the cache keys.
+        """
+        # pylint: disable=import-outside-toplevel
+        from superset.extensions import cache_manager
+
+        if not has_app_context():
+            return
+
+        if current_app.config["RLS_FILTERS_CACHE_TIMEOUT"]:
+            cache_manager.cache.set(RLS_FILTERS_VERSION_CACHE_KEY, uuid4().hex, 0)
+        g.pop("rls_filters_cache", None)
+
+    def _get_rls_filters_version(self) -> str:
+        # pylint: disable=import-outside-toplevel
+        from superset.extensions import cache_manager
+
+        cache = cache_manager.cache
+        if version := cache.get(RLS_FILTERS_VERSION_CACHE_KEY):
+            return version
+
+        # never reuse an old version if the key was evicted
+        version = uuid4().hex
+        if not cache.add(RLS_FILTERS_VERSION_CACHE_KEY, version, 0):
+            version = cache.get(RLS_FILTERS_VERSION_CACHE_KEY) or version
+        return version
+
+    def _get_cached_rls_filters(
+        self, user_roles: list[int], table_id: int
+    ) -> list[RLSFilter]:
+        # pylint: disable=import-outside-toplevel
+        from superset.extensions import cache_manager
+
+        timeout = current_app.config["RLS_FILTERS_CACHE_TIMEOUT"]
+        if not timeout:
+            return self._query_rls_filters(user_roles, table_id)
+
+        version = self._get_rls_filters_version()
+        roles = ",".join(str(role_id) for role_id in user_roles)
+        cache_key = f"rls_filters:{version}:{roles}:{table_id}"
+        cached = cache_manager.cache.get(cache_key)
+        if cached is not None:
+            return [RLSFilter(*filter_) for filter_ in cached]
+
+        filters = self._query_rls_filters(user_roles, table_id)
+        cache_manager.cache.set(
+            cache_key,
+            [tuple(filter_) for filter_ in filters],
+            timeout,
+        )
+        return filters
+
+    def _query_rls_filters(
+        self, user_roles: list[int], table_id: int
+    ) -> list[RLSFilter]:
         # pylint: disable=import-outside-toplevel
         from superset.connectors.sqla.models import (
             RLSFilterRoles,
@@ -2732,7 +2813,6 @@ class SupersetSecurityManager(  # pylint: disable=too-many-public-methods
             RowLevelSecurityFilter,
         )
 
-        user_roles = [role.id for role in self.get_user_roles(g.user)]
         regular_filter_roles = (
             self.session.query(RLSFilterRoles.c.rls_filter_id)
             .join(RowLevelSecurityFilter)
@@ -2750,7 +2830,7 @@ class SupersetSecurityManager(  # pylint: disable=too-many-public-methods
             .filter(RLSFilterRoles.c.role_id.in_(user_roles))
         )
         filter_tables = self.session.query(RLSFilterTables.c.rls_filter_id).filter(
-            RLSFilterTables.c.table_id == table.data["id"]
+            RLSFilterTables.c.table_id == table_id
         )
         query = (
             self.session.query(
@@ -2774,11 +2854,9 @@ class SupersetSecurityManager(  # pylint: disable=too-many-public-methods
                 )
             )
         )
-        return query.all()
+        return [RLSFilter(*row) for row in query.all()]
 
-    def get_rls_sorted(
-        self, table: "BaseDatasource | Explorable"
-    ) -> list["RowLevelSecurityFilter"]:
+    def get_rls_sorted(self, table: "BaseDatasource | Explorable") -> list[RLSFilter]:
         """
         Retrieves a list RLS filters sorted by ID for
         the current user and the passed table.
@@ -34,6 +34,7 @@ from superset.commands.sql_lab.results import SqlExecutionResultsCommand
 from superset.commands.sql_lab.streaming_export_command import (
     StreamingSqlResultExportCommand,
 )
+from superset.common.chart_data import ChartDataResultFormat
 from superset.constants import MODEL_API_RW_METHOD_PERMISSION_MAP
 from superset.daos.database import DatabaseDAO
 from superset.daos.query import QueryDAO
@@ -67,11 +68,23 @@ from superset.sqllab.utils import bootstrap_sqllab_data
 from superset.sqllab.validators import CanAccessQueryValidatorImpl
 from superset.superset_typing import FlaskResponse
 from superset.utils import core as utils, json
-from superset.views.base import CsvResponse, generate_download_headers, json_success
+from superset.views.base import (
+    ArrowResponse,
+    CsvResponse,
+    generate_download_headers,
+    json_success,
+    ParquetResponse,
+)
 from superset.views.base_api import BaseSupersetApi, requires_json, statsd_metrics
 
 logger = logging.getLogger(__name__)
 
+EXPORT_RESPONSE_CLASSES: dict[ChartDataResultFormat, type[Response]] = {
+    ChartDataResultFormat.CSV: CsvResponse,
+    ChartDataResultFormat.PARQUET: ParquetResponse,
+    ChartDataResultFormat.ARROW: ArrowResponse,
+}
+
 
 class SqlLabRestApi(BaseSupersetApi):
     method_permission_name = MODEL_API_RW_METHOD_PERMISSION_MAP
@@ -273,7 +286,7 @@ class SqlLabRestApi(BaseSupersetApi):
         action=lambda self, *args, **kwargs: f"{self.__class__.__name__}.export_csv",
         log_to_statsd=False,
     )
-    def export_csv(self, client_id: str) -> CsvResponse:
+    def export_csv(self, client_id: str) -> Response:
         """Export the SQL query results to a CSV.
         ---
         get:
@@ -284,6 +297,13 @@ class SqlLabRestApi(BaseSupersetApi):
               type: integer
             name: client_id
             description: The SQL query result identifier
+          - in: query
+            schema:
+              type: string
+              enum: [csv, parquet, arrow]
+              default: csv
+            name: format
+            description: The export format
           responses:
             200:
               description: SQL query results
@@ -291,6 +311,14 @@ class SqlLabRestApi(BaseSupersetApi):
                 text/csv:
                   schema:
                     type: string
+                application/vnd.apache.parquet:
+                  schema:
+                    type: string
+                    format: binary
+                application/vnd.apache.arrow.stream:
+                  schema:
+                    type: string
+                    format: binary
             400:
               $ref: '#/components/responses/400'
             401:
@@ -302,13 +330,21 @@ class SqlLabRestApi(BaseSupersetApi):
             500:
               $ref: '#/components/responses/500'
         """
-        result = SqlResultExportCommand(client_id=client_id).run()
+        try:
+            result_format = self._get_export_format(request.args.get("format"))
+        except ValueError as ex:
+            return self.response_400(message=str(ex))
+
+        result = SqlResultExportCommand(
+            client_id=client_id, result_format=result_format
+        ).run()
 
         query, data, row_count = result["query"], result["data"], result["count"]
 
         quoted_csv_name = parse.quote(query.name)
-        response = CsvResponse(
-            data, headers=generate_download_headers("csv", quoted_csv_name)
+        response_class = EXPORT_RESPONSE_CLASSES[result_format]
+        response = response_class(
+            data, headers=generate_download_headers(result_format, quoted_csv_name)
         )
         event_info = {
             "event_type": "data_export",
@@ -318,14 +354,25 @@ class SqlLabRestApi(BaseSupersetApi):
             "catalog": query.catalog,
             "schema": query.schema,
             "sql": query.sql,
-            "exported_format": "csv",
+            "exported_format": result_format.value,
         }
         event_rep = repr(event_info)
         logger.debug(
-            "CSV exported: %s", event_rep, extra={"superset_event": event_info}
+            "%s exported: %s",
+            result_format.upper(),
+            event_rep,
+            extra={"superset_event": event_info},
         )
         return response
 
+    @staticmethod
+    def _get_export_format(value: Optional[str]) -> ChartDataResultFormat:
+        """Parse the requested export format, defaulting to CSV."""
+        result_format = value or ChartDataResultFormat.CSV
+        if result_format not in EXPORT_RESPONSE_CLASSES:
+            raise ValueError(f"Unsupported export format: {value}")
+        return ChartDataResultFormat(result_format)
+
     @expose("/export_streaming/", methods=("POST",))
     @protect()
     @permission_name("read")
@@ -358,6 +405,10 @@ class SqlLabRestApi(BaseSupersetApi):
                     expected_rows:
                       type: integer
                       description: Optional expected row count for progress tracking
+                    format:
+                      type: string
+                      enum: [csv, parquet, arrow]
+                      description: The export format (default csv)
           responses:
             200:
               description: Streaming CSV export
@@ -365,6 +416,14 @@ class SqlLabRestApi(BaseSupersetApi):
                 text/csv:
                   schema:
                     type: string
+                application/vnd.apache.parquet:
+                  schema:
+                    type: string
+                    format: binary
+                application/vnd.apache.arrow.stream:
+                  schema:
+                    type: string
+                    format: binary
             400:
               $ref: '#/components/responses/400'
             401:
@@ -383,6 +442,11 @@ class SqlLabRestApi(BaseSupersetApi):
         if not client_id:
             return self.response_400(message="client_id is required")
 
+        try:
+            result_format = self._get_export_format(request.form.get("format"))
+        except ValueError as ex:
+            return self.response_400(message=str(ex))
+
         expected_rows = None
         if expected_rows_str := request.form.get("expected_rows"):
             try:
@@ -390,35 +454,44 @@ class SqlLabRestApi(BaseSupersetApi):
             except (ValueError, TypeError):
                 logger.warning("Invalid expected_rows value: %s", expected_rows_str)
 
-        return self._create_streaming_csv_response(client_id, filename, expected_rows)
+        return self._create_streaming_csv_response(
+            client_id, filename, expected_rows, result_format
+        )
 
     def _create_streaming_csv_response(
         self,
         client_id: str,
         filename: str | None = None,
         expected_rows: int | None = None,
+        result_format: ChartDataResultFormat = ChartDataResultFormat.CSV,
     ) -> Response:
         """Create a streaming CSV response for large SQL Lab result sets."""
         # Execute streaming command
         # TODO: Make chunk size configurable via SUPERSET_CONFIG
         chunk_size = 1024
-        command = StreamingSqlResultExportCommand(client_id, chunk_size)
+        command = StreamingSqlResultExportCommand(client_id, chunk_size, result_format)
         command.validate()
 
         if not filename:
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            filename = secure_filename(f"sqllab_{client_id}_{timestamp}.csv")
+            filename = secure_filename(
+                f"sqllab_{client_id}_{timestamp}.{result_format}"
+            )
 
         # Get the callable that returns the generator
         csv_generator_callable = command.run()
 
-        # Get encoding from config
-        encoding = app.config.get("CSV_EXPORT", {}).get("encoding", "utf-8")
+        if result_format == ChartDataResultFormat.CSV:
+            # Get encoding from config
+            encoding = app.config.get("CSV_EXPORT", {}).get("encoding", "utf-8")
+            mimetype = f"text/csv; charset={encoding}"
+        else:
+            mimetype = EXPORT_RESPONSE_CLASSES[result_format].default_mimetype
 
         # Create response with streaming headers
         response = Response(
             csv_generator_callable(),  # Call the callable to get generator
-            mimetype=f"text/csv; charset={encoding}",
+            mimetype=mimetype,
             headers={
                 "Content-Disposition": f'attachment; filename="{filename}"',
                 "Cache-Control": "no-cache",
@@ -431,7 +504,8 @@ class SqlLabRestApi(BaseSupersetApi):
         response.implicit_sequence_conversion = False
 
         logger.info(
-            "SQL Lab streaming CSV export started: client_id=%s, filename=%s",
+            "SQL Lab streaming %s export started: client_id=%s, filename=%s",
+            result_format.upper(),
             client_id,
             filename,
         )
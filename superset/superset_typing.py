@@ -116,6 +116,20 @@ Metric: TypeAlias = AdhocMetric | str
 OrderBy: TypeAlias = tuple[Metric | Column, bool]
 
 
+class WindowCumulativeSum(TypedDict):
+    """
+    Cumulative sums of metrics computed by the database with a window function.
+
+    index: Label of the column the values are accumulated over
+    partition_by: Labels of the columns the values are accumulated separately for
+    metrics: Labels of the metrics to accumulate
+    """
+
+    index: str
+    partition_by: list[str]
+    metrics: list[str]
+
+
 class QueryObjectDict(TypedDict, total=False):
     """
     TypedDict representation of query objects used throughout Superset.
@@ -152,6 +166,7 @@ class QueryObjectDict(TypedDict, total=False):
         extra_cache_keys: Additional keys for caching
         rls: Row level security filters
         changed_on: Last modified timestamp
+        window_cumulative_sum: Cumulative sums computed by the database
 
     Deprecated fields (still in use):
         groupby: Columns to group by (use columns instead)
@@ -189,6 +204,7 @@ class QueryObjectDict(TypedDict, total=False):
     extra_cache_keys: list[Hashable]
     rls: list[Any]
     changed_on: datetime | None
+    window_cumulative_sum: WindowCumulativeSum | None
 
     # Deprecated fields (still in use)
     groupby: list[Column]
@@ -85,28 +85,47 @@ def _load_user_from_job_metadata(job_metadata: dict[str, Any]) -> User:
 
 
 @celery_app.task(name="load_chart_data_into_cache", soft_time_limit=query_timeout)
-def load_chart_data_into_cache(
+def load_chart_data_into_cache(  # noqa: C901
     job_metadata: dict[str, Any],
     form_data: dict[str, Any],
+    coalesce_key: str | None = None,
 ) -> None:
+    """
+    Load chart data into the cache and notify the client of the job.
+
+    :param job_metadata: The metadata of the job
+    :param form_data: The chart data request
+    :param coalesce_key: If set, the key under which identical jobs joined this one,
+        they're notified of its completion too
+    """
     # pylint: disable=import-outside-toplevel
     from superset.commands.chart.data.get_data_command import ChartDataCommand
 
+    def update_jobs(status: str, **kwargs: Any) -> None:
+        async_query_manager.update_job(job_metadata, status, **kwargs)
+        if coalesce_key:
+            async_query_manager.update_coalesced_jobs(coalesce_key, status, **kwargs)
+
     with override_user(_load_user_from_job_metadata(job_metadata), force=False):
         try:
             set_form_data(form_data)
             query_context = _create_query_context_from_form(form_data)
             command = ChartDataCommand(query_context)
             result = command.run(cache=True)
+            if job_metadata.get("refresh_stale"):
+                # a background refresh of stale results, no client is waiting for it
+                return
             cache_key = result["cache_key"]
             result_url = f"/api/v1/chart/data/{cache_key}"
-            async_query_manager.update_job(
-                job_metadata,
-                async_query_manager.STATUS_DONE,
-                result_url=result_url,
-            )
+            update_jobs(async_query_manager.STATUS_DONE, result_url=result_url)
         except SoftTimeLimitExceeded as ex:
             logger.warning("A timeout occurred while loading chart data, error: %s", ex)
+            if coalesce_key:
+                async_query_manager.update_coalesced_jobs(
+                    coalesce_key,
+                    async_query_manager.STATUS_ERROR,
+                    errors=[{"message": str(ex)}],
+                )
             raise
         except Exception as ex:
             # Extract SIP-40 style errors when available
@@ -118,10 +137,13 @@ def load_chart_data_into_cache(
                 # Fallback for non-Superset exceptions
                 error = str(ex.message if hasattr(ex, "message") else ex)
                 errors = [{"message": error}]
-            async_query_manager.update_job(
-                job_metadata, async_query_manager.STATUS_ERROR, errors=errors
-            )
+            if not job_metadata.get("refresh_stale"):
+                update_jobs(async_query_manager.STATUS_ERROR, errors=errors)
             raise
+        finally:
+            if refresh_stale_key := job_metadata.get("refresh_stale_key"):
+                # allow the next request that finds the results stale to refresh them
+                cache_manager.data_cache.delete(refresh_stale_key)
 
 
 @celery_app.task(name="load_explore_json_into_cache", soft_time_limit=query_timeout)
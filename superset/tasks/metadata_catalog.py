@@ -0,0 +1,52 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+import logging
+
+from flask import current_app
+
+from superset import db
+from superset.databases import metadata_catalog
+from superset.extensions import celery_app
+from superset.models.core import Database
+from superset.stats_logger import BaseStatsLogger
+
+logger = logging.getLogger(__name__)
+
+
+@celery_app.task(name="metadata_catalog.refresh")
+def refresh() -> None:
+    """
+    Refresh the stale entries of the metadata catalog of every database.
+    """
+    stats_logger: BaseStatsLogger = current_app.config["STATS_LOGGER"]
+    stats_logger.incr("metadata_catalog.refresh")
+
+    for database in db.session.query(Database).all():
+        if not metadata_catalog.is_enabled(database):
+            continue
+        try:
+            refreshed = metadata_catalog.refresh_database(database)
+        except Exception:  # pylint: disable=broad-except
+            logger.exception(
+                "Failed to refresh the metadata catalog of database %s", database.id
+            )
+            continue
+        logger.info(
+            "Refreshed %d metadata catalog entries of database %s",
+            refreshed,
+            database.id,
+        )
@@ -0,0 +1,234 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+"""
+Export of tabular results as Parquet files or Arrow IPC streams.
+"""
+
+from __future__ import annotations
+
+import logging
+from collections.abc import Iterable, Iterator, Sequence
+from typing import Any
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+logger = logging.getLogger(__name__)
+
+
+class StreamBuffer:
+    """
+    A write-only file object whose content can be drained while it's being written.
+
+    Writers like ``pq.ParquetWriter`` use ``tell`` to record offsets in the file, so
+    the position keeps counting the bytes that were already drained.
+    """
+
+    def __init__(self) -> None:
+        self._chunks: list[bytes] = []
+        self._position = 0
+        self.closed = False
+
+    def write(self, data: Any) -> int:
+        chunk = bytes(data)
+        self._chunks.append(chunk)
+        self._position += len(chunk)
+        return len(chunk)
+
+    def tell(self) -> int:
+        return self._position
+
+    def flush(self) -> None:
+        pass
+
+    def close(self) -> None:
+        self.closed = True
+
+    def drain(self) -> bytes:
+        data = b"".join(self._chunks)
+        self._chunks = []
+        return data
+
+
+def df_to_arrow_table(df: pd.DataFrame, index: bool = False) -> pa.Table:
+    """
+    Convert a dataframe to an Arrow table.
+
+    Column names are cast to strings, and object columns with values Arrow can't
+    represent in a single type (eg, mixed strings and numbers) are cast to strings.
+
+    :param df: the dataframe to convert
+    :param index: whether to keep the index as a column
+    :returns: an Arrow table
+    """
+    df = df.copy(deep=False)
+    df.columns = [str(column) for column in df.columns]
+    try:
+        return pa.Table.from_pandas(df, preserve_index=index)
+    except (pa.ArrowInvalid, pa.ArrowTypeError):
+        pass
+
+    for i in range(len(df.columns)):
+        column = df.iloc[:, i]
+        try:
+            pa.array(column, from_pandas=True)
+        except (pa.ArrowInvalid, pa.ArrowTypeError):
+            logger.debug("Casting column %s to string", df.columns[i])
+            df.isetitem(i, column.astype(str).where(column.notna(), None))
+
+    return pa.Table.from_pandas(df, preserve_index=index)
+
+
+def table_to_parquet(table: pa.Table, **kwargs: Any) -> bytes:
+    """
+    Write an Arrow table as a Parquet file.
+
+    :param table: the table to write
+    :param kwargs: options passed to ``pq.ParquetWriter``, eg, ``compression``
+    :returns: the content of the Parquet file
+    """
+    sink = pa.BufferOutputStream()
+    pq.write_table(table, sink, **kwargs)
+    return sink.getvalue().to_pybytes()
+
+
+def table_to_arrow_ipc(table: pa.Table, **kwargs: Any) -> bytes:
+    """
+    Write an Arrow table as an Arrow IPC stream.
+
+    :param table: the table to write
+    :param kwargs: options passed to ``pa.ipc.IpcWriteOptions``, eg, ``compression``
+    :returns: the content of the stream
+    """
+    sink = pa.BufferOutputStream()
+    options = pa.ipc.IpcWriteOptions(**kwargs)
+    with pa.ipc.new_stream(sink, table.schema, options=options) as writer:
+        writer.write_table(table)
+    return sink.getvalue().to_pybytes()
+
+
+def df_to_parquet(df: pd.DataFrame, index: bool = False, **kwargs: Any) -> bytes:
+    return table_to_parquet(df_to_arrow_table(df, index=index), **kwargs)
+
+
+def df_to_arrow_ipc(df: pd.DataFrame, index: bool = False, **kwargs: Any) -> bytes:
+    return table_to_arrow_ipc(df_to_arrow_table(df, index=index), **kwargs)
+
+
+def _stream_field(field: pa.Field) -> pa.Field:
+    """
+    Widen the type of a column inferred from a single batch of rows, so the values of
+    later batches fit in it.
+
+    Numbers are written as doubles, like in JSON results, since the type inferred for
+    a batch depends on its values (eg, the scale of decimals, or integers followed by
+    fractions), and columns with only nulls are written as strings.
+    """
+    if pa.types.is_null(field.type):
+        return field.with_type(pa.string())
+    if (
+        pa.types.is_integer(field.type)
+        or pa.types.is_floating(field.type)
+        or pa.types.is_decimal(field.type)
+    ):
+        return field.with_type(pa.float64())
+    return field
+
+
+def _cast_table(table: pa.Table, schema: pa.Schema) -> pa.Table:
+    """
+    Cast a batch of rows to the schema of the stream.
+
+    Numbers are cast without checking for a loss of precision, and values that Arrow
+    can't cast to strings (eg, lists) are converted with ``str``.
+    """
+    columns = []
+    for column, field in zip(table.columns, schema, strict=True):
+        if pa.types.is_floating(field.type):
+            columns.append(column.cast(field.type, safe=False))
+            continue
+        try:
+            columns.append(column.cast(field.type))
+        except (pa.ArrowInvalid, pa.ArrowNotImplementedError):
+            if not pa.types.is_string(field.type):
+                raise
+            columns.append(
+                pa.array(
+                    [
+                        None if value is None else str(value)
+                        for value in column.to_pylist()
+                    ],
+                    type=pa.string(),
+                )
+            )
+    return pa.Table.from_arrays(columns, schema=schema)
+
+
+def stream_rows(
+    columns: Sequence[str],
+    batches: Iterable[Sequence[Sequence[Any]]],
+    result_format: str,
+    **kwargs: Any,
+) -> Iterator[bytes]:
+    """
+    Write batches of rows as a Parquet file or an Arrow IPC stream, chunk by chunk.
+
+    The schema is inferred from the first batch and widened so later batches fit in
+    it: numbers are written as doubles, and columns with only nulls as strings.
+
+    :param columns: the column names
+    :param batches: the rows to write, one batch becomes a row group or record batch
+    :param result_format: either ``parquet`` or ``arrow``
+    :param kwargs: options passed to the writer, see ``table_to_parquet`` and
+        ``table_to_arrow_ipc``
+    :returns: a generator of binary chunks
+    """
+    columns = [str(column) for column in columns]
+    sink = StreamBuffer()
+    writer: pq.ParquetWriter | pa.ipc.RecordBatchStreamWriter | None = None
+    schema: pa.Schema | None = None
+
+    for rows in batches:
+        table = df_to_arrow_table(
+            pd.DataFrame.from_records(list(rows), columns=columns)
+        ).replace_schema_metadata(None)
+        if schema is None:
+            schema = pa.schema(_stream_field(field) for field in table.schema)
+            if result_format == "parquet":
+                writer = pq.ParquetWriter(sink, schema, **kwargs)
+            else:
+                options = pa.ipc.IpcWriteOptions(**kwargs)
+                writer = pa.ipc.new_stream(sink, schema, options=options)
+
+        writer.write_table(_cast_table(table, schema))  # type: ignore
+        if data := sink.drain():
+            yield data
+
+    if writer is None:
+        # no rows, write an empty file with all the columns typed as strings
+        schema = pa.schema(pa.field(column, pa.string()) for column in columns)
+        table = schema.empty_table()
+        if result_format == "parquet":
+            yield table_to_parquet(table, **kwargs)
+        else:
+            yield table_to_arrow_ipc(table, **kwargs)
+        return
+
+    writer.close()
+    if data := sink.drain():
+        yield data
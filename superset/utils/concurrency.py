@@ -0,0 +1,126 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+from __future__ import annotations
+
+import logging
+import threading
+from collections.abc import Sequence
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, TypeVar
+
+from flask import (
+    copy_current_request_context,
+    current_app as app,
+    Flask,
+    g,
+    has_app_context,
+    has_request_context,
+)
+
+from superset.extensions import db
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+# tracks whether the current thread is a worker of `execute_concurrently`
+_worker_state = threading.local()
+
+
+def with_app_context(
+    task: Callable[[], T],
+    flask_app: Flask | None = None,
+) -> Callable[[], T]:
+    """
+    Wrap a callable so it can run in another thread.
+
+    Flask contexts are local to the thread that handles the request, so the wrapped
+    callable runs inside a new app context with a copy of ``g`` (which holds the
+    logged in user, needed for RLS and impersonation) and, if there's one, a copy of
+    the current request context. The thread-local SQLAlchemy session is removed once
+    the callable finishes.
+
+    Outside of an app context the callable runs in a new context of ``flask_app``,
+    or unchanged if it's not given.
+    """
+    if has_app_context():
+        flask_app = app._get_current_object()  # pylint: disable=protected-access
+        g_copy = dict(g.__dict__)
+    elif flask_app is None:
+        return task
+    else:
+        g_copy = {}
+
+    def run_task() -> T:
+        # restore `g` in the innermost context, which is the one the task sees
+        for key, value in g_copy.items():
+            setattr(g, key, value)
+        return task()
+
+    if has_request_context():
+        run_task = copy_current_request_context(run_task)
+
+    def wrapper() -> T:
+        with flask_app.app_context():
+            try:
+                return run_task()
+            finally:
+                db.session.remove()
+
+    return wrapper
+
+
+def _run_in_worker(task: Callable[[], T]) -> T:
+    _worker_state.active = True
+    return task()
+
+
+def execute_concurrently(
+    tasks: Sequence[Callable[[], T]],
+    max_workers: int,
+    thread_name_prefix: str = "superset",
+) -> list[T]:
+    """
+    Run callables on a bounded thread pool, returning the results in order.
+
+    When ``max_workers`` is 1, or there's a single task, the callables run sequentially
+    in the current thread. Calls made from a worker thread also run sequentially, so
+    nested calls (eg, the time offsets of queries that already run concurrently) don't
+    multiply the number of threads, and of queries, beyond ``max_workers``.
+
+    If any of the tasks fails the pending ones are cancelled and the exception of the
+    first failing task (in order) is raised.
+
+    :param tasks: callables without arguments
+    :param max_workers: the maximum number of tasks running at the same time
+    :param thread_name_prefix: prefix for the name of the worker threads
+    :returns: the return values of the callables, in the same order
+    """
+    if max_workers <= 1 or len(tasks) <= 1 or getattr(_worker_state, "active", False):
+        return [task() for task in tasks]
+
+    executor = ThreadPoolExecutor(
+        max_workers=min(max_workers, len(tasks)),
+        thread_name_prefix=thread_name_prefix,
+    )
+    futures: list[Future[Any]] = [
+        executor.submit(_run_in_worker, with_app_context(task)) for task in tasks
+    ]
+    try:
+        return [future.result() for future in futures]
+    finally:
+        executor.shutdown(wait=True, cancel_futures=True)
@@ -17,11 +17,12 @@
 import logging
 import re
 import urllib.request
+from collections.abc import Sequence
 from typing import Any, Optional, Union
 from urllib.error import URLError
 
-import numpy as np
 import pandas as pd
+from pandas.api.types import is_object_dtype, is_string_dtype
 
 from superset.utils import json
 from superset.utils.core import GenericDataType
@@ -64,21 +65,72 @@ def escape_value(value: str) -> str:
     return value
 
 
-def df_to_escaped_csv(df: pd.DataFrame, **kwargs: Any) -> Any:
+def escape_series(series: pd.Series) -> Optional[pd.Series]:
+    """
+    Escapes the string values of a column.
+
+    :param series: the column to escape
+    :returns: a copy of the column with the escaped values, or ``None`` if no value
+        needs escaping
+    """
+    if not (is_object_dtype(series.dtype) or is_string_dtype(series.dtype)):
+        return None
+
+    try:
+        strings = series.str
+    except AttributeError:
+        # no string values
+        return None
+
+    mask = strings.match(problematic_chars_re, na=False) & ~strings.match(
+        negative_number_re, na=False
+    )
+    mask = mask.to_numpy(dtype=bool)
+    if not mask.any():
+        return None
+
+    # Escape pipe to be extra safe as this can lead to remote code execution, and
+    # precede the value with a single quote, see ``escape_value``
+    series = series.copy()
+    series[mask] = "'" + series[mask].str.replace("|", "\\|", regex=False)
+    return series
+
+
+def escape_df(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Escapes the column names and string values of a dataframe.
+
+    Only the columns with values that need escaping are copied.
+    """
+
     def escape_values(v: Any) -> Union[str, Any]:
         return escape_value(v) if isinstance(v, str) else v
 
     # Escape csv headers
-    df = df.rename(columns=escape_values)
+    escaped_df = df.rename(columns=escape_values, copy=False)
+
+    # Escape csv values, by position as column names might not be unique
+    for i in range(len(df.columns)):
+        if (column := escape_series(df.iloc[:, i])) is not None:
+            escaped_df.isetitem(i, column)
+
+    return escaped_df
 
-    # Escape csv values
-    for name, column in df.items():
-        if column.dtype == np.dtype(object):
-            for idx, value in enumerate(column.values):
-                if isinstance(value, str):
-                    df.at[idx, name] = escape_value(value)
 
-    return df.to_csv(escapechar="\\", **kwargs)
+def escape_rows(rows: Sequence[Sequence[Any]]) -> list[tuple[Any, ...]]:
+    """
+    Escapes the string values of a chunk of rows, eg, rows fetched by a streaming
+    export. Values that don't need escaping are returned as is.
+    """
+    if not rows:
+        return []
+
+    df = escape_df(pd.DataFrame(list(rows), dtype=object))
+    return list(df.itertuples(index=False, name=None))
+
+
+def df_to_escaped_csv(df: pd.DataFrame, **kwargs: Any) -> Any:
+    return escape_df(df).to_csv(escapechar="\\", **kwargs)
 
 
 def get_chart_csv_data(
@@ -31,6 +31,7 @@ def cum(
     df: DataFrame,
     operator: str,
     columns: dict[str, str],
+    accumulated: bool = False,
 ) -> DataFrame:
     """
     Calculate cumulative sum/product/min/max for select columns.
@@ -42,11 +43,13 @@ def cum(
            `y2` based on cumulative values calculated from `y`, leaving the original
            column `y` unchanged.
     :param operator: cumulative operator, e.g. `sum`, `prod`, `min`, `max`
+    :param accumulated: whether the values were already accumulated, e.g. with a
+           window function in the database, in which case only the cells missing
+           after a pivot are filled with the previous value
     :return: DataFrame with cumulated columns
     """
     columns = columns or {}
     df_cum = df.loc[:, columns.keys()]
-    df_cum = df_cum.fillna(0)
     operation = "cum" + operator
     if operation not in ALLOWLIST_CUMULATIVE_FUNCTIONS or not hasattr(
         df_cum, operation
@@ -54,5 +57,7 @@ def cum(
         raise InvalidPostProcessingError(
             _("Invalid cumulative operator: %(operator)s", operator=operator)
         )
-    df_cum = _append_columns(df, getattr(df_cum, operation)(), columns)
+    if accumulated:
+        return _append_columns(df, df_cum.ffill().fillna(0), columns)
+    df_cum = _append_columns(df, getattr(df_cum.fillna(0), operation)(), columns)
     return df_cum
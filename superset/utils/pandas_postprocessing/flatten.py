@@ -38,6 +38,7 @@ def flatten(
     df: pd.DataFrame,
     reset_index: bool = True,
     drop_levels: Union[Sequence[int], Sequence[str]] = (),
+    inplace: bool = False,
 ) -> pd.DataFrame:
     """
     Convert N-dimensional DataFrame to a flat DataFrame
@@ -46,6 +47,8 @@ def flatten(
     :param reset_index: Convert index to column when df.index isn't RangeIndex
     :param drop_levels: index of level or names of level might be dropped
                         if df is N-dimensional
+    :param inplace: Whether to reset the index of the DataFrame in place instead of
+                    returning a copy.
     :return: a flat DataFrame
 
     Examples
@@ -101,5 +104,8 @@ def flatten(
         df.columns = _columns
 
     if reset_index and not isinstance(df.index, pd.RangeIndex):
-        df = df.reset_index(level=0)
+        if inplace:
+            df.reset_index(level=0, inplace=True)
+        else:
+            df = df.reset_index(level=0)
     return df
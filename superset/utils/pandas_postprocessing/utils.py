@@ -98,6 +98,10 @@ RESAMPLE_METHOD = ("asfreq", "bfill", "ffill", "linear", "median", "mean", "sum"
 
 FLAT_COLUMN_SEPARATOR = ", "
 
+# operations that can change a DataFrame in place instead of building a new one, which
+# is done when the DataFrame was built by a previous post processing operation
+INPLACE_OPERATIONS = ("flatten", "rename")
+
 
 def _is_multi_index_on_columns(df: DataFrame) -> bool:
     return isinstance(df.columns, pd.MultiIndex)
@@ -690,6 +690,22 @@ class XlsxResponse(Response):
     )
 
 
+class ParquetResponse(Response):
+    """
+    Override Response to use parquet mimetype
+    """
+
+    default_mimetype = "application/vnd.apache.parquet"
+
+
+class ArrowResponse(Response):
+    """
+    Override Response to use Arrow IPC stream mimetype
+    """
+
+    default_mimetype = "application/vnd.apache.arrow.stream"
+
+
 def bind_field(
     _: Any, form: DynamicForm, unbound_field: UnboundField, options: dict[Any, Any]
 ) -> Field:
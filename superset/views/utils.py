@@ -540,6 +540,25 @@ def check_datasource_perms(
     viz_obj.raise_for_access()
 
 
+def _read_results_table(data: bytes) -> pa.Table:
+    with stats_timing("sqllab.query.results_backend_pa_deserialize", stats_logger):
+        try:
+            reader = pa.BufferReader(data)
+            return pa.ipc.open_stream(reader).read_all()
+        except pa.ArrowSerializationError as ex:
+            raise SerializationError("Unable to deserialize table") from ex
+
+
+def _deserialize_results_table(payload: Union[bytes, str]) -> pa.Table:
+    """
+    Read the Arrow table of a results payload serialized with msgpack.
+    """
+    with stats_timing("sqllab.query.results_backend_msgpack_deserialize", stats_logger):
+        ds_payload = msgpack.loads(payload, raw=False)
+
+    return _read_results_table(ds_payload["data"])
+
+
 def _deserialize_results_payload(
     payload: Union[bytes, str], query: Query, use_msgpack: Optional[bool] = False
 ) -> dict[str, Any]:
@@ -550,13 +569,7 @@ def _deserialize_results_payload(
         ):
             ds_payload = msgpack.loads(payload, raw=False)
 
-        with stats_timing("sqllab.query.results_backend_pa_deserialize", stats_logger):
-            try:
-                reader = pa.BufferReader(ds_payload["data"])
-                pa_table = pa.ipc.open_stream(reader).read_all()
-            except pa.ArrowSerializationError as ex:
-                raise SerializationError("Unable to deserialize table") from ex
-
+        pa_table = _read_results_table(ds_payload["data"])
         df = result_set.SupersetResultSet.convert_table_to_df(pa_table)
         ds_payload["data"] = dataframe.df_to_records(df) or []
 
@@ -115,6 +115,33 @@ class TestAsyncEventApi(SupersetTestCase):
         }
         assert response == expected
 
+    def _test_stream_logic(self, mock_cache):
+        channel_id = app.config["GLOBAL_ASYNC_QUERIES_REDIS_STREAM_PREFIX"] + self.UUID
+        with mock.patch.object(mock_cache, "xread") as mock_xread:
+            mock_xread.return_value = [
+                (
+                    channel_id.encode(),
+                    [(b"1607477697866-0", {b"data": b'{"status": "done"}'})],
+                )
+            ]
+            with mock.patch("time.monotonic", side_effect=[0, 1, 400]):
+                rv = self.client.get(
+                    "api/v1/async_event/stream",
+                    headers={"Last-Event-ID": "1607471525180-0"},
+                )
+                data = rv.data.decode("utf-8")
+
+        assert rv.status_code == 200
+        assert rv.mimetype == "text/event-stream"
+        mock_xread.assert_called_with({channel_id: "1607471525180-0"}, 100, 15000)
+        assert data == (
+            'id: 1607477697866-0\ndata: {"id": "1607477697866-0", "status": "done"}\n\n'
+        )
+
+    @mock.patch("uuid.uuid4", return_value=UUID)
+    def test_stream_redis_cache_backend(self, mock_uuid4):
+        self.run_test_with_cache_backend(RedisCacheBackend, self._test_stream_logic)
+
     @mock.patch("uuid.uuid4", return_value=UUID)
     def test_events_redis_cache_backend(self, mock_uuid4):
         self.run_test_with_cache_backend(RedisCacheBackend, self._test_events_logic)
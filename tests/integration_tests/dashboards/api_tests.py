@@ -443,6 +443,31 @@ class TestDashboardApi(ApiOwnersTestCaseMixin, InsertChartMixin, SupersetTestCas
         assert len(data["result"]) == 1
         assert data["result"][0]["slice_name"] == dashboard.slices[0].slice_name
 
+    @pytest.mark.usefixtures("load_world_bank_dashboard_with_slices")
+    def test_get_dashboard_bootstrap(self):
+        """
+        Dashboard API: Test getting a dashboard with its charts and datasets
+        """
+        self.login(ADMIN_USERNAME)
+        uri = "api/v1/dashboard/world_health/bootstrap"
+        response = self.get_assert_metric(uri, "get_bootstrap")
+        assert response.status_code == 200
+        assert response.headers["ETag"]
+        data = json.loads(response.data.decode("utf-8"))
+        dashboard = Dashboard.get("world_health")
+        result = data["result"]
+        assert result["dashboard"]["id"] == dashboard.id
+        assert {chart["id"] for chart in result["charts"]} == {
+            slc.id for slc in dashboard.slices
+        }
+        assert {dataset["id"] for dataset in result["datasets"]} == {
+            slc.datasource_id for slc in dashboard.slices
+        }
+
+        # conditional requests
+        rv = self.client.get(uri, headers={"If-None-Match": response.headers["ETag"]})
+        assert rv.status_code == 304
+
     @pytest.mark.usefixtures("create_dashboards")
     def test_get_dashboard_charts_not_found(self):
         """
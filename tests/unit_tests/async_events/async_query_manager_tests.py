@@ -30,6 +30,7 @@ from superset.async_events.cache_backend import (
     RedisCacheBackend,
     RedisSentinelCacheBackend,
 )
+from superset.utils import json
 
 JWT_TOKEN_SECRET = "some_secret"  # noqa: S105
 JWT_TOKEN_COOKIE_NAME = "superset_async_jwt"  # noqa: S105
@@ -166,3 +167,138 @@ def test_submit_explore_json_job_as_guest_user(
     )
 
     assert "guest_token" not in job_meta
+
+
+def test_submit_chart_data_job_coalesced(async_query_manager):
+    """
+    Test that identical chart data jobs join the one that is running.
+    """
+    cache = mock.Mock(spec=RedisCacheBackend)
+    cache.add.side_effect = [True, False]
+    cache.has.return_value = True
+    async_query_manager._cache = cache
+    async_query_manager._stream_prefix = "async-events-"
+    async_query_manager._stream_limit = 1000
+    async_query_manager._stream_limit_firehose = 1000000
+    async_query_manager._job_coalescing_timeout = 60
+    job_mock = Mock()
+    async_query_manager._load_chart_data_into_cache_job = job_mock
+
+    first_job = async_query_manager.submit_chart_data_job(
+        channel_id="first_channel_id",
+        form_data={},
+        user_id=1,
+        cache_key="key",
+    )
+    second_job = async_query_manager.submit_chart_data_job(
+        channel_id="second_channel_id",
+        form_data={},
+        user_id=2,
+        cache_key="key",
+    )
+
+    job_mock.delay.assert_called_once_with(first_job, {}, coalesce_key="key")
+    cache.add.assert_called_with("async-events-running-key", ANY, 60)
+    cache.rpush.assert_called_once_with(
+        "async-events-subscribers-key", json.dumps(second_job), 60
+    )
+    cache.lrem.assert_not_called()
+
+    # the running job completes
+    cache.pop_all.return_value = [json.dumps(second_job).encode()]
+    async_query_manager.update_coalesced_jobs("key", "done", result_url="/url")
+
+    cache.delete.assert_called_once_with("async-events-running-key")
+    assert cache.xadd.call_args_list[0].args[0] == "async-events-second_channel_id"
+    assert json.loads(cache.xadd.call_args_list[0].args[1]["data"]) == {
+        **second_job,
+        "status": "done",
+        "result_url": "/url",
+    }
+
+
+def test_submit_chart_data_job_coalesced_completed(async_query_manager):
+    """
+    Test that a job runs if the identical job completed before it could join it.
+    """
+    cache = mock.Mock(spec=RedisCacheBackend)
+    cache.add.return_value = False
+    cache.has.return_value = False
+    cache.lrem.return_value = 1
+    async_query_manager._cache = cache
+    async_query_manager._job_coalescing_timeout = 60
+    job_mock = Mock()
+    async_query_manager._load_chart_data_into_cache_job = job_mock
+
+    job = async_query_manager.submit_chart_data_job(
+        channel_id="test_channel_id",
+        form_data={},
+        cache_key="key",
+    )
+
+    job_mock.delay.assert_called_once_with(job, {}, coalesce_key="key")
+
+    # without coalescing, jobs always run
+    async_query_manager._job_coalescing_timeout = 0
+    job_mock.reset_mock()
+    job = async_query_manager.submit_chart_data_job(
+        channel_id="test_channel_id",
+        form_data={},
+        cache_key="key",
+    )
+    job_mock.delay.assert_called_once_with(job, {})
+
+
+def test_stream_events(async_query_manager):
+    """
+    Test that events are streamed in batches, with heartbeats when idle.
+    """
+    cache = mock.Mock(spec=RedisCacheBackend)
+    cache.xread.side_effect = [
+        [
+            (
+                b"async-events-test_channel_id",
+                [
+                    (b"1607477697866-0", {b"data": b'{"job_id": "1"}'}),
+                    (b"1607477697993-0", {b"data": b'{"job_id": "2"}'}),
+                ],
+            )
+        ],
+        [],
+    ]
+    async_query_manager._cache = cache
+    async_query_manager._stream_prefix = "async-events-"
+    async_query_manager._sse_heartbeat_interval = 15
+
+    with mock.patch("time.monotonic", side_effect=[0, 1, 2, 400]):
+        chunks = list(async_query_manager.stream_events("test_channel_id", None))
+
+    assert chunks == [
+        'id: 1607477697866-0\ndata: {"id": "1607477697866-0", "job_id": "1"}\n\n'
+        'id: 1607477697993-0\ndata: {"id": "1607477697993-0", "job_id": "2"}\n\n',
+        ": heartbeat\n\n",
+    ]
+    assert cache.xread.call_args_list == [
+        mock.call({"async-events-test_channel_id": "0"}, 100, 15000),
+        mock.call({"async-events-test_channel_id": "1607477697993-0"}, 100, 15000),
+    ]
+
+
+@mark.parametrize("firehose_enabled, stream_count", [(True, 2), (False, 1)])
+def test_update_job_firehose(async_query_manager, firehose_enabled, stream_count):
+    """
+    Test that events are only written to the firehose stream when it's read.
+    """
+    cache = mock.Mock(spec=RedisCacheBackend)
+    async_query_manager._cache = cache
+    async_query_manager._stream_prefix = "async-events-"
+    async_query_manager._stream_limit = 1000
+    async_query_manager._stream_limit_firehose = 1000000
+    async_query_manager._firehose_enabled = firehose_enabled
+
+    async_query_manager.update_job(
+        {"channel_id": "test_channel_id", "job_id": "1"}, "done"
+    )
+
+    assert cache.xadd.call_count == stream_count
+    assert cache.xadd.call_args_list[0].args[0] == "async-events-test_channel_id"
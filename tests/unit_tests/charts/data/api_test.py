@@ -0,0 +1,63 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+from datetime import datetime
+
+import pytest
+
+from superset.charts.data.api import generate_json_result_chunks
+from superset.utils import json
+
+
+@pytest.mark.parametrize("chunk_size", [1, 2, 10])
+def test_generate_json_result_chunks(chunk_size: int) -> None:
+    """
+    Test that the streamed JSON matches the payload serialized at once.
+    """
+    queries = [
+        {
+            "cache_key": "abc",
+            "data": [
+                {"a": 1, "b": datetime(2024, 1, 1), "c": float("nan")},
+                {"a": 2, "b": datetime(2024, 1, 2), "c": 1.5},
+                {"a": 3, "b": None, "c": None},
+            ],
+            "rowcount": 3,
+        },
+        {"data": []},
+        {"data": "a,b\n1,2\n", "rowcount": 1},
+        {},
+    ]
+
+    chunks = list(generate_json_result_chunks(queries, chunk_size))
+
+    assert "".join(chunks) == json.dumps(
+        {"result": queries},
+        default=json.json_int_dttm_ser,
+        ignore_nan=True,
+    )
+    assert json.loads("".join(chunks))["result"][0]["data"][2] == {
+        "a": 3,
+        "b": None,
+        "c": None,
+    }
+
+
+def test_generate_json_result_chunks_empty() -> None:
+    """
+    Test streaming a result without queries.
+    """
+    assert "".join(generate_json_result_chunks([], 10)) == '{"result": []}'
@@ -502,6 +502,43 @@ def test_completion_logging(mock_logger, mocker, mock_query, mock_result_proxy):
     assert "rows" in log_message
 
 
+def test_csv_generation_escapes_formulas(mocker, mock_query):
+    """Test CSV generation escapes values that could be evaluated as formulas."""
+    mock_query.select_sql = "SELECT * FROM test"
+
+    mock_result = MagicMock()
+    mock_result.keys.return_value = ["=name", "value"]
+    mock_result.fetchmany.side_effect = [
+        [("=cmd|' /C calc'!A0", -10), ("-10", "@SUM(A1)")],
+        [],
+    ]
+
+    mock_db, mock_session = _setup_sqllab_mocks(mocker, mock_query)
+
+    mock_connection = MagicMock()
+    mock_connection.execution_options.return_value.execute.return_value = mock_result
+    mock_connection.__enter__.return_value = mock_connection
+    mock_connection.__exit__.return_value = None
+
+    mock_engine = MagicMock()
+    mock_engine.connect.return_value = mock_connection
+    mock_query.database.get_sqla_engine.return_value.__enter__.return_value = (
+        mock_engine
+    )
+
+    command = StreamingSqlResultExportCommand("test_client_123")
+    command.validate()
+
+    csv_data = "".join(command.run()())
+
+    lines = [line.strip() for line in csv_data.strip().split("\n")]
+    assert lines == [
+        "'=name,value",
+        "'=cmd\\|' /C calc'!A0,-10",
+        "-10,'@SUM(A1)",
+    ]
+
+
 def test_null_values_handling(mocker, mock_query):
     """Test CSV generation handles NULL values correctly."""
     mock_query.select_sql = "SELECT * FROM test"
@@ -538,3 +575,57 @@ def test_null_values_handling(mocker, mock_query):
     assert "1,,100" in csv_data
     assert "2,test," in csv_data
     assert ",," in csv_data
+
+
+@pytest.mark.parametrize("result_format", ["parquet", "arrow"])
+def test_binary_generation_with_limit(mocker, mock_query, result_format):
+    """Test Parquet and Arrow generation, one chunk per fetched batch."""
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    from superset.common.chart_data import ChartDataResultFormat
+
+    mock_query.select_sql = "SELECT * FROM test WHERE id > 0"
+    mock_query.executed_sql = None
+    mock_db, mock_session = _setup_sqllab_mocks(mocker, mock_query)
+    mocker.patch.object(
+        StreamingSqlResultExportCommand, "_get_row_limit", return_value=4
+    )
+
+    mock_result = MagicMock()
+    mock_result.keys.return_value = ["id", "name"]
+    mock_result.fetchmany.side_effect = [
+        [(1, None), (2, None)],
+        [(3, "test3"), (4, "test4"), (5, "test5")],
+        [],
+    ]
+
+    mock_connection = MagicMock()
+    mock_connection.execution_options.return_value.execute.return_value = mock_result
+    mock_connection.__enter__.return_value = mock_connection
+    mock_connection.__exit__.return_value = None
+
+    mock_engine = MagicMock()
+    mock_engine.connect.return_value = mock_connection
+    mock_query.database.get_sqla_engine.return_value.__enter__.return_value = (
+        mock_engine
+    )
+
+    command = StreamingSqlResultExportCommand(
+        "test_client_123",
+        chunk_size=3,
+        result_format=ChartDataResultFormat(result_format),
+    )
+    command.validate()
+
+    chunks = list(command.run()())
+
+    assert all(isinstance(chunk, bytes) for chunk in chunks)
+    if result_format == "parquet":
+        table = pq.read_table(pa.BufferReader(b"".join(chunks)))
+    else:
+        table = pa.ipc.open_stream(b"".join(chunks)).read_all()
+    assert table.to_pydict() == {
+        "id": [1, 2, 3, 4],
+        "name": [None, None, "test3", "test4"],
+    }
@@ -0,0 +1,125 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+from datetime import date
+from decimal import Decimal
+
+import pandas as pd
+import pytest
+from pytest_mock import MockerFixture
+
+from superset.common.utils.dataframe_codec import (
+    ArrowDataFrameCodec,
+    DataFrameCodecEncodeError,
+)
+from superset.common.utils.query_cache_manager import QueryCacheManager
+
+
+@pytest.fixture
+def df() -> pd.DataFrame:
+    return pd.DataFrame(
+        {
+            "name": ["Alice", "Bob", None],
+            "count": [1, 2, 3],
+            "ratio": [0.5, None, 1.5],
+            "dttm": pd.to_datetime(["2024-01-01", "2024-01-02", None]),
+            "dttm_tz": pd.to_datetime(
+                ["2024-01-01", "2024-01-02", "2024-01-03"]
+            ).tz_localize("America/New_York"),
+            "day": [date(2024, 1, 1), date(2024, 1, 2), None],
+            "amount": [Decimal("1.10"), Decimal("2.20"), None],
+            "flag": [True, False, True],
+        }
+    )
+
+
+@pytest.mark.parametrize("compression", [None, "lz4", "zstd"])
+def test_arrow_codec_round_trip(df: pd.DataFrame, compression: str | None) -> None:
+    """
+    Test that dataframes round trip through the Arrow codec unchanged.
+    """
+    codec = ArrowDataFrameCodec(compression=compression)  # type: ignore
+    pd.testing.assert_frame_equal(codec.decode(codec.encode(df)), df)
+
+
+def test_arrow_codec_index(df: pd.DataFrame) -> None:
+    """
+    Test that non-default indexes are preserved.
+    """
+    codec = ArrowDataFrameCodec()
+    df = df.set_index("name")
+    pd.testing.assert_frame_equal(codec.decode(codec.encode(df)), df)
+
+
+def test_arrow_codec_integer_nulls() -> None:
+    """
+    Test that integers with nulls round trip without losing precision.
+    """
+    df = pd.DataFrame({"id": [9007199254740993, None]}, dtype=object)
+    codec = ArrowDataFrameCodec()
+
+    decoded = codec.decode(codec.encode(df))
+
+    assert decoded["id"].tolist() == [9007199254740993, None]
+
+
+@pytest.mark.parametrize(
+    "df",
+    [
+        pd.DataFrame({0: [1, 2]}),
+        pd.DataFrame(
+            [[1, 2]], columns=pd.MultiIndex.from_tuples([("a", "b"), ("a", "c")])
+        ),
+        pd.DataFrame({"a": [[1, 2], [3]]}),
+        pd.DataFrame({"a": [{"b": 1}, {"b": 2}]}),
+        pd.DataFrame({"a": [1, "b"]}),
+    ],
+)
+def test_arrow_codec_unsupported(df: pd.DataFrame) -> None:
+    """
+    Test that dataframes which don't round trip through Arrow are rejected.
+    """
+    with pytest.raises(DataFrameCodecEncodeError):
+        ArrowDataFrameCodec().encode(df)
+
+
+def test_query_cache_manager_codec(mocker: MockerFixture, df: pd.DataFrame) -> None:
+    """
+    Test that the cache manager stores encoded dataframes and decodes them.
+    """
+    mocker.patch.dict(
+        "flask.current_app.config",
+        {"DATA_CACHE_DATAFRAME_CODEC": ArrowDataFrameCodec(compression="zstd")},
+    )
+    value = QueryCacheManager.encode_df({"df": df, "query": "SELECT 1"})
+
+    assert "df" not in value
+    assert value["query"] == "SELECT 1"
+    assert value["df_codec"] == "arrow"
+    pd.testing.assert_frame_equal(QueryCacheManager.decode_df(value), df)
+
+    # dataframes that can't be encoded are stored as-is
+    nested = pd.DataFrame({"a": [[1, 2]]})
+    assert QueryCacheManager.encode_df({"df": nested})["df"] is nested
+
+
+def test_query_cache_manager_without_codec(df: pd.DataFrame) -> None:
+    """
+    Test that dataframes are stored as-is when no codec is configured.
+    """
+    value = {"df": df, "query": "SELECT 1"}
+    assert QueryCacheManager.encode_df(value) is value
+    assert QueryCacheManager.decode_df(value) is df
@@ -20,6 +20,8 @@ from unittest.mock import MagicMock, patch
 
 import numpy as np
 import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
 import pytest
 
 from superset.common.chart_data import ChartDataResultFormat, ChartDataResultType
@@ -129,6 +131,26 @@ def test_get_data_xlsx(
     mock_df_to_excel.assert_called_once_with(df)
 
 
+def test_get_data_parquet(processor, mock_query_context):
+    df = pd.DataFrame({"col1": [1, 2, 3], "col2": ["a", "b", "c"]})
+    coltypes = [GenericDataType.NUMERIC, GenericDataType.STRING]
+    mock_query_context.result_format = ChartDataResultFormat.PARQUET
+
+    result = processor.get_data(df, coltypes)
+    table = pq.read_table(pa.BufferReader(result))
+    assert table.to_pydict() == {"Column 1": [1, 2, 3], "Column 2": ["a", "b", "c"]}
+
+
+def test_get_data_arrow(processor, mock_query_context):
+    df = pd.DataFrame({"col1": [1, 2, 3], "col2": ["a", "b", "c"]})
+    coltypes = [GenericDataType.NUMERIC, GenericDataType.STRING]
+    mock_query_context.result_format = ChartDataResultFormat.ARROW
+
+    result = processor.get_data(df, coltypes)
+    table = pa.ipc.open_stream(result).read_all()
+    assert table.to_pydict() == {"Column 1": [1, 2, 3], "Column 2": ["a", "b", "c"]}
+
+
 def test_get_data_json(processor, mock_query_context):
     df = pd.DataFrame({"col1": [1, 2, 3], "col2": ["a", "b", "c"]})
     coltypes = [GenericDataType.NUMERIC, GenericDataType.STRING]
@@ -789,8 +811,7 @@ def test_ensure_totals_available_updates_cache_values():
     processor = QueryContextProcessor(mock_query_context)
     processor._qc_datasource = mock_datasource
 
-    # Mock the query execution result for totals query
-    mock_query_result = MagicMock()
+    # Mock the payload of the totals query
     mock_df = pd.DataFrame(
         {
             "Net Amount In": [20228060486.838825],
@@ -798,10 +819,11 @@ def test_ensure_totals_available_updates_cache_values():
             "Amount In": [40771550101.81883],
         }
     )
-    mock_query_result.df = mock_df
 
     with patch.object(
-        mock_query_context, "get_query_result", return_value=mock_query_result
+        processor,
+        "get_df_payload",
+        return_value={"df": mock_df, "status": QueryStatus.SUCCESS},
     ):
         # Call ensure_totals_available
         processor.ensure_totals_available()
@@ -825,6 +847,7 @@ def test_ensure_totals_available_updates_cache_values():
             ) as mock_cache_manager:
                 mock_cache = MagicMock()
                 mock_cache.is_loaded = True
+                mock_cache.is_stale = False
                 mock_cache.df = pd.DataFrame(
                     {"brokerage": ["Test"], "Net Amount In": [100]}
                 )
@@ -881,6 +904,7 @@ def test_get_df_payload_validates_before_cache_key_generation():
     mock_datasource.cache_timeout = None
     mock_datasource.database.db_engine_spec.engine = "postgresql"
     mock_datasource.database.extra = "{}"
+    mock_datasource.database.impersonate_user = False
     mock_datasource.get_extra_cache_keys.return_value = []
     mock_datasource.changed_on = None
 
@@ -924,6 +948,7 @@ def test_get_df_payload_validates_before_cache_key_generation():
             ) as mock_cache_manager:
                 mock_cache = MagicMock()
                 mock_cache.is_loaded = True
+                mock_cache.is_stale = False
                 mock_cache.df = pd.DataFrame({"col1": [1, 2, 3]})
                 mock_cache.query = "SELECT * FROM table"
                 mock_cache.error_message = None
@@ -1008,14 +1033,14 @@ def test_cache_values_sync_after_ensure_totals_available():
     processor = QueryContextProcessor(mock_query_context)
     processor._qc_datasource = mock_datasource
 
-    # Mock query execution result (totals query execution)
-    mock_query_result = MagicMock()
+    # Mock the payload of the totals query
     mock_df = pd.DataFrame({"sales": [1000.0]})
-    mock_query_result.df = mock_df
 
     # Patch methods to isolate the test
     with patch.object(
-        mock_query_context, "get_query_result", return_value=mock_query_result
+        processor,
+        "get_df_payload",
+        return_value={"df": mock_df, "status": QueryStatus.SUCCESS},
     ):
         # Mock cache management to prevent actual caching
         with patch(
@@ -1023,6 +1048,7 @@ def test_cache_values_sync_after_ensure_totals_available():
         ) as mock_cache_manager:
             mock_cache = MagicMock()
             mock_cache.is_loaded = True
+            mock_cache.is_stale = False
             mock_cache.df = pd.DataFrame({"region": ["North"], "sales": [100]})
             mock_cache.query = "SELECT region, SUM(sales) FROM table GROUP BY region"
             mock_cache.error_message = None
@@ -1292,6 +1318,7 @@ def test_force_cached_normalizes_totals_query_row_limit():
                 df = pd.DataFrame({"region": ["North"], "sales": [100]})
                 cache = MagicMock()
                 cache.is_loaded = True
+                cache.is_stale = False
                 cache.df = df
                 cache.query = "SELECT 1"
                 cache.error_message = None
@@ -1311,3 +1338,443 @@ def test_force_cached_normalizes_totals_query_row_limit():
 
     assert captured_limits == [None], "Totals query should be normalized before caching"
     mock_query_context.get_query_result.assert_not_called()
+
+
+def test_get_payload_executes_queries_ahead_of_time(app_context: None) -> None:
+    """
+    Test that the queries of a context run before they're processed, in order, in
+    the thread of the request.
+    """
+    import threading
+
+    query_context = MagicMock()
+    query_context.queries = [MagicMock(result_type=None) for _ in range(2)]
+    query_context.cache_values = {"queries": [{}] * 2}
+
+    threads = []
+
+    def get_query_results(
+        result_type: Any, context: Any, query_obj: Any, force_cached: bool
+    ) -> dict[str, Any]:
+        threads.append(threading.current_thread())
+        return {"index": context.queries.index(query_obj)}
+
+    processor = QueryContextProcessor(query_context)
+    with (
+        patch.object(processor, "_prepare_contribution_totals", return_value=([], [])),
+        patch.object(processor, "ensure_totals_available"),
+        patch.object(processor, "execute_queries") as execute_queries,
+        patch(
+            "superset.common.query_context_processor.get_query_results",
+            side_effect=get_query_results,
+        ),
+    ):
+        payload = processor.get_payload(cache_query_context=False)
+
+    execute_queries.assert_called_once_with(False)
+    assert payload["queries"] == [{"index": 0}, {"index": 1}]
+    assert threads == [threading.main_thread()] * 2
+
+
+def test_execute_queries(app_context: None) -> None:
+    """
+    Test that the queries that aren't cached are compiled in the thread of the
+    request and run together, and that their results are used once processed.
+    """
+    from flask import current_app
+
+    from superset.models.helpers import ExploreMixin
+
+    datasource = MagicMock(spec=ExploreMixin)
+    datasource.database.query_concurrency = 2
+    datasource.plan_query.side_effect = lambda query_obj: (
+        query_obj,
+        {"columns": query_obj.columns},
+    )
+    results = [MagicMock(), MagicMock()]
+    datasource.query_many.return_value = results
+
+    query_context = MagicMock()
+    query_context.datasource = datasource
+    query_context.force = False
+    query_context.result_type = ChartDataResultType.FULL
+    query_context.queries = [
+        MagicMock(result_type=None, columns=["a"]),
+        MagicMock(result_type=None, columns=["b"]),
+        MagicMock(result_type=None, columns=["cached"]),
+        MagicMock(result_type=ChartDataResultType.SAMPLES, columns=["c"]),
+    ]
+    for query_obj in query_context.queries:
+        query_obj.validate.return_value = None
+
+    processor = QueryContextProcessor(query_context)
+    with (
+        patch.dict(current_app.config, {"DATA_QUERY_SINGLE_FLIGHT_TIMEOUT": 0}),
+        patch.object(
+            processor,
+            "query_cache_key",
+            side_effect=lambda query_obj: f"key-{query_obj.columns[0]}",
+        ),
+        patch.object(processor, "validate_columns"),
+        patch.object(processor, "get_cache_timeout", return_value=60),
+        patch(
+            "superset.common.query_context_processor.cache_manager.data_cache.has",
+            side_effect=lambda key: key == "key-cached",
+        ),
+    ):
+        processor.execute_queries()
+
+    datasource.query_many.assert_called_once_with(
+        [{"columns": ["a"]}, {"columns": ["b"]}],
+        force=False,
+    )
+
+    processor.get_query_result(
+        query_context.queries[0],
+        query_result=processor._query_results["key-a"],
+    )
+    datasource.get_query_result.assert_called_once_with(
+        query_context.queries[0],
+        force=False,
+        cache_key_fn=processor.time_offset_cache_key,
+        cache_timeout_fn=processor.get_cache_timeout,
+        query_result=results[0],
+    )
+
+
+def test_ensure_totals_available_uses_data_cache() -> None:
+    """
+    Test that the contribution totals are read from the data cache, and that the
+    totals query is normalized so that charts with the same totals share the key.
+    """
+    from superset.common.query_object import QueryObject
+
+    mock_datasource = MagicMock()
+    mock_datasource.uid = "test_datasource"
+    mock_datasource.column_names = ["region", "sales"]
+    mock_datasource.cache_timeout = None
+    mock_datasource.changed_on = None
+    mock_datasource.get_extra_cache_keys.return_value = []
+    mock_datasource.database.extra = "{}"
+
+    main_query = QueryObject(
+        datasource=mock_datasource,
+        columns=["region"],
+        metrics=["sales"],
+        post_processing=[
+            {"operation": "contribution", "options": {"columns": ["sales"]}}
+        ],
+    )
+    totals_query = QueryObject(
+        datasource=mock_datasource,
+        columns=[],
+        metrics=["sales"],
+        row_limit=1000,
+        orderby=[["sales", False]],
+    )
+
+    mock_query_context = MagicMock()
+    mock_query_context.force = False
+    mock_query_context.queries = [main_query, totals_query]
+
+    processor = QueryContextProcessor(mock_query_context)
+    processor._qc_datasource = mock_datasource
+
+    with (
+        patch(
+            "superset.common.query_context_processor.security_manager",
+            new_callable=MagicMock,
+        ) as mock_security_manager,
+        patch(
+            "superset.common.query_context_processor.QueryCacheManager"
+        ) as mock_cache_manager,
+    ):
+        mock_security_manager.get_rls_cache_key.return_value = None
+        mock_cache = MagicMock()
+        mock_cache.is_loaded = True
+        mock_cache.is_stale = False
+        mock_cache.df = pd.DataFrame({"sales": [1000.0]})
+        mock_cache.status = QueryStatus.SUCCESS
+        mock_cache_manager.get.return_value = mock_cache
+
+        processor.ensure_totals_available()
+
+        assert mock_cache_manager.get.call_args.kwargs["key"] == (
+            processor.query_cache_key(totals_query)
+        )
+
+    assert totals_query.row_limit is None
+    assert totals_query.orderby == []
+    mock_datasource.get_query_result.assert_not_called()
+    assert main_query.post_processing[0]["options"]["contribution_totals"] == {
+        "sales": 1000.0
+    }
+
+
+def test_get_query_result_caches_time_offsets() -> None:
+    """
+    Test that the datasource gets the functions to cache the time offset queries.
+    """
+    mock_datasource = MagicMock()
+    mock_query_context = MagicMock()
+    mock_query_context.datasource = mock_datasource
+    query_obj = MagicMock()
+
+    processor = QueryContextProcessor(mock_query_context)
+    processor.get_query_result(query_obj, force=True)
+
+    mock_datasource.get_query_result.assert_called_once_with(
+        query_obj,
+        force=True,
+        cache_key_fn=processor.time_offset_cache_key,
+        cache_timeout_fn=processor.get_cache_timeout,
+    )
+
+    with patch.object(processor, "query_cache_key") as query_cache_key:
+        processor.time_offset_cache_key(query_obj, "1 year ago", "P1D")
+    query_cache_key.assert_called_once_with(
+        query_obj, time_offset="1 year ago", time_grain="P1D"
+    )
+
+
+def test_single_flight(app_context: None) -> None:
+    """
+    Test that identical concurrent queries wait for the result of the first one.
+    """
+    from flask import current_app
+
+    processor = QueryContextProcessor(MagicMock())
+    cached = MagicMock(is_loaded=True)
+    not_cached = MagicMock(is_loaded=False)
+    stats_logger = MagicMock()
+
+    with (
+        patch.dict(
+            current_app.config,
+            {"DATA_QUERY_SINGLE_FLIGHT_TIMEOUT": 1, "STATS_LOGGER": stats_logger},
+        ),
+        patch(
+            "superset.common.query_context_processor.QueryCacheManager.get",
+            side_effect=[not_cached, cached, not_cached],
+        ),
+        patch("superset.common.query_context_processor.SINGLE_FLIGHT_POLL_INTERVAL", 0),
+    ):
+        with processor.single_flight("key", force_query=False) as coalesced:
+            # the first request runs the query
+            assert coalesced is None
+
+            # an identical request waits for its result while the lock is held
+            with processor.single_flight("key", force_query=False) as coalesced:
+                assert coalesced is cached
+            stats_logger.incr.assert_called_once_with("chart_data_query_coalesced")
+
+            # forced queries don't wait
+            with processor.single_flight("key", force_query=True) as coalesced:
+                assert coalesced is None
+
+        # the lock is released without caching a result
+        with processor.single_flight("key", force_query=False) as coalesced:
+            assert coalesced is None
+
+        assert processor.wait_for_query_result("key", 1) is None
+        stats_logger.incr.assert_called_with("chart_data_query_not_coalesced")
+
+
+def test_single_flight_timeout(app_context: None) -> None:
+    """
+    Test that a request stops waiting for an identical query after the timeout.
+    """
+    from flask import current_app
+
+    processor = QueryContextProcessor(MagicMock())
+    with (
+        patch.dict(current_app.config, {"DATA_QUERY_SINGLE_FLIGHT_TIMEOUT": 0.05}),
+        patch(
+            "superset.common.query_context_processor.QueryCacheManager.get",
+            return_value=MagicMock(is_loaded=False),
+        ) as get,
+        patch(
+            "superset.common.query_context_processor.SINGLE_FLIGHT_POLL_INTERVAL", 0.01
+        ),
+    ):
+        with processor.single_flight("key", force_query=False):
+            with processor.single_flight("key", force_query=False) as coalesced:
+                assert coalesced is None
+            assert get.call_count > 1
+
+
+def test_query_cache_manager_stale(app_context: None) -> None:
+    """
+    Test that results are kept past their timeout and marked as stale.
+    """
+    from datetime import timedelta
+
+    from flask import current_app
+    from flask_caching import Cache
+
+    from superset.common.utils.query_cache_manager import QueryCacheManager
+    from superset.constants import CacheRegion
+    from superset.models.helpers import QueryResult
+
+    cache = Cache(current_app, config={"CACHE_TYPE": "SimpleCache"})
+    query_result = QueryResult(
+        df=pd.DataFrame({"a": [1]}),
+        query="SELECT 1",
+        duration=timedelta(seconds=1),
+    )
+    with (
+        patch.dict(
+            "superset.common.utils.query_cache_manager._cache",
+            {CacheRegion.DATA: cache},
+        ),
+        patch("superset.common.utils.query_cache_manager.time") as mock_time,
+    ):
+        mock_time.time.return_value = 1000
+        QueryCacheManager().set_query_result(
+            key="fresh",
+            query_result=query_result,
+            timeout=60,
+            region=CacheRegion.DATA,
+        )
+        QueryCacheManager().set_query_result(
+            key="stale",
+            query_result=query_result,
+            timeout=60,
+            region=CacheRegion.DATA,
+            stale_timeout=600,
+        )
+        assert not QueryCacheManager.get("stale", CacheRegion.DATA).is_stale
+        mock_time.time.return_value = 1061
+        assert QueryCacheManager.get("stale", CacheRegion.DATA).is_stale
+        assert not QueryCacheManager.get("fresh", CacheRegion.DATA).is_stale
+
+
+def test_get_df_payload_refreshes_stale_results(app_context: None) -> None:
+    """
+    Test that stale results are served and refreshed in the background once.
+    """
+    from superset.common.query_object import QueryObject
+
+    query_context = MagicMock()
+    query_context.force = False
+    query_context.custom_cache_timeout = None
+    query_context.form_data = {"slice_id": 1}
+    query_context.cache_values = {
+        "datasource": {"id": 1, "type": "table"},
+        "queries": [{"columns": ["col1"]}],
+    }
+    processor = QueryContextProcessor(query_context)
+    processor._qc_datasource = MagicMock(column_names=["col1"])
+    query_obj = QueryObject(columns=["col1"], metrics=[])
+
+    stale_cache = MagicMock(
+        is_loaded=True,
+        is_stale=True,
+        df=pd.DataFrame({"col1": [1]}),
+    )
+    with (
+        patch.object(processor, "query_cache_key", return_value="key"),
+        patch.object(processor, "get_cache_timeout", return_value=60),
+        patch.object(processor, "get_query_result") as get_query_result,
+        patch(
+            "superset.common.query_context_processor.QueryCacheManager.get",
+            return_value=stale_cache,
+        ),
+        patch(
+            "superset.common.query_context_processor.cache_manager.data_cache.add",
+            side_effect=[True, False],
+        ) as add,
+        patch(
+            "superset.common.query_context_processor.get_user_id",
+            return_value=1,
+        ),
+        patch(
+            "superset.common.query_context_processor.security_manager",
+            new_callable=MagicMock,
+        ) as mock_security_manager,
+        patch("superset.tasks.async_queries.load_chart_data_into_cache") as task,
+    ):
+        mock_security_manager.get_current_guest_user_if_guest.return_value = None
+
+        payload = processor.get_df_payload(query_obj)
+        assert payload["is_stale"] is True
+        get_query_result.assert_not_called()
+
+        # a refresh is already pending
+        processor.get_df_payload(query_obj)
+
+    refresh_stale_key = processor.cache_key(refresh_stale=True)
+    add.assert_called_with(refresh_stale_key, True, timeout=60)
+    task.delay.assert_called_once_with(
+        {
+            "user_id": 1,
+            "refresh_stale": True,
+            "refresh_stale_key": refresh_stale_key,
+        },
+        {
+            "datasource": {"id": 1, "type": "table"},
+            "queries": [{"columns": ["col1"]}],
+            "form_data": {"slice_id": 1},
+            "custom_cache_timeout": None,
+            "force": True,
+        },
+    )
+
+
+def test_data_cache_key(app_context: None) -> None:
+    """
+    Test that the data cache key depends on the cache keys of the queries.
+    """
+    query_context = MagicMock()
+    query_context.queries = [MagicMock(), MagicMock()]
+    query_context.cache_values = {"queries": [{}, {}]}
+    processor = QueryContextProcessor(query_context)
+
+    with patch.object(processor, "query_cache_key", side_effect=["a", "b", "a", "b"]):
+        key = processor.data_cache_key()
+        assert key.startswith("qcd-")
+        assert processor.data_cache_key() == key
+    for query in query_context.queries:
+        query.validate.assert_called()
+
+    with patch.object(processor, "query_cache_key", side_effect=["a", "b", "a", "c"]):
+        assert processor.data_cache_key() != processor.data_cache_key()
+
+
+@pytest.mark.parametrize(
+    "slice_params, extra, expected",
+    [
+        ({"stale_while_revalidate": 60}, {"stale_while_revalidate": 30}, 60),
+        ({}, {"stale_while_revalidate": "30"}, 30),
+        ({}, {}, 10),
+        ({"stale_while_revalidate": "5m"}, {}, 10),
+        ({}, {"stale_while_revalidate": -1}, 10),
+        ({}, {"stale_while_revalidate": [1]}, 10),
+    ],
+)
+def test_get_stale_while_revalidate(
+    app_context: None,
+    slice_params: dict[str, Any],
+    extra: dict[str, Any],
+    expected: int,
+) -> None:
+    """
+    Test the priority of the stale windows, and that invalid ones fall back to the
+    system default.
+    """
+    from flask import current_app
+
+    from superset.common.query_context import QueryContext
+
+    query_context = QueryContext(
+        datasource=MagicMock(extra_dict=extra),
+        queries=[],
+        slice_=MagicMock(params_dict=slice_params),
+        form_data=None,
+        result_type=ChartDataResultType.FULL,
+        result_format=ChartDataResultFormat.JSON,
+        cache_values={},
+    )
+
+    with patch.dict(current_app.config, {"DATA_CACHE_STALE_WHILE_REVALIDATE": 10}):
+        assert query_context.get_stale_while_revalidate() == expected
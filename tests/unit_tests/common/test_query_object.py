@@ -0,0 +1,68 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+from unittest.mock import MagicMock
+
+import pandas as pd
+from pytest_mock import MockerFixture
+
+from superset.common.query_object import QueryObject
+from superset.utils import pandas_postprocessing as pp
+
+
+def test_exec_post_processing(mocker: MockerFixture) -> None:
+    """
+    Test that post processing operations are applied in order, that the input
+    DataFrame is left untouched, and that each step is logged.
+    """
+    log = MagicMock()
+    event_logger = mocker.patch(
+        "superset.common.query_object.event_logger", new_callable=MagicMock
+    )
+    event_logger.log_context.return_value.__enter__.return_value = log
+
+    df = pd.DataFrame(
+        {
+            "dttm": pd.to_datetime(["2021-01-01", "2021-01-01", "2021-01-02"]),
+            "country": ["UK", "US", "UK"],
+            "sales": [1, 2, 3],
+        }
+    )
+    input_df = df.copy()
+    post_processing = [
+        {
+            "operation": "pivot",
+            "options": {
+                "index": ["dttm"],
+                "columns": ["country"],
+                "aggregates": {"sales": {"operator": "sum"}},
+            },
+        },
+        {"operation": "flatten"},
+        {"operation": "rename", "options": {"columns": {"sales, UK": "UK"}}},
+    ]
+
+    result = QueryObject(post_processing=post_processing).exec_post_processing(df)
+
+    expected = pp.pivot(df, **post_processing[0]["options"])
+    expected = pp.rename(pp.flatten(expected), columns={"sales, UK": "UK"})
+    pd.testing.assert_frame_equal(result, expected)
+    pd.testing.assert_frame_equal(df, input_df)
+
+    steps = log.call_args.kwargs["post_processing_steps"]
+    assert [step["operation"] for step in steps] == ["pivot", "flatten", "rename"]
+    assert all(step["rows"] == 2 for step in steps)
+    assert all(step["memory_bytes"] > 0 for step in steps)
@@ -22,7 +22,11 @@ from sqlalchemy import create_engine
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm.session import Session
 
-from superset.connectors.sqla.models import SqlaTable, TableColumn
+from superset.connectors.sqla.models import (
+    RowLevelSecurityFilter,
+    SqlaTable,
+    TableColumn,
+)
 from superset.daos.dataset import DatasetDAO
 from superset.exceptions import OAuth2RedirectError
 from superset.models.core import Database
@@ -842,3 +846,36 @@ def test_quoted_name_prevents_double_quoting(mocker: MockerFixture) -> None:
     # Should have each part quoted separately:
     # GOOD: "MY_DB"."MY_SCHEMA"."MY_TABLE"
     assert '"MY_DB"."MY_SCHEMA"."MY_TABLE"' in compiled
+
+
+def test_rls_filters_invalidated_after_commit(
+    mocker: MockerFixture,
+    session: Session,
+) -> None:
+    """
+    Test that the cached RLS filters are invalidated when a change is committed.
+    """
+    Database.metadata.create_all(session.bind)
+    invalidate_rls_filters_cache = mocker.patch(
+        "superset.connectors.sqla.models.security_manager.invalidate_rls_filters_cache"
+    )
+
+    session.add(RowLevelSecurityFilter(name="rls", clause="1 = 1"))
+    session.flush()
+    invalidate_rls_filters_cache.assert_not_called()
+    session.rollback()
+
+    # the rolled back change doesn't invalidate a later transaction
+    session.commit()
+    invalidate_rls_filters_cache.assert_not_called()
+
+    rls_filter = RowLevelSecurityFilter(name="rls", clause="1 = 1")
+    session.add(rls_filter)
+    session.flush()
+    invalidate_rls_filters_cache.assert_not_called()
+    session.commit()
+    invalidate_rls_filters_cache.assert_called_once()
+
+    session.delete(rls_filter)
+    session.commit()
+    assert invalidate_rls_filters_cache.call_count == 2
@@ -1860,6 +1860,54 @@ def test_table_metadata_slashes(
     )
 
 
+def test_table_metadata_catalog(
+    mocker: MockerFixture,
+    client: Any,
+    full_api_access: None,
+) -> None:
+    """
+    Test the `table_metadata` endpoint when served from the metadata catalog.
+    """
+    from flask_caching import Cache
+
+    from superset.extensions import cache_manager
+
+    cache = Cache(config={"CACHE_TYPE": "SimpleCache", "CACHE_DEFAULT_TIMEOUT": 0})
+    cache.init_app(current_app)
+    mocker.patch.object(cache_manager, "_metadata_catalog_cache", cache)
+    database = mocker.MagicMock(id=1, impersonate_user=False)
+    database.is_oauth2_enabled.return_value = False
+    database.get_default_catalog.return_value = "default"
+    database.db_engine_spec.get_table_metadata.return_value = {"hello": "world"}
+    mocker.patch("superset.databases.api.DatabaseDAO.find_by_id", return_value=database)
+    mocker.patch("superset.databases.api.security_manager.raise_for_access")
+
+    with freeze_time("2024-01-01T00:00:00Z"):
+        response = client.get("/api/v1/database/1/table_metadata/?name=t&schema=s")
+    assert response.json == {
+        "hello": "world",
+        "last_refreshed": "2024-01-01T00:00:00+00:00",
+    }
+    database.db_engine_spec.get_table_metadata.assert_called_once_with(
+        database,
+        Table("t", "s", "default"),
+    )
+
+    # served from the catalog, for the default catalog
+    response = client.get(
+        "/api/v1/database/1/table_metadata/?name=t&schema=s&catalog=default"
+    )
+    assert response.json["last_refreshed"] == "2024-01-01T00:00:00+00:00"
+    database.db_engine_spec.get_table_metadata.assert_called_once()
+
+    # other catalogs are stored separately
+    client.get("/api/v1/database/1/table_metadata/?name=t&schema=s&catalog=c")
+    database.db_engine_spec.get_table_metadata.assert_called_with(
+        database,
+        Table("t", "s", "c"),
+    )
+
+
 def test_table_metadata_invalid_database(
     mocker: MockerFixture,
     client: Any,
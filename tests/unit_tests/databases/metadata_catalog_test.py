@@ -0,0 +1,157 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+
+from typing import Any
+from unittest.mock import MagicMock
+
+import pytest
+from flask import current_app
+from flask_caching import Cache
+from freezegun import freeze_time
+from pytest_mock import MockerFixture
+
+from superset.databases import metadata_catalog
+from superset.databases.metadata_catalog import MetadataKind
+from superset.extensions import cache_manager
+
+
+@pytest.fixture
+def catalog_cache(mocker: MockerFixture) -> Cache:
+    cache = Cache(config={"CACHE_TYPE": "SimpleCache", "CACHE_DEFAULT_TIMEOUT": 0})
+    cache.init_app(current_app)
+    mocker.patch.object(cache_manager, "_metadata_catalog_cache", cache)
+    return cache
+
+
+def get_database(**kwargs: Any) -> MagicMock:
+    database = MagicMock()
+    database.id = 1
+    database.impersonate_user = False
+    database.is_oauth2_enabled.return_value = False
+    database.get_default_catalog.return_value = None
+    database.db_engine_spec.supports_catalog = False
+    database.get_all_schema_names.return_value = {"b", "a"}
+    for key, value in kwargs.items():
+        setattr(database, key, value)
+    return database
+
+
+def test_is_enabled(catalog_cache: Cache, mocker: MockerFixture) -> None:
+    """
+    Test that databases with per-user metadata are never stored in the catalog.
+    """
+    assert metadata_catalog.is_enabled(get_database())
+    assert not metadata_catalog.is_enabled(get_database(impersonate_user=True))
+
+    null_cache = Cache(config={"CACHE_TYPE": "NullCache"})
+    null_cache.init_app(current_app)
+    mocker.patch.object(cache_manager, "_metadata_catalog_cache", null_cache)
+    assert not metadata_catalog.is_enabled(get_database())
+
+
+def test_get_metadata(catalog_cache: Cache) -> None:
+    """
+    Test that metadata is only reflected when it's missing or forced.
+    """
+    database = get_database()
+
+    with freeze_time("2024-01-01T00:00:00Z"):
+        entry = metadata_catalog.get_metadata(database, MetadataKind.SCHEMAS)
+    assert entry.value == ["a", "b"]
+    assert entry.refreshed_at.isoformat() == "2024-01-01T00:00:00+00:00"
+
+    database.get_all_schema_names.return_value = {"c"}
+    entry = metadata_catalog.get_metadata(database, MetadataKind.SCHEMAS)
+    assert entry.value == ["a", "b"]
+    assert entry.refreshed_at.isoformat() == "2024-01-01T00:00:00+00:00"
+    database.get_all_schema_names.assert_called_once_with(catalog=None, cache=False)
+
+    entry = metadata_catalog.get_metadata(database, MetadataKind.SCHEMAS, force=True)
+    assert entry.value == ["c"]
+
+
+def test_refresh_database(catalog_cache: Cache) -> None:
+    """
+    Test that only the stale entries are refreshed in the background.
+    """
+    database = get_database()
+    database.get_all_table_names_in_schema.return_value = {("t1", "a", None)}
+    database.get_all_view_names_in_schema.return_value = set()
+    database.get_all_materialized_view_names_in_schema.return_value = set()
+    get_table_metadata = database.db_engine_spec.get_table_metadata
+    get_table_metadata.return_value = {"name": "t1"}
+
+    with freeze_time("2024-01-01T00:00:00Z"):
+        metadata_catalog.get_metadata(database, MetadataKind.SCHEMAS)
+        metadata_catalog.get_metadata(
+            database,
+            MetadataKind.TABLE_METADATA,
+            schema="a",
+            table="t1",
+        )
+    with freeze_time("2024-01-01T00:50:00Z"):
+        metadata_catalog.get_metadata(database, MetadataKind.TABLES, schema="a")
+        metadata_catalog.get_metadata(database, MetadataKind.TABLES, schema="b")
+    catalog_cache.delete("metadata_catalog:db:1:tables:None:b:None")
+
+    database.get_all_schema_names.return_value = {"a"}
+    database.get_all_table_names_in_schema.return_value = {("t2", "a", None)}
+    get_table_metadata.return_value = {"name": "t1", "columns": []}
+    with freeze_time("2024-01-01T01:30:00Z"):
+        assert metadata_catalog.refresh_database(database) == 2
+
+    entry = metadata_catalog.get_metadata(database, MetadataKind.SCHEMAS)
+    assert entry.value == ["a"]
+    assert entry.refreshed_at.isoformat() == "2024-01-01T01:30:00+00:00"
+    entry = metadata_catalog.get_metadata(database, MetadataKind.TABLES, schema="a")
+    assert entry.value["tables"] == ["t1"]
+    entry = metadata_catalog.get_metadata(
+        database,
+        MetadataKind.TABLE_METADATA,
+        schema="a",
+        table="t1",
+    )
+    assert entry.value == {"name": "t1", "columns": []}
+
+    # the expired entry isn't reflected again
+    assert catalog_cache.get("metadata_catalog:db:1:tables:None:b:None") is None
+
+
+def test_refresh_database_concurrent_requests(catalog_cache: Cache) -> None:
+    """
+    Test that entries stored while the catalog is refreshed are kept up to date.
+    """
+    database = get_database()
+    database.get_all_table_names_in_schema.return_value = set()
+    database.get_all_view_names_in_schema.return_value = set()
+    database.get_all_materialized_view_names_in_schema.return_value = set()
+
+    def get_all_schema_names(**kwargs: Any) -> set[str]:
+        # a request stores the tables of a schema during the refresh
+        metadata_catalog.get_metadata(database, MetadataKind.TABLES, schema="b")
+        return {"a", "b"}
+
+    database.get_all_schema_names.side_effect = get_all_schema_names
+    with freeze_time("2024-01-01T00:00:00Z"):
+        metadata_catalog.refresh_database(database)
+
+    database.get_all_schema_names.side_effect = None
+    with freeze_time("2024-01-01T01:30:00Z"):
+        assert metadata_catalog.refresh_database(database) == 2
+
+    entry = metadata_catalog.get_metadata(database, MetadataKind.TABLES, schema="b")
+    assert entry.refreshed_at.isoformat() == "2024-01-01T01:30:00+00:00"
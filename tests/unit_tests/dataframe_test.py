@@ -17,6 +17,7 @@
 # pylint: disable=unused-argument, import-outside-toplevel
 from datetime import datetime
 
+import pandas as pd
 import pytest
 from pandas import Timestamp
 from pandas._libs.tslibs import NaT
@@ -158,6 +159,41 @@ def test_js_max_int() -> None:
     ]
 
 
+def test_js_max_int_nullable() -> None:
+    """
+    Test that big integers are converted in nullable and object columns.
+    """
+    df = pd.DataFrame(
+        {
+            "a": pd.array([1, 9007199254740992, None], dtype="Int64"),
+            "b": pd.Series([None, -9007199254740992, 2], dtype=object),
+            "c": ["x", 9007199254740992, 1.5],
+            "d": [9007199254740991, 1, 2],
+        }
+    )
+
+    assert df_to_records(df) == [
+        {"a": 1, "b": None, "c": "x", "d": 9007199254740991},
+        {
+            "a": "9007199254740992",
+            "b": "-9007199254740992",
+            "c": "9007199254740992",
+            "d": 1,
+        },
+        {"a": None, "b": 2, "c": 1.5, "d": 2},
+    ]
+
+
+def test_js_max_int_duplicate_columns() -> None:
+    """
+    Test that big integers are converted when column names are not unique.
+    """
+    df = pd.DataFrame([[1, 2**60], [2, 3]], columns=["a", "a"])
+
+    assert df_to_records(df) == [{"a": "1152921504606846976"}, {"a": 3}]
+    assert df.iloc[0, 1] == 2**60
+
+
 @pytest.mark.parametrize(
     "input_, expected",
     [
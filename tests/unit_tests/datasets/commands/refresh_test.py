@@ -0,0 +1,133 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+# pylint: disable=import-outside-toplevel, unused-argument
+
+from pathlib import Path
+
+import pytest
+from pytest_mock import MockerFixture
+from sqlalchemy import create_engine, text
+from sqlalchemy.orm.session import Session
+
+from superset import db
+
+
+def test_bulk_refresh(mocker: MockerFixture, session: Session, tmp_path: Path) -> None:
+    """
+    Test refreshing all the physical datasets of a database.
+    """
+    from superset.commands.dataset.refresh import BulkRefreshDatasetsCommand
+    from superset.connectors.sqla.models import SqlaTable, TableColumn
+    from superset.models.core import Database
+
+    SqlaTable.metadata.create_all(db.session.get_bind())  # pylint: disable=no-member
+
+    uri = f"sqlite:///{tmp_path / 'warehouse.db'}"
+    with create_engine(uri).begin() as connection:
+        connection.execute(text("CREATE TABLE t1 (a INTEGER, b TEXT)"))
+        connection.execute(text("CREATE TABLE t2 (c INTEGER)"))
+
+    database = Database(database_name="warehouse", sqlalchemy_uri=uri)
+    t1 = SqlaTable(
+        table_name="t1",
+        database=database,
+        columns=[
+            TableColumn(column_name="a", type="TEXT"),
+            TableColumn(column_name="gone", type="TEXT"),
+            TableColumn(column_name="a_plus_one", expression="a + 1"),
+        ],
+    )
+    t2 = SqlaTable(table_name="t2", database=database)
+    missing = SqlaTable(table_name="missing", database=database)
+    virtual = SqlaTable(table_name="virtual", database=database, sql="SELECT 1 AS d")
+    db.session.add_all([t1, t2, missing, virtual])
+    db.session.flush()
+
+    # the in-memory metadata database can't be used from the worker threads
+    assert database.ssh_tunnel is None
+
+    mocker.patch("superset.commands.dataset.refresh.security_manager")
+    mocker.patch(
+        "superset.commands.dataset.refresh.DatabaseDAO.find_by_id",
+        return_value=database,
+    )
+
+    result = BulkRefreshDatasetsCommand(database.id).run()
+
+    assert result == {"refreshed": sorted([t1.id, t2.id]), "failed": [missing.id]}
+    assert {column.column_name: column.type for column in t1.columns} == {
+        "a": "INTEGER",
+        "b": "TEXT",
+        "a_plus_one": None,
+    }
+    assert [column.column_name for column in t2.columns] == ["c"]
+    assert [metric.metric_name for metric in t2.metrics] == ["count"]
+    assert virtual.columns == []
+
+
+def test_reflect_schema_database_not_found(mocker: MockerFixture) -> None:
+    """
+    Test that reflecting a schema of a missing database fails.
+    """
+    from superset.commands.database.exceptions import DatabaseNotFoundError
+    from superset.commands.dataset.refresh import reflect_schema
+
+    mocker.patch(
+        "superset.commands.dataset.refresh.DatabaseDAO.find_by_id",
+        return_value=None,
+    )
+
+    with pytest.raises(DatabaseNotFoundError):
+        reflect_schema(1, None, "public", ["t1"])
+
+
+def test_bulk_refresh_failed_schema(mocker: MockerFixture, session: Session) -> None:
+    """
+    Test that the datasets of a schema that can't be reflected are failed, while the
+    other schemas are still refreshed.
+    """
+    from superset.commands.dataset.refresh import BulkRefreshDatasetsCommand
+    from superset.connectors.sqla.models import SqlaTable
+    from superset.models.core import Database
+
+    SqlaTable.metadata.create_all(db.session.get_bind())  # pylint: disable=no-member
+
+    database = Database(database_name="warehouse", sqlalchemy_uri="sqlite://")
+    good = SqlaTable(table_name="t1", schema="good", database=database)
+    bad = SqlaTable(table_name="t1", schema="bad", database=database)
+    db.session.add_all([good, bad])
+    db.session.flush()
+
+    def reflect_schema(database_id, catalog, schema, table_names):
+        if schema == "bad":
+            raise Exception("boom")
+        return {"t1": [{"column_name": "a", "type": "INTEGER"}]}, {"t1": []}
+
+    mocker.patch("superset.commands.dataset.refresh.security_manager")
+    mocker.patch(
+        "superset.commands.dataset.refresh.reflect_schema",
+        side_effect=reflect_schema,
+    )
+    mocker.patch(
+        "superset.commands.dataset.refresh.DatabaseDAO.find_by_id",
+        return_value=database,
+    )
+
+    result = BulkRefreshDatasetsCommand(database.id).run()
+
+    assert result == {"refreshed": [good.id], "failed": [bad.id]}
+    assert [column.column_name for column in good.columns] == ["a"]
@@ -943,3 +943,62 @@ def test_get_oauth2_authorization_uri_standard_params(mocker: MockerFixture) ->
     assert "prompt" not in query
     assert "access_type" not in query
     assert "include_granted_scopes" not in query
+
+
+def test_get_poll_intervals(mocker: MockerFixture) -> None:
+    """
+    Test that polling backs off exponentially up to the maximum interval.
+    """
+    from itertools import islice
+
+    from superset.db_engine_specs.base import BaseEngineSpec
+
+    mocker.patch.dict(
+        "flask.current_app.config",
+        {"DB_POLL_INITIAL_INTERVAL_SECONDS": 0.25, "DB_POLL_BACKOFF_FACTOR": 2},
+    )
+
+    intervals = BaseEngineSpec.get_poll_intervals(1.5)
+    assert list(islice(intervals, 6)) == [0.25, 0.5, 1, 1.5, 1.5, 1.5]
+
+    # the initial interval is capped too
+    intervals = BaseEngineSpec.get_poll_intervals(0)
+    assert list(islice(intervals, 2)) == [0, 0]
+
+
+def test_get_multi_columns(mocker: MockerFixture) -> None:
+    """
+    Test reflecting the columns of several tables at once.
+    """
+    from sqlalchemy.exc import NoSuchTableError
+
+    from superset.db_engine_specs.base import BaseEngineSpec
+
+    class CustomEngineSpec(BaseEngineSpec):
+        @classmethod
+        def get_columns(
+            cls,
+            inspector: Any,
+            table: Table,
+            options: dict[str, Any] | None = None,
+        ) -> list[ResultSetColumnType]:
+            if table.table == "t2":
+                raise NoSuchTableError(table.table)
+            return [{"column_name": "a", "name": "a", "type": "INTEGER"}]
+
+    # SQLAlchemy 2.0 reflects the whole schema in one pass
+    mocker.patch("sqlalchemy.engine.ObjectKind", create=True)
+    inspector = mocker.MagicMock()
+    inspector.get_multi_columns.return_value = {
+        ("public", "t1"): [{"name": "a", "type": types.Integer()}],
+    }
+    columns = BaseEngineSpec.get_multi_columns(inspector, ["t1", "t2"], "public")
+    assert list(columns) == ["t1"]
+    assert columns["t1"][0]["column_name"] == "a"
+    inspector.get_columns.assert_not_called()
+
+    # engine specs that customize `get_columns` reflect the tables one by one
+    columns = CustomEngineSpec.get_multi_columns(inspector, ["t1", "t2"], "public")
+    assert list(columns) == ["t1"]
+    assert columns["t1"][0]["type"] == "INTEGER"
+    inspector.get_multi_columns.assert_called_once()
@@ -342,3 +342,38 @@ SELECT * \nFROM my_catalog.my_schema.my_table
  LIMIT :param_1
     """.strip()
     )
+
+
+def test_handle_cursor_coalesces_progress(mocker: MockerFixture) -> None:
+    """
+    Test that progress is only written to the metadata database when it changes.
+    """
+    from superset.db_engine_specs.presto import PrestoEngineSpec
+
+    mocker.patch.dict(
+        "flask.current_app.config",
+        {"PRESTO_POLL_INTERVAL": 1, "DB_POLL_INITIAL_INTERVAL_SECONDS": 0.1},
+    )
+    db = mocker.patch("superset.db_engine_specs.presto.db")
+    sleep = mocker.patch("superset.db_engine_specs.presto.time.sleep")
+    mocker.patch.object(PrestoEngineSpec, "get_tracking_url", return_value=None)
+
+    query = mocker.MagicMock()
+    query.progress = 0
+    query.status = "running"
+    query.database.connect_args = {}
+    db.session.query().filter_by().one.return_value = query
+
+    cursor = mocker.MagicMock()
+    cursor.poll.side_effect = [
+        {"stats": {"state": "RUNNING", "completedSplits": 1, "totalSplits": 4}},
+        {"stats": {"state": "RUNNING", "completedSplits": 1, "totalSplits": 4}},
+        {"stats": {"state": "RUNNING", "completedSplits": 3, "totalSplits": 4}},
+        None,
+    ]
+
+    PrestoEngineSpec.handle_cursor(cursor, query)
+
+    assert query.progress == 75
+    assert db.session.commit.call_count == 2
+    assert [call.args[0] for call in sleep.call_args_list] == [0.1, 0.2, 0.4]
@@ -17,11 +17,13 @@
 
 # pylint: disable=invalid-name
 
+from datetime import timedelta
 from typing import Any
 from uuid import UUID
 
 import pytest
 from freezegun import freeze_time
+from pytest_mock import MockerFixture
 from sqlalchemy.orm import Session, sessionmaker
 
 from superset import db
@@ -29,6 +31,7 @@ from superset.distributed_lock import KeyValueDistributedLock
 from superset.distributed_lock.types import LockValue
 from superset.distributed_lock.utils import get_key
 from superset.exceptions import CreateKeyValueDistributedLockFailedException
+from superset.key_value.exceptions import KeyValueDeleteFailedError
 from superset.key_value.types import JsonKeyValueCodec
 
 LOCK_VALUE: LockValue = {"value": True}
@@ -99,3 +102,53 @@ def test_key_value_distributed_lock_expired() -> None:
                 assert _get_lock(MAIN_KEY, session) is None
 
         assert _get_lock(MAIN_KEY, session) is None
+
+
+def test_key_value_distributed_lock_released_on_error() -> None:
+    """
+    Test that the distributed lock is released when the context raises an error.
+    """
+    session = _get_other_session()
+
+    with freeze_time("2021-01-01"):
+        with KeyValueDistributedLock("ns", a=1, b=2):
+            assert _get_lock(MAIN_KEY, session) == LOCK_VALUE
+            with pytest.raises(ValueError, match="error"):
+                with KeyValueDistributedLock("ns2", a=1, b=2):
+                    raise ValueError("error")
+
+            assert _get_lock(OTHER_KEY, session) is None
+
+
+def test_key_value_distributed_lock_release_error(mocker: MockerFixture) -> None:
+    """
+    Test that failing to release the lock doesn't hide the error of the context.
+    """
+    mocker.patch(
+        "superset.commands.distributed_lock.delete.KeyValueDAO.delete_entry",
+        side_effect=KeyValueDeleteFailedError(),
+    )
+
+    with freeze_time("2021-01-01"):
+        with pytest.raises(ValueError, match="error"):
+            with KeyValueDistributedLock("ns3", a=1, b=2):
+                raise ValueError("error")
+
+
+def test_key_value_distributed_lock_expiration() -> None:
+    """
+    Test that the expiration of the distributed lock can be configured.
+    """
+    session = _get_other_session()
+
+    with freeze_time("2021-01-01 00:00:00") as frozen_time:
+        with KeyValueDistributedLock(
+            "ns",
+            lock_expiration=timedelta(minutes=5),
+            a=1,
+            b=2,
+        ):
+            frozen_time.tick(timedelta(minutes=1))
+            assert _get_lock(MAIN_KEY, session) == LOCK_VALUE
+            frozen_time.tick(timedelta(minutes=5))
+            assert _get_lock(MAIN_KEY, session) is None
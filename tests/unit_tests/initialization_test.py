@@ -124,6 +124,7 @@ class TestSupersetAppInitializer:
             patch.object(app_initializer, "configure_auth_provider"),
             patch.object(app_initializer, "configure_async_queries"),
             patch.object(app_initializer, "configure_ssh_manager"),
+            patch.object(app_initializer, "configure_engine_registry"),
             patch.object(app_initializer, "configure_stats_manager"),
             patch.object(app_initializer, "init_views"),
         ):
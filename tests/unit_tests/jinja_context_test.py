@@ -27,7 +27,7 @@ from freezegun import freeze_time
 from jinja2 import DebugUndefined
 from jinja2.sandbox import SandboxedEnvironment
 from pytest_mock import MockerFixture
-from sqlalchemy.dialects import mysql
+from sqlalchemy.dialects import mysql, sqlite
 from sqlalchemy.dialects.postgresql import dialect
 
 from superset.commands.dataset.exceptions import DatasetNotFoundError
@@ -1560,11 +1560,11 @@ def test_jinja2_undefined_error_handling(mocker: MockerFixture) -> None:
     from superset.jinja_context import BaseTemplateProcessor
 
     processor = BaseTemplateProcessor(database=database)
-    template = "SELECT * FROM table"
+    template = "SELECT * FROM {{ table }}"
 
-    # Mock the Environment.from_string to raise UndefinedError
+    # Mock the template compilation to raise UndefinedError
     with patch.object(
-        processor.env, "from_string", side_effect=UndefinedError("Variable not defined")
+        processor, "get_template", side_effect=UndefinedError("Variable not defined")
     ):
         with pytest.raises(SupersetSyntaxErrorException) as exc_info:
             processor.process_template(template)
@@ -1593,11 +1593,11 @@ def test_jinja2_security_error_handling(mocker: MockerFixture) -> None:
     from superset.jinja_context import BaseTemplateProcessor
 
     processor = BaseTemplateProcessor(database=database)
-    template = "SELECT * FROM table"
+    template = "SELECT * FROM {{ table }}"
 
-    # Mock the Environment.from_string to raise SecurityError
+    # Mock the template compilation to raise SecurityError
     with patch.object(
-        processor.env, "from_string", side_effect=SecurityError("Access denied")
+        processor, "get_template", side_effect=SecurityError("Access denied")
     ):
         with pytest.raises(SupersetSyntaxErrorException) as exc_info:
             processor.process_template(template)
@@ -1624,11 +1624,11 @@ def test_jinja2_server_error_handling(mocker: MockerFixture) -> None:
     from superset.jinja_context import BaseTemplateProcessor
 
     processor = BaseTemplateProcessor(database=database)
-    template = "SELECT * FROM table"
+    template = "SELECT * FROM {{ table }}"
 
-    # Mock the Environment.from_string to raise MemoryError (server error)
+    # Mock the template compilation to raise MemoryError (server error)
     with patch.object(
-        processor.env, "from_string", side_effect=MemoryError("Out of memory")
+        processor, "get_template", side_effect=MemoryError("Out of memory")
     ):
         with pytest.raises(SupersetTemplateException) as exc_info:
             processor.process_template(template)
@@ -1693,3 +1693,78 @@ def test_undefined_template_variable_not_function(mocker: MockerFixture) -> None
     template = "SELECT {{ undefined_variable.some_method() }}"
     with pytest.raises(UndefinedError):
         processor.process_template(template)
+
+
+def test_process_template_compiled_template_cache(mocker: MockerFixture) -> None:
+    """
+    Test that templates are compiled once per processor class and dialect.
+    """
+    from superset.jinja_context import BaseTemplateProcessor
+
+    BaseTemplateProcessor._compiled_templates.clear()
+    mysql_database = mocker.MagicMock()
+    mysql_database.get_dialect.return_value = mysql.dialect()
+    sqlite_database = mocker.MagicMock()
+    sqlite_database.get_dialect.return_value = sqlite.dialect()
+    template = "SELECT * FROM t WHERE a IN {{ ['a\\\\b'] | where_in }}"
+
+    compile_ = mocker.spy(SandboxedEnvironment, "compile")
+    for _ in range(2):
+        mysql_processor = BaseTemplateProcessor(database=mysql_database)
+        assert mysql_processor.process_template(template) == (
+            "SELECT * FROM t WHERE a IN ('a\\\\b')"
+        )
+        sqlite_processor = BaseTemplateProcessor(database=sqlite_database)
+        assert sqlite_processor.process_template(template) == (
+            "SELECT * FROM t WHERE a IN ('a\\b')"
+        )
+
+    assert compile_.call_count == 2
+
+
+def test_process_template_compiled_template_cache_size(mocker: MockerFixture) -> None:
+    """
+    Test that the least recently used templates are evicted, or not cached at all.
+    """
+    from superset.jinja_context import BaseTemplateProcessor
+
+    BaseTemplateProcessor._compiled_templates.clear()
+    processor = BaseTemplateProcessor(database=mocker.MagicMock())
+
+    mocker.patch.dict(current_app.config, {"JINJA_TEMPLATE_CACHE_SIZE": 2})
+    for value in (1, 2, 1, 3):
+        assert processor.process_template(f"SELECT {{{{ {value} }}}}") == (
+            f"SELECT {value}"
+        )
+    assert [key[-1] for key in BaseTemplateProcessor._compiled_templates] == [
+        "SELECT {{ 1 }}",
+        "SELECT {{ 3 }}",
+    ]
+
+    mocker.patch.dict(current_app.config, {"JINJA_TEMPLATE_CACHE_SIZE": 0})
+    assert processor.process_template("SELECT {{ 4 }}") == "SELECT 4"
+    assert len(BaseTemplateProcessor._compiled_templates) == 2
+
+
+@pytest.mark.parametrize(
+    "sql",
+    [
+        "SELECT 1",
+        "SELECT 1\n",
+        "SELECT 1\n\n",
+        "SELECT\r\n  1\r",
+        "",
+    ],
+)
+def test_process_template_plain_sql(mocker: MockerFixture, sql: str) -> None:
+    """
+    Test that SQL without Jinja syntax is not rendered, with the same output.
+    """
+    from superset.jinja_context import BaseTemplateProcessor
+
+    processor = BaseTemplateProcessor(database=mocker.MagicMock())
+    expected = processor.env.from_string(sql).render()
+    get_template = mocker.patch.object(processor, "get_template")
+
+    assert processor.process_template(sql) == expected
+    get_template.assert_not_called()
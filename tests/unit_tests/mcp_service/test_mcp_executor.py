@@ -0,0 +1,96 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+
+"""Tests for the MCP executor of blocking tool work."""
+
+import asyncio
+import threading
+from unittest.mock import MagicMock, patch
+
+import pytest
+from flask import current_app, g
+
+from superset.mcp_service.executor import (
+    get_executor_config,
+    get_executor_stats,
+    run_blocking,
+)
+
+
+def test_get_executor_config_defaults(app):
+    """Missing keys fall back to the defaults."""
+    with patch.dict(app.config, {"MCP_EXECUTOR_CONFIG": {"max_workers": 2}}):
+        config = get_executor_config(app)
+
+    assert config["max_workers"] == 2
+    assert config["tool_concurrency_limits"]["execute_sql"] == 4
+
+
+@pytest.mark.asyncio
+async def test_run_blocking_app_context(app):
+    """Functions run in another thread, in an app context with the user."""
+    g.user = user = MagicMock()
+
+    def func(value):
+        return (
+            value,
+            threading.current_thread(),
+            current_app._get_current_object(),
+            g.user,
+        )
+
+    value, thread, func_app, func_user = await run_blocking("tool", func, 1)
+
+    assert value == 1
+    assert thread is not threading.current_thread()
+    assert func_app is app
+    assert func_user is user
+
+
+@pytest.mark.asyncio
+async def test_run_blocking_concurrency_limit(app):
+    """Calls over the concurrency limit of a tool are queued, and cancellable."""
+    config = {"max_workers": 4, "tool_concurrency_limits": {"limited": 1}}
+    started = threading.Event()
+    release = threading.Event()
+    calls = []
+
+    def func(value):
+        calls.append(value)
+        started.set()
+        release.wait(5)
+        return value
+
+    with patch.dict(app.config, {"MCP_EXECUTOR_CONFIG": config}):
+        first = asyncio.create_task(run_blocking("limited", func, 1))
+        second = asyncio.create_task(run_blocking("limited", func, 2))
+        third = asyncio.create_task(run_blocking("limited", func, 3))
+        await asyncio.to_thread(started.wait, 5)
+        await asyncio.sleep(0)
+
+        assert get_executor_stats()["limited"] == {"queued": 2, "running": 1}
+
+        # the client of the third call disconnected
+        third.cancel()
+        release.set()
+        assert await first == 1
+        assert await second == 2
+        with pytest.raises(asyncio.CancelledError):
+            await third
+
+    assert calls == [1, 2]
+    assert get_executor_stats()["limited"] == {"queued": 0, "running": 0}
@@ -1144,3 +1144,45 @@ def test_database_execute_async_without_options(mocker: MockerFixture) -> None:
     mock_executor_class.assert_called_once_with(database)
     mock_executor.execute_async.assert_called_once_with("SELECT 1", None)
     assert result == mock_handle
+
+
+def test_get_sqla_engine_registry(mocker: MockerFixture) -> None:
+    """
+    Test that `_get_sqla_engine` uses pooled engines from the registry when enabled.
+    """
+    from sqlalchemy.pool import QueuePool
+
+    from superset.extensions.engine_registry import EngineRegistry
+    from superset.models.core import Database
+
+    registry = EngineRegistry()
+    app = mocker.MagicMock()
+    app.config = {
+        "DB_ENGINE_REGISTRY_ENABLED": True,
+        "DB_ENGINE_REGISTRY_MAX_ENGINES": 10,
+        "DB_ENGINE_REGISTRY_POOL_PARAMS": {"pool_size": 2},
+    }
+    registry.init_app(app)
+    mocker.patch("superset.models.core.engine_registry", registry)
+    mocker.patch("superset.models.core.get_username", return_value="alice")
+    create_engine = mocker.patch("superset.models.core.create_engine")
+
+    database = Database(id=1, database_name="my_db", sqlalchemy_uri="trino://")
+    engine = database._get_sqla_engine()
+    assert database._get_sqla_engine() is engine
+
+    create_engine.assert_called_once_with(
+        make_url("trino:///"),
+        connect_args={"source": "Apache Superset"},
+        poolclass=QueuePool,
+        pool_size=2,
+    )
+
+    Database.dispose_engines(mocker.MagicMock(), mocker.MagicMock(), database)
+    assert database.get_engine_pool_stats() == []
+    engine.dispose.assert_called_once()
+
+    # transient databases, eg, when testing a connection, are never pooled
+    transient = Database(database_name="my_db", sqlalchemy_uri="trino://")
+    transient._get_sqla_engine()
+    assert create_engine.call_args.kwargs["poolclass"].__name__ == "NullPool"
@@ -20,9 +20,10 @@
 from __future__ import annotations
 
 from contextlib import contextmanager
-from typing import TYPE_CHECKING
+from typing import Any, TYPE_CHECKING
 from unittest.mock import patch
 
+import pandas as pd
 import pytest
 from pytest_mock import MockerFixture
 from sqlalchemy import create_engine
@@ -1703,3 +1704,418 @@ def test_adhoc_column_with_spaces_in_full_query(database: Database) -> None:
     # Verify SELECT and FROM clauses are present
     assert "SELECT" in sql
     assert "FROM" in sql
+
+
+def test_query_many(mocker: MockerFixture, database: Database) -> None:
+    """
+    Test that `query_many` compiles queries sequentially and executes them on a
+    thread pool, returning results in order.
+    """
+    import threading
+
+    from superset.connectors.sqla.models import SqlaTable, TableColumn
+    from superset.utils import json
+
+    database.extra = json.dumps({"query_concurrency": 2})
+    table = SqlaTable(
+        database=database,
+        schema=None,
+        table_name="t",
+        columns=[TableColumn(column_name="a"), TableColumn(column_name="b")],
+    )
+
+    threads: list[threading.Thread] = []
+
+    def execute_query_str(query_str_ext, qry_start_dttm):
+        threads.append(threading.current_thread())
+        return query_str_ext.sql
+
+    mocker.patch.object(table, "execute_query_str", side_effect=execute_query_str)
+
+    results = table.query_many(
+        [
+            {"columns": ["a"], "metrics": [], "filter": [], "is_timeseries": False},
+            {"columns": ["b"], "metrics": [], "filter": [], "is_timeseries": False},
+        ]
+    )
+
+    assert [result.split("\n")[0] for result in results] == [
+        "SELECT a AS a ",
+        "SELECT b AS b ",
+    ]
+    assert threading.main_thread() not in threads
+
+
+def test_query_many_column_order(mocker: MockerFixture, database: Database) -> None:
+    """
+    Test that queries executed concurrently return the same frames as queries
+    executed one by one, including the column order from extras.
+    """
+    from datetime import timedelta
+
+    from superset.connectors.sqla.models import SqlaTable, TableColumn
+    from superset.models.helpers import QueryResult
+    from superset.utils import json
+
+    database.extra = json.dumps({"query_concurrency": 2})
+    table = SqlaTable(
+        database=database,
+        schema=None,
+        table_name="t",
+        columns=[TableColumn(column_name="a"), TableColumn(column_name="b")],
+    )
+    mocker.patch.object(
+        table,
+        "execute_query_str",
+        side_effect=lambda query_str_ext, qry_start_dttm: QueryResult(
+            df=pd.DataFrame({"a": [1, 2], "b": ["Alice", "Bob"]}),
+            query=query_str_ext.sql,
+            duration=timedelta(seconds=1),
+        ),
+    )
+    query_objs = [
+        {
+            "columns": ["a", "b"],
+            "metrics": [],
+            "filter": [],
+            "is_timeseries": False,
+            "extras": {"column_order": ["b", "a"]},
+        },
+        {"columns": ["a", "b"], "metrics": [], "filter": [], "is_timeseries": False},
+    ]
+
+    concurrent = table.query_many(query_objs)
+    sequential = [table.query(query_obj) for query_obj in query_objs]
+
+    assert list(concurrent[0].df.columns) == ["b", "a"]
+    assert list(concurrent[1].df.columns) == ["a", "b"]
+    for concurrent_result, sequential_result in zip(
+        concurrent, sequential, strict=True
+    ):
+        pd.testing.assert_frame_equal(concurrent_result.df, sequential_result.df)
+
+
+def test_query_many_sequential(mocker: MockerFixture, database: Database) -> None:
+    """
+    Test that `query_many` falls back to `query` without concurrency.
+    """
+    from superset.connectors.sqla.models import SqlaTable
+
+    table = SqlaTable(database=database, schema=None, table_name="t")
+    query = mocker.patch.object(table, "query", side_effect=["first", "second"])
+    execute_concurrently = mocker.patch("superset.models.helpers.execute_concurrently")
+
+    assert table.query_many([{"columns": ["a"]}, {"columns": ["b"]}]) == [
+        "first",
+        "second",
+    ]
+    assert query.call_count == 2
+    execute_concurrently.assert_not_called()
+
+
+def test_get_query_result_with_query_result(
+    mocker: MockerFixture,
+    database: Database,
+) -> None:
+    """
+    Test that the result of a base query that already ran is processed without
+    running the query again.
+    """
+    from datetime import timedelta
+
+    from superset.common.query_object import QueryObject
+    from superset.connectors.sqla.models import SqlaTable
+    from superset.models.helpers import QueryResult
+
+    table = SqlaTable(database=database, schema=None, table_name="t")
+    query = mocker.patch.object(table, "query")
+    query_object = QueryObject(
+        columns=["a"],
+        post_processing=[{"operation": "sort", "options": {"by": "a"}}],
+    )
+    query_result = QueryResult(
+        df=pd.DataFrame({"a": [2, 1]}),
+        query="SELECT a",
+        duration=timedelta(seconds=1),
+    )
+
+    result = table.get_query_result(query_object, query_result=query_result)
+
+    query.assert_not_called()
+    assert result.df["a"].tolist() == [1, 2]
+    assert result.query == "SELECT a;\n\n"
+
+
+def test_query_raw_results_cache(mocker: MockerFixture, database: Database) -> None:
+    """
+    Test that the raw result of a query is cached on the compiled SQL, and that it's
+    bypassed when forcing the query.
+    """
+    from flask import current_app
+    from flask_caching import Cache
+
+    from superset.connectors.sqla.models import SqlaTable, TableColumn
+    from superset.constants import CacheRegion
+
+    mocker.patch.dict(current_app.config, {"DATA_CACHE_RAW_RESULTS_TIMEOUT": 60})
+    mocker.patch.dict(
+        "superset.common.utils.query_cache_manager._cache",
+        {CacheRegion.DATA: Cache(current_app, config={"CACHE_TYPE": "SimpleCache"})},
+    )
+    table = SqlaTable(
+        database=database,
+        schema=None,
+        table_name="t",
+        columns=[TableColumn(column_name="a"), TableColumn(column_name="b")],
+    )
+    execute_query_str = mocker.spy(table, "execute_query_str")
+    query_obj = {
+        "columns": ["a", "b"],
+        "metrics": [],
+        "filter": [],
+        "is_timeseries": False,
+    }
+
+    result = table.query(query_obj)
+    assert list(result.df.columns) == ["a", "b"]
+    assert sorted(result.df["b"]) == ["Alice", "Bob"]
+
+    # the column order is applied to the result, so the SQL is the same
+    result = table.query({**query_obj, "extras": {"column_order": ["b", "a"]}})
+    assert list(result.df.columns) == ["b", "a"]
+    assert sorted(result.df["b"]) == ["Alice", "Bob"]
+    assert execute_query_str.call_count == 1
+
+    table.query({**query_obj, "columns": ["a"]})
+    assert execute_query_str.call_count == 2
+
+    table.query(query_obj, force=True)
+    assert execute_query_str.call_count == 3
+
+
+def test_get_time_offset_cache_timeout(mocker: MockerFixture) -> None:
+    """
+    Test that time offsets that lie fully in the past are cached longer.
+    """
+    from datetime import datetime, timedelta
+
+    from flask import current_app
+
+    from superset.common.query_object import QueryObject
+    from superset.constants import CACHE_DISABLED_TIMEOUT
+    from superset.models.helpers import ExploreMixin
+
+    mocker.patch.dict(current_app.config, {"TIME_OFFSET_PAST_CACHE_TIMEOUT": 3600})
+    past = QueryObject(
+        from_dttm=datetime(2020, 1, 1),
+        to_dttm=datetime(2020, 2, 1),
+    )
+    current = QueryObject(
+        from_dttm=datetime.now() - timedelta(days=7),
+        to_dttm=datetime.now() + timedelta(days=1),
+    )
+
+    assert ExploreMixin.get_time_offset_cache_timeout(past, 60) == 3600
+    assert ExploreMixin.get_time_offset_cache_timeout(past, 7200) == 7200
+    assert ExploreMixin.get_time_offset_cache_timeout(past, 0) == 0
+    assert (
+        ExploreMixin.get_time_offset_cache_timeout(past, CACHE_DISABLED_TIMEOUT)
+        == CACHE_DISABLED_TIMEOUT
+    )
+    assert ExploreMixin.get_time_offset_cache_timeout(current, 60) == 60
+
+    mocker.patch.dict(current_app.config, {"TIME_OFFSET_PAST_CACHE_TIMEOUT": 0})
+    assert ExploreMixin.get_time_offset_cache_timeout(past, 60) == 60
+
+
+def test_get_query_result_window_cumulative_sum(
+    mocker: MockerFixture,
+    database: Database,
+) -> None:
+    """
+    Test that a cumulative sum after a pivot is computed with a window function,
+    with the same result as in pandas.
+    """
+    from flask import current_app
+
+    from superset.common.query_object import QueryObject
+    from superset.connectors.sqla.models import SqlaTable, SqlMetric, TableColumn
+
+    with database.get_sqla_engine() as engine:
+        connection = engine.raw_connection()
+        connection.execute("CREATE TABLE sales (ds TEXT, country TEXT, amount INT)")
+        connection.executemany(
+            "INSERT INTO sales VALUES (?, ?, ?)",
+            [
+                ("2024-01-01", "FR", 1),
+                ("2024-01-01", "US", 10),
+                ("2024-01-02", "US", 20),
+                ("2024-01-03", "FR", None),
+                ("2024-01-03", None, 5),
+                ("2024-01-04", "FR", 3),
+                ("2024-01-04", "US", 30),
+                (None, "FR", 100),
+            ],
+        )
+        connection.commit()
+
+    table = SqlaTable(
+        database=database,
+        schema=None,
+        table_name="sales",
+        columns=[
+            TableColumn(column_name="ds", is_dttm=True),
+            TableColumn(column_name="country"),
+            TableColumn(column_name="amount"),
+        ],
+        metrics=[SqlMetric(metric_name="total", expression="SUM(amount)")],
+    )
+
+    def get_query_result(drop_missing_columns: bool) -> tuple[str, pd.DataFrame]:
+        query_object = QueryObject(
+            datasource=table,
+            columns=[
+                {
+                    "columnType": "BASE_AXIS",
+                    "label": "ds",
+                    "sqlExpression": "ds",
+                },
+                "country",
+            ],
+            metrics=["total"],
+            is_timeseries=False,
+            post_processing=[
+                {
+                    "operation": "pivot",
+                    "options": {
+                        "index": ["ds"],
+                        "columns": ["country"],
+                        "aggregates": {"total": {"operator": "sum"}},
+                        "drop_missing_columns": drop_missing_columns,
+                    },
+                },
+                {
+                    "operation": "cum",
+                    "options": {"operator": "sum", "columns": {"total": "total"}},
+                },
+                {"operation": "flatten"},
+            ],
+        )
+        result = table.get_query_result(query_object)
+        return result.query, result.df
+
+    for drop_missing_columns in (True, False):
+        mocker.patch.dict(current_app.config, {"POST_PROCESSING_PUSHDOWN": False})
+        query, expected = get_query_result(drop_missing_columns)
+        assert "OVER" not in query
+
+        mocker.patch.dict(current_app.config, {"POST_PROCESSING_PUSHDOWN": True})
+        query, df = get_query_result(drop_missing_columns)
+        assert "OVER (PARTITION BY" in query
+        pd.testing.assert_frame_equal(df, expected)
+
+
+def test_get_window_cumulative_sum(mocker: MockerFixture, database: Database) -> None:
+    """
+    Test the cases where a cumulative sum can't be computed with a window function.
+    """
+    from flask import current_app
+
+    from superset.common.query_object import QueryObject
+    from superset.connectors.sqla.models import SqlaTable, TableColumn
+
+    mocker.patch.dict(current_app.config, {"POST_PROCESSING_PUSHDOWN": True})
+    table = SqlaTable(
+        database=database,
+        schema=None,
+        table_name="t",
+        columns=[
+            TableColumn(column_name="ds", is_dttm=True),
+            TableColumn(column_name="b"),
+        ],
+    )
+    x_axis = {"columnType": "BASE_AXIS", "label": "ds", "sqlExpression": "ds"}
+    pivot = {
+        "operation": "pivot",
+        "options": {
+            "index": ["ds"],
+            "columns": ["b"],
+            "aggregates": {"count": {"operator": "mean"}},
+            "drop_missing_columns": False,
+        },
+    }
+    cum = {
+        "operation": "cum",
+        "options": {"operator": "sum", "columns": {"count": "count"}},
+    }
+
+    def get_window_cumulative_sum(**kwargs: Any) -> Any:
+        query_object = QueryObject(
+            **{
+                "datasource": table,
+                "columns": [x_axis, "b"],
+                "metrics": ["count"],
+                "is_timeseries": False,
+                "post_processing": [pivot, cum],
+                **kwargs,
+            }
+        )
+        return table.get_window_cumulative_sum(query_object)
+
+    window_cumulative_sum, post_processing = get_window_cumulative_sum()
+    assert window_cumulative_sum == {
+        "index": "ds",
+        "partition_by": ["b"],
+        "metrics": ["count"],
+    }
+    assert post_processing[1]["options"]["accumulated"] is True
+
+    # pivoting on a subset of the columns aggregates several rows in a cell
+    assert get_window_cumulative_sum(columns=[x_axis, "b", "a"]) is None
+    # only sums are accumulated with window functions
+    assert (
+        get_window_cumulative_sum(
+            post_processing=[
+                pivot,
+                {**cum, "options": {**cum["options"], "operator": "max"}},
+            ]
+        )
+        is None
+    )
+    # the cum operation must directly follow the pivot
+    assert get_window_cumulative_sum(post_processing=[cum]) is None
+    assert get_window_cumulative_sum(time_offsets=["1 year ago"]) is None
+    # missing cells are NaN with a mean, and pandas drops them
+    assert (
+        get_window_cumulative_sum(
+            post_processing=[
+                {
+                    **pivot,
+                    "options": {**pivot["options"], "drop_missing_columns": True},
+                },
+                cum,
+            ]
+        )
+        is None
+    )
+    # the index must be a temporal column
+    assert (
+        get_window_cumulative_sum(
+            columns=[{**x_axis, "label": "b", "sqlExpression": "b"}, "ds"],
+            post_processing=[
+                {
+                    **pivot,
+                    "options": {**pivot["options"], "index": ["b"], "columns": ["ds"]},
+                },
+                cum,
+            ],
+        )
+        is None
+    )
+
+    mocker.patch.object(table.db_engine_spec, "allows_window_functions", False)
+    assert get_window_cumulative_sum() is None
+
+    mocker.patch.dict(current_app.config, {"POST_PROCESSING_PUSHDOWN": False})
+    mocker.patch.object(table.db_engine_spec, "allows_window_functions", True)
+    assert get_window_cumulative_sum() is None
@@ -22,6 +22,7 @@ import pytest
 from parameterized import parameterized
 
 from superset.models.slice import id_or_uuid_filter, Slice
+from superset.utils import json
 
 
 class TestSlice:
@@ -85,3 +86,46 @@ class TestSlice:
         """Test id_or_uuid_filter returns correct BinaryExpression."""
         result = id_or_uuid_filter(input_value)
         assert result is not None
+
+
+def test_get_query_context_column_names() -> None:
+    """
+    Test that the column names are read from the saved query context.
+    """
+    query_context = {
+        "datasource": {"id": 1, "type": "table"},
+        "form_data": {
+            "x_axis": "ds",
+            "tooltip_contents": [
+                "gender",
+                {"item_type": "column", "column_name": "state"},
+                {"item_type": "metric", "metric_name": "count"},
+            ],
+        },
+        "queries": [
+            {
+                "columns": ["ds", {"label": "upper_name", "sqlExpression": "name"}],
+                "granularity": "created_on",
+            },
+            {"groupby": ["region"]},
+        ],
+    }
+    slc = Slice(datasource_id=1, query_context=json.dumps(query_context))
+    assert slc.get_query_context_column_names() == {
+        "ds",
+        "upper_name",
+        "created_on",
+        "gender",
+        "state",
+        "region",
+    }
+
+    # the query context of another datasource is ignored
+    slc = Slice(datasource_id=2, query_context=json.dumps(query_context))
+    assert slc.get_query_context_column_names() is None
+
+    assert Slice(datasource_id=1).get_query_context_column_names() is None
+    assert (
+        Slice(datasource_id=1, query_context="{").get_query_context_column_names()
+        is None
+    )
@@ -181,3 +181,21 @@ def test_escape_column_name():
         "level1\\,value2" + FLAT_COLUMN_SEPARATOR + "level2\\, value2",
         "level1\\,value3" + FLAT_COLUMN_SEPARATOR + "level2\\, value3",
     ]
+
+
+def test_flat_inplace():
+    index = pd.to_datetime(["2021-01-01", "2021-01-02", "2021-01-03"])
+    index.name = "__timestamp"
+    df = pd.DataFrame(index=index, data={"foo": [1, 2, 3], "bar": [4, 5, 6]})
+
+    flat_df = pp.flatten(df, inplace=True)
+    assert flat_df is df
+    assert df.equals(
+        pd.DataFrame(
+            {
+                "__timestamp": index,
+                "foo": [1, 2, 3],
+                "bar": [4, 5, 6],
+            }
+        )
+    )
@@ -185,3 +185,69 @@ def test_get_column_description_from_empty_data_using_cursor_description(
     )
     assert any(col.get("column_name") == "__time" for col in result_set.columns)
     logger.exception.assert_not_called()
+
+
+def test_only_failing_columns_are_stringified() -> None:
+    """
+    Test that the stringification fallback is only applied to failing columns.
+    """
+    import pyarrow as pa
+
+    data = [
+        (1, [1, 2], {"a": 1}, "x"),
+        (2, [3], {"a": "b"}, None),
+    ]
+    description = [
+        ("id", None, None, None, None, None, True),
+        ("nested_list", None, None, None, None, None, True),
+        ("mixed_dict", None, None, None, None, None, True),
+        ("name", None, None, None, None, None, True),
+    ]
+    result_set = SupersetResultSet(data, description, BaseEngineSpec)  # type: ignore
+
+    assert result_set.table.schema.types == [
+        pa.int64(),
+        pa.string(),
+        pa.string(),
+        pa.string(),
+    ]
+    assert result_set.to_pandas_df().to_dict(orient="list") == {
+        "id": [1, 2],
+        "nested_list": ["[1, 2]", "[3]"],
+        "mixed_dict": ["{'a': 1}", "{'a': 'b'}"],
+        "name": ["x", None],
+    }
+
+
+def test_rows_with_wrong_length() -> None:
+    """
+    Test that rows that don't match the cursor description are rejected.
+    """
+    import pytest
+
+    description = [
+        ("a", None, None, None, None, None, True),
+        ("b", None, None, None, None, None, True),
+    ]
+    with pytest.raises(ValueError, match="Expected 2 values per row"):
+        SupersetResultSet([(1, 2), (3,)], description, BaseEngineSpec)  # type: ignore
+
+
+def test_arrow_table() -> None:
+    """
+    Test that drivers can pass results as an Arrow table.
+    """
+    import pyarrow as pa
+
+    table = pa.table({"a": [1, 2], "a__dup": [[1], [2, 3]]})
+    description = [
+        ("a", None, None, None, None, None, True),
+        ("a", None, None, None, None, None, True),
+    ]
+    result_set = SupersetResultSet(table, description, BaseEngineSpec)  # type: ignore
+
+    assert result_set.table.column_names == ["a", "a__1"]
+    assert result_set.to_pandas_df().to_dict(orient="list") == {
+        "a": [1, 2],
+        "a__1": ["[1]", "[2, 3]"],
+    }
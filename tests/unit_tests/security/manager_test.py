@@ -30,6 +30,7 @@ from superset.extensions import appbuilder
 from superset.models.slice import Slice
 from superset.security.manager import (
     query_context_modified,
+    RLSFilter,
     SupersetSecurityManager,
 )
 from superset.sql.parse import Table
@@ -1186,3 +1187,65 @@ def test_get_catalogs_accessible_by_user_schema_access(
     catalogs = {"catalog1", "catalog2"}
 
     assert sm.get_catalogs_accessible_by_user(database, catalogs) == {"catalog2"}
+
+
+def test_get_rls_filters_request_cache(
+    mocker: MockerFixture,
+    app_context: None,
+) -> None:
+    """
+    Test that RLS filters are resolved once per request, roles and table.
+    """
+    from flask import g
+
+    sm = SupersetSecurityManager(appbuilder)
+    mocker.patch.object(
+        sm, "get_user_roles", return_value=[mocker.MagicMock(id=2), Role(id=1)]
+    )
+    query_rls_filters = mocker.patch.object(
+        sm,
+        "_query_rls_filters",
+        return_value=[RLSFilter(2, None, "b = 1"), RLSFilter(1, "a", "a = 1")],
+    )
+    table = mocker.MagicMock(data={"id": 42})
+    g.pop("rls_filters_cache", None)
+
+    with override_user(User(id=1)):
+        assert [f.id for f in sm.get_rls_sorted(table)] == [1, 2]
+        assert [f.id for f in sm.get_rls_filters(table)] == [2, 1]
+        query_rls_filters.assert_called_once_with([1, 2], 42)
+
+        sm.invalidate_rls_filters_cache()
+        sm.get_rls_filters(table)
+        assert query_rls_filters.call_count == 2
+
+
+def test_get_rls_filters_cache(
+    mocker: MockerFixture,
+    app_context: None,
+) -> None:
+    """
+    Test that RLS filters are cached across requests and invalidated on changes.
+    """
+    from flask import g
+    from flask_caching.backends import SimpleCache
+
+    sm = SupersetSecurityManager(appbuilder)
+    mocker.patch.dict("flask.current_app.config", {"RLS_FILTERS_CACHE_TIMEOUT": 60})
+    mocker.patch("superset.extensions.cache_manager._cache", SimpleCache(), create=True)
+    mocker.patch.object(sm, "get_user_roles", return_value=[Role(id=1)])
+    query_rls_filters = mocker.patch.object(
+        sm, "_query_rls_filters", return_value=[RLSFilter(1, "a", "a = 1")]
+    )
+    table = mocker.MagicMock(data={"id": 42})
+
+    with override_user(User(id=1)):
+        for _ in range(2):
+            # simulate a new request
+            g.pop("rls_filters_cache", None)
+            assert sm.get_rls_filters(table) == [RLSFilter(1, "a", "a = 1")]
+        query_rls_filters.assert_called_once()
+
+        sm.invalidate_rls_filters_cache()
+        assert sm.get_rls_filters(table) == [RLSFilter(1, "a", "a = 1")]
+        assert query_rls_filters.call_count == 2
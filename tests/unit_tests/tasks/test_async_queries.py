@@ -149,3 +149,77 @@ def test_load_chart_data_into_cache_with_superset_errors_exception(
     assert errors[1]["message"] == "Table not found"
     assert errors[1]["error_type"] == SupersetErrorType.TABLE_DOES_NOT_EXIST_ERROR
     assert errors[1]["level"] == ErrorLevel.WARNING
+
+
+@mock.patch("superset.tasks.async_queries.security_manager")
+@mock.patch("superset.tasks.async_queries.async_query_manager")
+@mock.patch("superset.tasks.async_queries.ChartDataQueryContextSchema")
+@mock.patch("superset.commands.chart.data.get_data_command.ChartDataCommand")
+def test_load_chart_data_into_cache_refresh_stale(
+    mock_command_cls,
+    mock_query_context_schema_cls,
+    mock_async_query_manager,
+    mock_security_manager,
+):
+    """Test that refreshing stale results doesn't notify a client"""
+    from superset.tasks.async_queries import load_chart_data_into_cache
+
+    job_metadata = {"user_id": 1, "refresh_stale": True, "refresh_stale_key": "key"}
+    with mock.patch("superset.tasks.async_queries.cache_manager") as cache_manager:
+        load_chart_data_into_cache(job_metadata, {})
+
+    mock_command_cls.return_value.run.assert_called_once_with(cache=True)
+    mock_async_query_manager.update_job.assert_not_called()
+    cache_manager.data_cache.delete.assert_called_once_with("key")
+
+
+@mock.patch("superset.tasks.async_queries.security_manager")
+@mock.patch("superset.tasks.async_queries.async_query_manager")
+@mock.patch("superset.tasks.async_queries.ChartDataQueryContextSchema")
+@mock.patch("superset.commands.chart.data.get_data_command.ChartDataCommand")
+def test_load_chart_data_into_cache_refresh_stale_error(
+    mock_command_cls,
+    mock_query_context_schema_cls,
+    mock_async_query_manager,
+    mock_security_manager,
+):
+    """Test that a failed refresh of stale results can be retried right away"""
+    from superset.tasks.async_queries import load_chart_data_into_cache
+
+    job_metadata = {"user_id": 1, "refresh_stale": True, "refresh_stale_key": "key"}
+    mock_command_cls.return_value.run.side_effect = Exception("Error")
+    with (
+        mock.patch("superset.tasks.async_queries.cache_manager") as cache_manager,
+        pytest.raises(Exception, match="Error"),
+    ):
+        load_chart_data_into_cache(job_metadata, {})
+
+    mock_async_query_manager.update_job.assert_not_called()
+    cache_manager.data_cache.delete.assert_called_once_with("key")
+
+
+@mock.patch("superset.tasks.async_queries.security_manager")
+@mock.patch("superset.tasks.async_queries.async_query_manager")
+@mock.patch("superset.tasks.async_queries.ChartDataQueryContextSchema")
+@mock.patch("superset.commands.chart.data.get_data_command.ChartDataCommand")
+def test_load_chart_data_into_cache_coalesced(
+    mock_command_cls,
+    mock_query_context_schema_cls,
+    mock_async_query_manager,
+    mock_security_manager,
+):
+    """Test that the jobs that joined the task are notified of its completion"""
+    from superset.tasks.async_queries import load_chart_data_into_cache
+
+    job_metadata = {"user_id": 1, "channel_id": "channel", "job_id": "job"}
+    mock_async_query_manager.STATUS_DONE = "done"
+    mock_command_cls.return_value.run.return_value = {"cache_key": "qc-key"}
+
+    load_chart_data_into_cache(job_metadata, {}, coalesce_key="key")
+
+    mock_async_query_manager.update_job.assert_called_once_with(
+        job_metadata, "done", result_url="/api/v1/chart/data/qc-key"
+    )
+    mock_async_query_manager.update_coalesced_jobs.assert_called_once_with(
+        "key", "done", result_url="/api/v1/chart/data/qc-key"
+    )
@@ -0,0 +1,126 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+from decimal import Decimal
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+import pytest
+
+from superset.utils import arrow
+
+
+def test_df_to_arrow_table() -> None:
+    """
+    Test that column names and mixed object columns are cast to strings.
+    """
+    df = pd.DataFrame({"a": [1, 2, None], "b": ["x", 1, None], 0: [[1], [2], None]})
+
+    table = arrow.df_to_arrow_table(df)
+
+    assert table.column_names == ["a", "b", "0"]
+    assert table.schema.field("b").type == pa.string()
+    assert table.column("b").to_pylist() == ["x", "1", None]
+    assert table.column("0").to_pylist() == [[1], [2], None]
+
+
+def test_df_to_parquet() -> None:
+    """
+    Test a Parquet round trip.
+    """
+    df = pd.DataFrame({"a": [1, 2], "b": ["x", "y"]}, index=["i", "j"])
+
+    data = arrow.df_to_parquet(df, index=True, compression="zstd")
+
+    pd.testing.assert_frame_equal(pq.read_table(pa.BufferReader(data)).to_pandas(), df)
+
+
+def test_df_to_arrow_ipc() -> None:
+    """
+    Test an Arrow IPC stream round trip.
+    """
+    df = pd.DataFrame({"a": [1, 2], "b": ["x", "y"]})
+
+    data = arrow.df_to_arrow_ipc(df, compression="lz4")
+
+    pd.testing.assert_frame_equal(pa.ipc.open_stream(data).read_all().to_pandas(), df)
+
+
+def test_stream_rows_parquet() -> None:
+    """
+    Test that every batch is written as a row group, and drained as it's written.
+    """
+    batches = [[(1, None), (2, None)], [(3, "c")], [(4, 5)]]
+
+    chunks = list(arrow.stream_rows(["a", "b"], iter(batches), "parquet"))
+
+    assert len(chunks) > len(batches)
+    parquet_file = pq.ParquetFile(pa.BufferReader(b"".join(chunks)))
+    assert parquet_file.num_row_groups == 3
+    assert parquet_file.read().to_pydict() == {
+        "a": [1, 2, 3, 4],
+        "b": [None, None, "c", "5"],
+    }
+
+
+@pytest.mark.parametrize("result_format", ["parquet", "arrow"])
+def test_stream_rows_type_drift(result_format: str) -> None:
+    """
+    Test that later batches with values of another type than the first one are
+    still written, eg, decimals with a larger scale or integers followed by fractions.
+    """
+    batches = [
+        [(Decimal("1.5"), 1, None, True)],
+        [(Decimal("1.25"), 2, [1], None)],
+        [(Decimal("12345678901234567890.125"), 1.5, "x", False)],
+    ]
+
+    data = b"".join(arrow.stream_rows(["a", "b", "c", "d"], batches, result_format))
+
+    table = (
+        pq.read_table(pa.BufferReader(data))
+        if result_format == "parquet"
+        else pa.ipc.open_stream(data).read_all()
+    )
+    assert table.schema.types == [pa.float64(), pa.float64(), pa.string(), pa.bool_()]
+    assert table.to_pydict() == {
+        "a": [1.5, 1.25, 12345678901234567890.125],
+        "b": [1.0, 2.0, 1.5],
+        "c": [None, "[1]", "x"],
+        "d": [True, None, False],
+    }
+
+
+def test_stream_rows_arrow_type_mismatch() -> None:
+    """
+    Test that numeric columns with strings in later batches fail.
+    """
+    batches = [[(1,)], [("x",)]]
+
+    with pytest.raises(pa.ArrowInvalid):
+        list(arrow.stream_rows(["a"], batches, "arrow"))
+
+
+def test_stream_rows_empty() -> None:
+    """
+    Test that an empty result still has all the columns.
+    """
+    data = b"".join(arrow.stream_rows(["a", "b"], [], "arrow"))
+
+    table = pa.ipc.open_stream(data).read_all()
+    assert table.num_rows == 0
+    assert table.column_names == ["a", "b"]
@@ -0,0 +1,115 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+
+import threading
+import time
+from functools import partial
+
+import pytest
+from flask import current_app, Flask, g, has_app_context
+
+from superset.utils.concurrency import execute_concurrently, with_app_context
+
+
+def test_execute_concurrently_preserves_order() -> None:
+    """
+    Test that results are returned in the order of the tasks.
+    """
+
+    def task(value: int) -> int:
+        # the first tasks finish last
+        time.sleep((5 - value) * 0.01)
+        return value
+
+    tasks = [partial(task, value) for value in range(5)]
+    assert execute_concurrently(tasks, max_workers=5) == [0, 1, 2, 3, 4]
+
+
+def test_execute_concurrently_sequential() -> None:
+    """
+    Test that tasks run in the current thread when concurrency is disabled.
+    """
+    main_thread = threading.current_thread()
+    tasks = [threading.current_thread for _ in range(3)]
+    assert execute_concurrently(tasks, max_workers=1) == [main_thread] * 3
+
+
+def test_execute_concurrently_app_context() -> None:
+    """
+    Test that tasks run in worker threads with the app context and a copy of `g`.
+    """
+    g.user = "alice"
+
+    def task() -> tuple[str, str, bool]:
+        return (
+            g.user,
+            current_app.name,
+            threading.current_thread() is threading.main_thread(),
+        )
+
+    results = execute_concurrently([task, task], max_workers=2)
+    assert results == [("alice", current_app.name, False)] * 2
+
+
+def test_execute_concurrently_exception() -> None:
+    """
+    Test that the exception of a failing task is raised.
+    """
+
+    def fail() -> None:
+        raise ValueError("boom")
+
+    with pytest.raises(ValueError, match="boom"):
+        execute_concurrently([lambda: 1, fail], max_workers=2)
+
+
+def test_execute_concurrently_nested() -> None:
+    """
+    Test that nested calls from a worker thread run sequentially in that thread.
+    """
+
+    def task() -> list[threading.Thread]:
+        return execute_concurrently([threading.current_thread] * 2, max_workers=2)
+
+    for threads in execute_concurrently([task, task], max_workers=2):
+        assert threads[0] is threads[1]
+        assert threads[0] is not threading.main_thread()
+
+
+def test_with_app_context_explicit_app() -> None:
+    """
+    Test that outside of an app context tasks run in a context of the given app.
+    """
+    flask_app = current_app._get_current_object()
+    results: list[tuple[bool, bool, Flask]] = []
+
+    def task() -> Flask:
+        return current_app._get_current_object()
+
+    def run() -> None:
+        results.append(
+            (
+                has_app_context(),
+                with_app_context(task) is task,
+                with_app_context(task, flask_app)(),
+            )
+        )
+
+    thread = threading.Thread(target=run)
+    thread.start()
+    thread.join()
+    assert results == [(False, True, flask_app)]
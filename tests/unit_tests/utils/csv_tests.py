@@ -182,6 +182,33 @@ def test_df_to_escaped_csv():
     assert df_to_escaped_csv(df, encoding="utf8", index=False) == '0\n1\n""\n'
 
 
+def test_df_to_escaped_csv_index_and_duplicate_columns():
+    """
+    Test escaping values of a dataframe with a non-range index and duplicate
+    column names, without modifying the dataframe.
+    """
+    df = pd.DataFrame(
+        [["=a", 1, "b"], ["c", 2, "+d|e"]],
+        columns=["=x", "y", "=x"],
+        index=[10, 20],
+    )
+    original = df.copy()
+
+    assert df_to_escaped_csv(df) == (",'=x,y,'=x\n10,'=a,1,b\n20,c,2,'+d\\\\|e\n")
+    pd.testing.assert_frame_equal(df, original)
+
+
+def test_escape_rows():
+    """
+    Test escaping a chunk of rows, leaving other values untouched.
+    """
+    assert csv.escape_rows([]) == []
+    assert csv.escape_rows([(1, "=a|b", None), (2, "-3.5", "@c")]) == [
+        (1, "'=a\\|b", None),
+        (2, "-3.5", "'@c"),
+    ]
+
+
 def test_get_chart_dataframe_returns_none_when_no_content(
     monkeypatch: pytest.MonkeyPatch,
 ):